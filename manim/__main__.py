@@ -4,9 +4,12 @@ import platform
 import subprocess as sp
 import sys
 import re
+import time
+import logging
 import traceback
 import importlib.util
 import types
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from .config import file_writer_config, args
 from .utils import cfg_subcmds
@@ -143,6 +146,120 @@ def get_module(file_name):
             raise FileNotFoundError(f"{file_name} not found")
 
 
+class _SceneNameFilter(logging.Filter):
+    """Prefix every log record emitted by a worker process with the name
+    of the scene it renders, so that interleaved logs stay readable."""
+
+    def __init__(self, scene_name):
+        super().__init__()
+        self.scene_name = scene_name
+
+    def filter(self, record):
+        record.msg = f"[{self.scene_name}] {record.msg}"
+        return True
+
+
+def render_scene_in_worker(input_file, scene_name, fw_config):
+    """Render a single scene class inside a worker process.
+
+    The module is imported again by the worker, so that scene classes never
+    have to be pickled.  The worker gets its own copy of the file writer
+    config, and its own log stream.
+
+    Parameters
+    ----------
+    input_file : :class:`str`
+        Path to the file holding the scene.
+    scene_name : :class:`str`
+        Name of the Scene class to render.
+    fw_config : :class:`dict`
+        The file writer config of the parent process.
+
+    Returns
+    -------
+    Tuple[:class:`str`, Optional[:class:`str`], :class:`float`]
+        The name of the scene, the formatted traceback if rendering failed
+        (None otherwise) and the time taken to render, in seconds.
+    """
+    file_writer_config.update(fw_config)
+    # Progress bars of concurrent workers would garble each other
+    file_writer_config["progress_bar"] = False
+    # Forget what the parent already recorded, so that --log_to_file only
+    # writes the logs of this scene.
+    console.export_text(clear=True)
+    # Workers are reused for several scenes, so the filter must not outlive
+    # this one.
+    scene_name_filter = _SceneNameFilter(scene_name)
+    logger.addFilter(scene_name_filter)
+    start = time.time()
+    try:
+        module = get_module(input_file)
+        scene = getattr(module, scene_name)()
+        open_file_if_needed(scene.file_writer)
+    except Exception:
+        return scene_name, traceback.format_exc(), time.time() - start
+    finally:
+        logger.removeFilter(scene_name_filter)
+    return scene_name, None, time.time() - start
+
+
+def render_scenes_in_parallel(scene_classes, jobs):
+    """Render several scene classes at the same time, each one in its
+    own worker process.
+
+    Parameters
+    ----------
+    scene_classes : List[Type[:class:`~.Scene`]]
+        The scene classes to render.
+    jobs : :class:`int`
+        The maximum number of worker processes.
+
+    Returns
+    -------
+    List[:class:`str`]
+        The names of the scenes that failed to render.
+    """
+    start = time.time()
+    failed = []
+    fw_config = dict(file_writer_config)
+    logger.info(f"Rendering {len(scene_classes)} scenes with {jobs} jobs")
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(
+                render_scene_in_worker,
+                file_writer_config["input_file"],
+                SceneClass.__name__,
+                fw_config,
+            )
+            for SceneClass in scene_classes
+        ]
+        for future in as_completed(futures):
+            try:
+                scene_name, error, duration = future.result()
+            except Exception:
+                # The worker itself died, e.g. it was killed by the OS
+                failed.append("<worker>")
+                print("\n\n")
+                traceback.print_exc()
+                print("\n\n")
+                continue
+            if error is None:
+                logger.info(f"Rendered {scene_name} in {duration:.2f}s")
+            else:
+                failed.append(scene_name)
+                logger.error(f"Failed to render {scene_name} after {duration:.2f}s")
+                print("\n\n")
+                print(error)
+                print("\n\n")
+    logger.info(
+        f"Rendered {len(scene_classes) - len(failed)} of {len(scene_classes)} scenes "
+        f"in {time.time() - start:.2f}s"
+    )
+    if failed:
+        logger.error(f"Failed scenes: {', '.join(failed)}")
+    return failed
+
+
 def main():
     if hasattr(args, "subcommands"):
         if "cfg" in args.subcommands:
@@ -162,6 +279,22 @@ def main():
         all_scene_classes = get_scene_classes_from_module(module)
         scene_classes_to_render = get_scenes_to_render(all_scene_classes)
         sound_on = file_writer_config["sound"]
+        jobs = file_writer_config["jobs"]
+        if jobs > 1 and len(scene_classes_to_render) > 1:
+            if file_writer_config["input_file"] == "-":
+                # Workers import the module again, which is not possible
+                # for code read from stdin
+                logger.warning(
+                    "Scenes typed in the terminal cannot be rendered in parallel. "
+                    "Rendering them one after the other..."
+                )
+            else:
+                failed = render_scenes_in_parallel(scene_classes_to_render, jobs)
+                if sound_on and failed:
+                    play_error_sound()
+                elif sound_on:
+                    play_finish_sound()
+                return
         for SceneClass in scene_classes_to_render:
             try:
                 # By invoking, this renders the full scene
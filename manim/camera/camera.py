@@ -13,6 +13,7 @@ from ..constants import *
 from ..config import config, camera_config
 from ..logger import logger
 from ..mobject.types.image_mobject import AbstractImageMobject
+from ..mobject.types.mesh_mobject import MeshMobject
 from ..mobject.mobject import Mobject
 from ..mobject.types.point_cloud_mobject import PMobject
 from ..mobject.types.vectorized_mobject import VMobject
@@ -80,6 +81,10 @@ class Camera(object):
         digest_config(self, kwargs, locals())
         self.rgb_max_val = np.iinfo(self.pixel_array_dtype).max
         self.pixel_array_to_cairo_context = {}
+        # Families of lists of mobjects, see extract_mobject_family_members
+        self.family_members_cache = {}
+        self.previous_family_members_cache = {}
+        self.family_members_cache_version = None
         self.init_background()
         self.resize_frame_shape()
         self.reset()
@@ -409,13 +414,33 @@ class Camera(object):
         list
             list of the mobjects and family members.
         """
-        if only_those_with_points:
-            method = Mobject.family_members_with_points
-        else:
-            method = Mobject.get_family
         if self.use_z_index:
             mobjects = sorted(mobjects, key=lambda m: m.z_index)
-        return remove_list_redundancies(list(it.chain(*[method(m) for m in mobjects])))
+        # Cached until the structure of one of the family members changes.
+        # When the structure of any mobject changes, the entries used since
+        # then are checked and kept, and the others are dropped.
+        version = Mobject.get_structure_version()
+        if self.family_members_cache_version != version:
+            self.previous_family_members_cache = self.family_members_cache
+            self.family_members_cache = {}
+            self.family_members_cache_version = version
+        key = tuple(mobjects)
+        cache = self.family_members_cache.get(key)
+        if cache is None:
+            cache = self.previous_family_members_cache.get(key)
+            if cache is None or cache[1] != tuple(
+                m.get_structure_stamp() for m in cache[0]
+            ):
+                family_members = remove_list_redundancies(
+                    list(it.chain(*[m.get_family() for m in mobjects]))
+                )
+                stamps = tuple(m.get_structure_stamp() for m in family_members)
+                cache = (family_members, stamps)
+            self.family_members_cache[key] = cache
+        family_members = cache[0]
+        if only_those_with_points:
+            return [m for m in family_members if m.get_num_points() > 0]
+        return list(family_members)
 
     def get_mobjects_to_display(
         self, mobjects, include_submobjects=True, excluded_mobjects=None
@@ -489,6 +514,7 @@ class Camera(object):
             (VMobject, self.display_multiple_vectorized_mobjects),
             (PMobject, self.display_multiple_point_cloud_mobjects),
             (AbstractImageMobject, self.display_multiple_image_mobjects),
+            (MeshMobject, self.display_multiple_meshes),
             (Mobject, lambda batch, pa: batch),  # Do nothing
         ]
 
@@ -507,6 +533,59 @@ class Camera(object):
                 if batch_type == mobject_type:
                     func(batch, self.pixel_array)
 
+    def get_pixel_bounding_box(self, mobjects):
+        """Returns a box of the pixel array outside of which capturing
+        the passed mobjects doesn't change any pixel.
+
+        Parameters
+        ----------
+        mobjects : list
+            The Mobjects, as passed to capture_mobjects
+
+        Returns
+        -------
+        np.ndarray or None
+            ``[x_min, y_min, x_max, y_max]``, clipped to the pixel array, such
+            that the box is ``pixel_array[y_min:y_max, x_min:x_max]``. It is
+            empty if nothing is displayed, and None if it can't be determined.
+        """
+        pw = self.get_pixel_width()
+        ph = self.get_pixel_height()
+        x_min, y_min, x_max, y_max = pw, ph, 0, 0
+        for mobject in self.get_mobjects_to_display(mobjects):
+            points = mobject.points
+            if isinstance(mobject, (VMobject, MeshMobject)):
+                width = max(
+                    mobject.get_stroke_width(),
+                    mobject.get_stroke_width(background=True),
+                )
+                # With cairo's default miter limit of 10, joins can stick out
+                # of the path by up to 5 times the line width
+                line_width = width * self.cairo_line_width_multiple
+                margin = 5 * line_width * pw / self.frame_width
+                if isinstance(mobject, MeshMobject):
+                    # Only the vertices of the faces drawn by display_mesh
+                    are_finite = np.isfinite(points).all(axis=1)
+                    faces = mobject.faces[are_finite[mobject.faces].all(axis=1)]
+                    if len(faces) == 0:
+                        continue
+                    points = points[np.unique(faces)]
+            elif isinstance(mobject, PMobject):
+                margin = self.adjusted_thickness(mobject.stroke_width)
+            elif isinstance(mobject, AbstractImageMobject):
+                # Add the missing down right corner
+                points = np.vstack([points, points[1] + points[2] - points[0]])
+                margin = 0
+            else:
+                # Not displayed, see capture_mobjects
+                continue
+            pixel_coords = self.points_to_pixel_coords(mobject, points)
+            # Leave room for antialiasing and rounding errors
+            margin = int(np.ceil(margin)) + 2
+            x_min, y_min = np.minimum([x_min, y_min], pixel_coords.min(0) - margin)
+            x_max, y_max = np.maximum([x_max, y_max], pixel_coords.max(0) + margin)
+        return np.clip([x_min, y_min, x_max, y_max], 0, [pw, ph, pw, ph])
+
     # Methods associated with svg rendering
 
     # NOTE: None of the methods below have been mentioned outside of their definitions. Their DocStrings are not as
@@ -663,15 +742,29 @@ class Camera(object):
             return
 
         ctx.new_path()
-        subpaths = vmobject.gen_subpaths_from_points_2d(points)
-        for subpath in subpaths:
-            quads = vmobject.gen_cubic_bezier_tuples_from_points(subpath)
+        nppcc = vmobject.n_points_per_cubic_curve
+        starts, ends = vmobject.get_subpath_bounds_from_points_2d(points)
+        # Subpaths start on curve boundaries, so the control points of all
+        # curves can be extracted at once, and converted to python floats
+        # which cairo takes much faster than numpy scalars
+        n_curves = len(points) // nppcc
+        curves = points[: n_curves * nppcc].reshape((n_curves, nppcc, 3))
+        curve_coords = curves[:, 1:, :2].reshape((n_curves, 2 * (nppcc - 1))).tolist()
+        start_coords = points[starts, :2].tolist()
+        first, last = points[starts, :2], points[ends - 1, :2]
+        atol = vmobject.tolerance_for_point_equality
+        is_closed = (np.abs(first - last) <= atol + 1.0e-5 * np.abs(last)).all(axis=1)
+        for start, end, start_coord, closed in zip(
+            (starts // nppcc).tolist(),
+            (ends // nppcc).tolist(),
+            start_coords,
+            is_closed.tolist(),
+        ):
             ctx.new_sub_path()
-            start = subpath[0]
-            ctx.move_to(*start[:2])
-            for p0, p1, p2, p3 in quads:
-                ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
-            if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
+            ctx.move_to(*start_coord)
+            for curve_coord in curve_coords[start:end]:
+                ctx.curve_to(*curve_coord)
+            if closed:
                 ctx.close_path()
         return self
 
@@ -836,6 +929,126 @@ class Camera(object):
     # NOTE: Out of the following methods, only `transform_points_pre_display` and `points_to_pixel_coords` have been mentioned outside of their definitions.
     # As a result, the other methods do not have as detailed docstrings as would be preferred.
 
+    def display_multiple_meshes(self, meshes, pixel_array):
+        """Displays multiple MeshMobjects in the pixel_array
+
+        Parameters
+        ----------
+        meshes : list
+            list of MeshMobjects to display
+        pixel_array : np.ndarray
+            The pixel array
+        """
+        ctx = self.get_cairo_context(pixel_array)
+        for mesh in meshes:
+            self.display_mesh(mesh, ctx)
+
+    def display_mesh(self, mesh, ctx):
+        """Displays the faces of a MeshMobject in the cairo context, in the
+        order given by get_mesh_face_order, each one filled then stroked.
+        Faces with a vertex which isn't finite are skipped.
+
+        Parameters
+        ----------
+        mesh : MeshMobject
+            The mesh to display
+        ctx : cairo.Context
+            The cairo context to use.
+
+        Returns
+        -------
+        Camera
+            The camera object
+        """
+        if mesh.get_num_faces() == 0:
+            return self
+        points = mesh.points
+        are_finite = np.isfinite(points).all(axis=1)
+        if not are_finite.all():
+            # Otherwise transform_points_pre_display would drop all the points
+            points = np.where(are_finite[:, np.newaxis], points, 0)
+        points = self.transform_points_pre_display(mesh, points)
+        order = self.get_mesh_face_order(mesh)
+        # Only the faces whose vertices are all finite are drawn
+        order = order[are_finite[mesh.faces[order]].all(axis=1)]
+        if len(order) == 0:
+            return self
+        faces = mesh.faces[order]
+        # Python floats, which cairo takes much faster than numpy scalars
+        face_coords = points[faces, :2].tolist()
+        # Use reversed rgb because cairo surface is
+        # encodes it in reverse order
+        fill_rgbas = self.get_mesh_fill_rgbas(mesh)[order][..., [2, 1, 0, 3]]
+        n_stops = fill_rgbas.shape[1]
+        # The colors of the faces go from their first vertex to the
+        # opposite one
+        gradient_coords = np.append(
+            points[faces[:, 0], :2], points[faces[:, faces.shape[1] // 2], :2], axis=1
+        ).tolist()
+        offsets = np.linspace(0, 1, n_stops).tolist()
+        stroke_width = mesh.get_stroke_width()
+        if stroke_width > 0:
+            stroke_rgba = mesh.get_stroke_rgbas()[0, [2, 1, 0, 3]].tolist()
+            ctx.set_line_width(
+                stroke_width
+                * self.cairo_line_width_multiple
+                * (self.get_frame_width() / self.frame_width)
+            )
+        for coords, rgbas, gradient_coord in zip(
+            face_coords, fill_rgbas.tolist(), gradient_coords
+        ):
+            ctx.new_path()
+            ctx.move_to(*coords[0])
+            for coord in coords[1:]:
+                ctx.line_to(*coord)
+            ctx.close_path()
+            if n_stops == 1:
+                ctx.set_source_rgba(*rgbas[0])
+            else:
+                pattern = cairo.LinearGradient(*gradient_coord)
+                for offset, rgba in zip(offsets, rgbas):
+                    pattern.add_color_stop_rgba(offset, *rgba)
+                ctx.set_source(pattern)
+            if stroke_width > 0:
+                ctx.fill_preserve()
+                ctx.set_source_rgba(*stroke_rgba)
+                ctx.stroke()
+            else:
+                ctx.fill()
+        return self
+
+    def get_mesh_face_order(self, mesh):
+        """Returns the indices of the faces of a MeshMobject, in the order in
+        which they are drawn.
+
+        Parameters
+        ----------
+        mesh : MeshMobject
+            The mesh
+
+        Returns
+        -------
+        np.ndarray
+            The indices of the faces.
+        """
+        return np.arange(mesh.get_num_faces())
+
+    def get_mesh_fill_rgbas(self, mesh):
+        """Returns the fill colors of the faces of a MeshMobject, as gradients
+        from the first vertex of each face to the opposite one.
+
+        Parameters
+        ----------
+        mesh : MeshMobject
+            The mesh
+
+        Returns
+        -------
+        np.ndarray
+            The RGBA arrays of the faces, of shape (n_faces, n_stops, 4).
+        """
+        return mesh.get_fill_rgbas()[:, np.newaxis]
+
     def display_multiple_point_cloud_mobjects(self, pmobjects, pixel_array):
         """Displays multiple PMobjects by modifying the passed pixel array.
 
@@ -946,26 +1159,16 @@ class Camera(object):
 
         # TODO, there is no accounting for a shear...
 
-        # Paste into an image as large as the camear's pixel array
-        full_image = Image.fromarray(
-            np.zeros((self.get_pixel_height(), self.get_pixel_width())), mode="RGBA"
-        )
         new_ul_coords = center_coords - np.array(sub_image.size) / 2
         new_ul_coords = new_ul_coords.astype(int)
-        full_image.paste(
-            sub_image,
-            box=(
-                new_ul_coords[0],
-                new_ul_coords[1],
-                new_ul_coords[0] + sub_image.size[0],
-                new_ul_coords[1] + sub_image.size[1],
-            ),
-        )
         # Paint on top of existing pixel array
-        self.overlay_PIL_image(pixel_array, full_image)
+        self.overlay_rgba_array(pixel_array, np.asarray(sub_image), new_ul_coords)
+
+    def overlay_rgba_array(self, pixel_array, new_array, ul_coords=(0, 0)):
+        """Overlays an RGBA array on top of the given Pixel array, in place.
 
-    def overlay_rgba_array(self, pixel_array, new_array):
-        """Overlays an RGBA array on top of the given Pixel array.
+        The result is the same as with PIL's ``Image.alpha_composite``, but
+        only the pixels covered by the new array are computed.
 
         Parameters
         ----------
@@ -973,8 +1176,36 @@ class Camera(object):
             The original pixel array to modify.
         new_array : np.array
             The new pixel array to overlay.
+        ul_coords : np.array, list, tuple, optional
+            The pixel coordinates (x, y) of the upper left corner of new_array
+            in pixel_array, by default (0, 0). The parts of new_array out of
+            pixel_array are ignored.
         """
-        self.overlay_PIL_image(pixel_array, self.get_image(new_array))
+        x, y = ul_coords
+        height, width = new_array.shape[:2]
+        x_min, y_min = max(x, 0), max(y, 0)
+        x_max = min(x + width, pixel_array.shape[1])
+        y_max = min(y + height, pixel_array.shape[0])
+        if x_min >= x_max or y_min >= y_max:
+            return
+        dst_region = pixel_array[y_min:y_max, x_min:x_max]
+        src_region = new_array[y_min - y : y_max - y, x_min - x : x_max - x]
+        # Fully transparent pixels leave the pixel array unchanged
+        covered = src_region[:, :, 3] != 0
+        src = src_region[covered].astype(np.uint32)
+        dst = dst_region[covered].astype(np.uint32)
+
+        # Same fixed point arithmetic as PIL, with 7 bits of precision,
+        # where (v + (v >> 8)) >> 8 divides by 255
+        src_alpha = src[:, 3:]
+        out_alpha = src_alpha * 255 + dst[:, 3:] * (255 - src_alpha)
+        src_coef = (src_alpha * (255 * 255 << 7)) // out_alpha
+        dst_coef = (255 << 7) - src_coef
+        result = src * src_coef + dst * dst_coef + (0x80 << 7)
+        result = (((result >> 8) + result) >> 8) >> 7
+        out_alpha += 0x80
+        result[:, 3:] = ((out_alpha >> 8) + out_alpha) >> 8
+        dst_region[covered] = result
 
     def overlay_PIL_image(self, pixel_array, image):
         """Overlays a PIL image on the passed pixel array.
@@ -986,9 +1217,7 @@ class Camera(object):
         image : PIL.Image
             The Image to overlay.
         """
-        pixel_array[:, :] = np.array(
-            Image.alpha_composite(self.get_image(pixel_array), image), dtype="uint8"
-        )
+        self.overlay_rgba_array(pixel_array, np.asarray(image.convert("RGBA")))
 
     def adjust_out_of_range_points(self, points):
         """If any of the points in the passed array are out of
@@ -41,6 +41,10 @@ class MappingCamera(Camera):
             self, mobject_copies, include_submobjects=False, excluded_mobjects=None,
         )
 
+    def get_pixel_bounding_box(self, mobjects):  # NOTE : DocStrings From parent
+        # The mobjects aren't displayed where their points are
+        return None
+
 
 # Note: This allows layering of multiple cameras onto the same portion of the pixel array,
 # the later cameras overwriting the former
@@ -76,6 +80,10 @@ class OldMultiCamera(Camera):
                 shifted_camera.start_x : shifted_camera.end_x,
             ] = shifted_camera.camera.pixel_array
 
+    def get_pixel_bounding_box(self, mobjects):  # NOTE : DocStrings From parent
+        # The sub cameras overwrite whole regions of the pixel array
+        return None
+
     def set_background(self, pixel_array, **kwargs):
         for shifted_camera in self.shifted_cameras:
             shifted_camera.camera.set_background(
@@ -75,6 +75,10 @@ class MultiCamera(MovingCamera):
             imfc.camera.capture_mobjects(to_add, **kwargs)
         MovingCamera.capture_mobjects(self, mobjects, **kwargs)
 
+    def get_pixel_bounding_box(self, mobjects):  # NOTE : DocStrings From parent
+        # The images of the sub cameras change with the mobjects they show
+        return None
+
     def get_mobjects_indicating_movement(self):
         """Returns all mobjets whose movement implies that the camera
         should think of all other mobjects on the screen as moving
@@ -3,13 +3,11 @@ import numpy as np
 from ..camera.camera import Camera
 from ..constants import *
 from ..config import config
-from ..mobject.three_d_utils import get_3d_vmob_end_corner
-from ..mobject.three_d_utils import get_3d_vmob_end_corner_unit_normal
-from ..mobject.three_d_utils import get_3d_vmob_start_corner
-from ..mobject.three_d_utils import get_3d_vmob_start_corner_unit_normal
+from ..mobject.three_d_utils import get_3d_vmobs_corners_and_unit_normals
 from ..mobject.types.point_cloud_mobject import Point
+from ..mobject.types.vectorized_mobject import VMobject
 from ..mobject.value_tracker import ValueTracker
-from ..utils.color import get_shaded_rgb
+from ..utils.color import get_shading_factors
 from ..utils.simple_functions import clip_in_place
 from ..utils.space_ops import rotation_about_z
 from ..utils.space_ops import rotation_matrix
@@ -49,6 +47,9 @@ class ThreeDCamera(Camera):
         self.frame_center = Point(self.frame_center)
         self.fixed_orientation_mobjects = dict()
         self.fixed_in_frame_mobjects = set()
+        # Points projected by project_mobjects, see get_projection_key
+        self.projection_key = None
+        self.projected_points = {}
         self.reset_rotation_matrix()
 
     def capture_mobjects(self, mobjects, **kwargs):
@@ -76,26 +77,71 @@ class ThreeDCamera(Camera):
         if not self.should_apply_shading:
             return rgbas
         if vmobject.shade_in_3d and (vmobject.get_num_points() > 0):
-            light_source_point = self.light_source.points[0]
             if len(rgbas) < 2:
                 shaded_rgbas = rgbas.repeat(2, axis=0)
             else:
                 shaded_rgbas = np.array(rgbas[:2])
-            shaded_rgbas[0, :3] = get_shaded_rgb(
-                shaded_rgbas[0, :3],
-                get_3d_vmob_start_corner(vmobject),
-                get_3d_vmob_start_corner_unit_normal(vmobject),
-                light_source_point,
-            )
-            shaded_rgbas[1, :3] = get_shaded_rgb(
-                shaded_rgbas[1, :3],
-                get_3d_vmob_end_corner(vmobject),
-                get_3d_vmob_end_corner_unit_normal(vmobject),
-                light_source_point,
-            )
+            factors = self.get_cached_shading_factors(vmobject)
+            if factors is None:
+                factors = self.get_vmobject_shading_factors([vmobject])[0]
+            shaded_rgbas[:, :3] += factors[:, np.newaxis]
             return shaded_rgbas
         return rgbas
 
+    def get_cached_shading_factors(self, mobject):
+        """Returns the shading factors cached by cache_shading_factors, or None
+        if the mobject or the light source changed since.
+        """
+        cache = mobject.__dict__.get("_shading_factors")
+        if cache is None or cache[0] != (
+            mobject.get_version(),
+            tuple(self.light_source.points[0]),
+        ):
+            return None
+        return cache[1]
+
+    def cache_shading_factors(self, mobject, factors):
+        # Shading doesn't depend on the rotation of the camera, so this
+        # stays valid while the camera moves around still mobjects
+        mobject.__dict__["_shading_factors"] = (
+            (mobject.get_version(), tuple(self.light_source.points[0])),
+            factors,
+        )
+
+    def get_vmobject_shading_factors(self, vmobjects):
+        """Returns what shading adds to the rgb values of the colors of each
+        vmobject, at its start and end corners, computed at once for all those
+        whose factors aren't cached yet.
+
+        Parameters
+        ----------
+        vmobjects : list
+            The VMobjects with points to shade.
+
+        Returns
+        -------
+        np.ndarray
+            The factors, of shape (len(vmobjects), 2).
+        """
+        factors = np.zeros((len(vmobjects), 2))
+        stale = []
+        for i, vmobject in enumerate(vmobjects):
+            cached_factors = self.get_cached_shading_factors(vmobject)
+            if cached_factors is None:
+                stale.append(i)
+            else:
+                factors[i] = cached_factors
+        if stale:
+            corners, unit_normals = get_3d_vmobs_corners_and_unit_normals(
+                [vmobjects[i] for i in stale]
+            )
+            factors[stale] = get_shading_factors(
+                corners, unit_normals, self.light_source.points[0]
+            )
+            for i in stale:
+                self.cache_shading_factors(vmobjects[i], factors[i])
+        return factors
+
     def get_stroke_rgbas(
         self, vmobject, background=False
     ):  # NOTE : DocStrings From parent
@@ -104,18 +150,73 @@ class ThreeDCamera(Camera):
     def get_fill_rgbas(self, vmobject):  # NOTE : DocStrings From parent
         return self.modified_rgbas(vmobject, vmobject.get_fill_rgbas())
 
+    def get_mesh_face_order(self, mesh):  # NOTE : DocStrings From parent
+        if not mesh.shade_in_3d:
+            return Camera.get_mesh_face_order(self, mesh)
+        # From back to front, like the mobjects in get_mobjects_to_display
+        depths = np.dot(mesh.get_face_centers(), self.get_rotation_matrix()[2])
+        return np.argsort(depths, kind="stable")
+
+    def get_mesh_fill_rgbas(self, mesh):  # NOTE : DocStrings From parent
+        rgbas = Camera.get_mesh_fill_rgbas(self, mesh)
+        if not (self.should_apply_shading and mesh.shade_in_3d):
+            return rgbas
+        factors = self.get_cached_shading_factors(mesh)
+        if factors is None:
+            factors = self.get_mesh_shading_factors(mesh)
+            self.cache_shading_factors(mesh, factors)
+        shaded_rgbas = rgbas.repeat(2, axis=1)
+        shaded_rgbas[:, :, :3] += factors[:, :, np.newaxis]
+        return shaded_rgbas
+
+    def get_mesh_shading_factors(self, mesh):
+        # Shaded at the first vertex of each face and at the opposite one,
+        # like the corners of VMobjects in modified_rgbas
+        vertices = mesh.get_face_vertices()
+        n_vertices = vertices.shape[1]
+        indices = np.array([0, n_vertices // 2])
+        corners = vertices[:, indices]
+        normals = np.cross(
+            vertices[:, (indices + 1) % n_vertices] - corners,
+            vertices[:, indices - 1] - corners,
+        )
+        norms = np.sqrt((normals ** 2).sum(axis=-1))[..., np.newaxis]
+        unit_normals = np.divide(
+            normals, norms, out=np.tile(UP, normals.shape[:-1] + (1,)), where=norms > 0
+        )
+        return get_shading_factors(corners, unit_normals, self.light_source.points[0])
+
     def get_mobjects_to_display(self, *args, **kwargs):  # NOTE : DocStrings From parent
         mobjects = Camera.get_mobjects_to_display(self, *args, **kwargs)
         rot_matrix = self.get_rotation_matrix()
-
-        def z_key(mob):
-            if not (hasattr(mob, "shade_in_3d") and mob.shade_in_3d):
-                return np.inf
-            # Assign a number to a three dimensional mobjects
-            # based on how close it is to the camera
-            return np.dot(mob.get_z_index_reference_point(), rot_matrix.T)[2]
-
-        return sorted(mobjects, key=z_key)
+        is_3d = np.array([bool(getattr(mob, "shade_in_3d", False)) for mob in mobjects])
+        # Assign a number to three dimensional mobjects based on how close
+        # they are to the camera, the others being displayed last
+        z_keys = np.full(len(mobjects), np.inf)
+        if is_3d.any():
+            reference_points = np.array(
+                [
+                    mob.get_z_index_reference_point()
+                    for mob, mob_is_3d in zip(mobjects, is_3d)
+                    if mob_is_3d
+                ]
+            )
+            z_keys[is_3d] = np.dot(reference_points, rot_matrix[2])
+        mobjects = [mobjects[i] for i in np.argsort(z_keys, kind="stable")]
+        if self.should_apply_shading:
+            # Shades all the vmobjects at once, rather than one at a time
+            # while they are displayed
+            self.get_vmobject_shading_factors(
+                [
+                    mob
+                    for mob in mobjects
+                    if isinstance(mob, VMobject)
+                    and mob.shade_in_3d
+                    and mob.get_num_points() > 0
+                ]
+            )
+        self.project_mobjects(mobjects)
+        return mobjects
 
     def get_phi(self):
         """Returns the Polar angle (the angle off Z_AXIS) phi.
@@ -293,6 +394,72 @@ class ThreeDCamera(Camera):
         points = points + frame_center
         return points
 
+    def get_projection_key(self):
+        """Returns what the projection of points by project_points depends on,
+        which changes when the camera moves.
+
+        Returns
+        -------
+        tuple
+            The rotation matrix, frame center, distance and kind of projection.
+        """
+        return (
+            self.get_rotation_matrix().tobytes(),
+            tuple(self.get_frame_center()),
+            self.get_distance(),
+            self.exponential_projection,
+        )
+
+    def project_mobjects(self, mobjects):
+        """Projects the points of all the mobjects at once, into a single
+        buffer whose views are then returned by transform_points_pre_display,
+        until the camera or the mobjects move.  Mobjects which are fixed in
+        frame or in orientation, or whose points aren't all finite, are left
+        to transform_points_pre_display.
+
+        Parameters
+        ----------
+        mobjects : list
+            The mobjects about to be displayed.
+        """
+        key = self.get_projection_key()
+        if key != self.projection_key:
+            self.projection_key = key
+            self.projected_points = {}
+        # Only the mobjects still displayed are kept
+        projected_points = {}
+        to_project = []
+        for mobject in mobjects:
+            if (
+                len(mobject.points) == 0
+                or mobject in self.fixed_in_frame_mobjects
+                or mobject in self.fixed_orientation_mobjects
+            ):
+                continue
+            cache = self.projected_points.get(mobject)
+            if cache is not None and cache[0] == mobject.get_version():
+                projected_points[mobject] = cache
+            else:
+                to_project.append(mobject)
+        self.projected_points = projected_points
+        if len(to_project) == 0:
+            return
+        lengths = np.array([len(mobject.points) for mobject in to_project])
+        starts = np.cumsum(lengths) - lengths
+        points = np.concatenate([mobject.points for mobject in to_project])
+        are_finite = np.logical_and.reduceat(np.isfinite(points).all(axis=1), starts)
+        points = self.project_points(points)
+        # Shared by the views
+        points.flags.writeable = False
+        for mobject, start, length, is_finite in zip(
+            to_project, starts.tolist(), lengths.tolist(), are_finite.tolist()
+        ):
+            if is_finite:
+                projected_points[mobject] = (
+                    mobject.get_version(),
+                    points[start : start + length],
+                )
+
     def project_point(self, point):
         """Applies the current rotation_matrix as a projection
         matrix to the passed point.
@@ -312,6 +479,14 @@ class ThreeDCamera(Camera):
     def transform_points_pre_display(
         self, mobject, points
     ):  # TODO: Write Docstrings for this Method.
+        cache = self.projected_points.get(mobject)
+        if (
+            cache is not None
+            and points is mobject.points
+            and cache[0] == mobject.get_version()
+            and self.projection_key == self.get_projection_key()
+        ):
+            return cache[1]
         points = super().transform_points_pre_display(mobject, points)
         fixed_orientation = mobject in self.fixed_orientation_mobjects
         fixed_in_frame = mobject in self.fixed_in_frame_mobjects
@@ -361,6 +536,8 @@ class ThreeDCamera(Camera):
                 func = mobject.get_center
             for submob in mobject.get_family():
                 self.fixed_orientation_mobjects[submob] = func
+                # Not projected anymore
+                self.projected_points.pop(submob, None)
 
     def add_fixed_in_frame_mobjects(self, *mobjects):
         """This method allows the mobject to have a fixed position,
@@ -377,6 +554,7 @@ class ThreeDCamera(Camera):
         """
         for mobject in self.extract_mobject_family_members(mobjects):
             self.fixed_in_frame_mobjects.add(mobject)
+            self.projected_points.pop(mobject, None)
 
     def remove_fixed_orientation_mobjects(self, *mobjects):
         """If a mobject was fixed in its orientation by passing it through
@@ -389,8 +567,7 @@ class ThreeDCamera(Camera):
             The mobjects whose orientation need not be fixed any longer.
         """
         for mobject in self.extract_mobject_family_members(mobjects):
-            if mobject in self.fixed_orientation_mobjects:
-                self.fixed_orientation_mobjects.remove(mobject)
+            self.fixed_orientation_mobjects.pop(mobject, None)
 
     def remove_fixed_in_frame_mobjects(self, *mobjects):
         """If a mobject was fixed in frame by passing it through
@@ -403,5 +580,4 @@ class ThreeDCamera(Camera):
             The mobjects which need not be fixed in frame any longer.
         """
         for mobject in self.extract_mobject_family_members(mobjects):
-            if mobject in self.fixed_in_frame_mobjects:
-                self.fixed_in_frame_mobjects.remove(mobject)
+            self.fixed_in_frame_mobjects.discard(mobject)
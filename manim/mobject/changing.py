@@ -81,6 +81,7 @@ class TracedPath(VMobject):
         else:
             # Set the end to be the new point
             self.points[-1] = new_point
+            self.increment_version()
 
             # Second to last point
             nppcc = self.n_points_per_cubic_curve
@@ -9,10 +9,21 @@ class ParametricFunction(VMobject):
     CONFIG = {
         "t_min": 0,
         "t_max": 1,
-        "step_size": 0.01,  # Use "auto" (lowercase) for automatic step size
+        # Use "auto" (lowercase) for automatic step size, or "adaptive" to
+        # sample more densely where the curve bends, see add_adaptive_curves
+        "step_size": 0.01,
         "dt": 1e-8,
         # TODO, be smarter about figuring these out?
         "discontinuities": [],
+        # Whether the function accepts arrays of values of t, see
+        # get_points_from_vectorized_function
+        "use_vectorized": False,
+        # For the "adaptive" step size: the largest distance between the curve
+        # and the function, by default half a pixel, the number of samples
+        # the refinement starts from, and how many times they can be halved
+        "error_tolerance": None,
+        "num_initial_samples": 64,
+        "max_refinements": 10,
     }
 
     def __init__(self, function=None, **kwargs):
@@ -26,6 +37,37 @@ class ParametricFunction(VMobject):
     def get_point_from_function(self, t):
         return self.function(t)
 
+    def get_points_from_vectorized_function(self, t_range):
+        """
+        Samples the function at all the values of t at once, which is much
+        faster than calling it once per value, for functions written with
+        numpy operations.
+
+        Parameters
+        ----------
+        t_range : np.ndarray
+            The values of t.
+
+        Returns
+        -------
+        np.ndarray
+            The points of the curve, one per value of t.  The function
+            returns their coordinates, as a sequence ``x, y, z`` of arrays,
+            or of numbers for the coordinates which are constant, like
+            ``lambda t: (np.cos(t), np.sin(t), 0)``.
+        """
+        coordinates = self.function(t_range)
+        points = np.zeros((len(t_range), self.dim))
+        for i, coordinate in enumerate(coordinates):
+            points[:, i] = coordinate
+        return points
+
+    def sample_function(self, t_values):
+        if self.use_vectorized:
+            return self.get_points_from_vectorized_function(np.array(t_values))
+        points = np.array([self.function(t) for t in t_values])
+        return points.reshape((len(t_values), self.dim))
+
     def get_step_size(self, t=None):
         if self.step_size == "auto":
             """
@@ -61,19 +103,179 @@ class ParametricFunction(VMobject):
         ]
         boundary_times.sort()
         for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2]):
+            if self.step_size == "adaptive":
+                self.add_adaptive_curves(t1, t2)
+                continue
             t_range = list(np.arange(t1, t2, self.get_step_size(t1)))
             if t_range[-1] != t2:
                 t_range.append(t2)
-            points = np.array([self.function(t) for t in t_range])
-            valid_indices = np.apply_along_axis(np.all, 1, np.isfinite(points))
+            points = self.sample_function(t_range)
+            valid_indices = np.isfinite(points).all(axis=1)
             points = points[valid_indices]
             if len(points) > 0:
                 self.start_new_path(points[0])
                 self.add_points_as_corners(points[1:])
-        self.make_smooth()
+        if self.step_size != "adaptive":
+            self.make_smooth()
+        return self
+
+    def add_adaptive_curves(self, t1, t2):
+        """
+        Adds the curve of the function between t1 and t2, made of cubic bezier
+        curves fitted to samples of the function.  Starting from
+        num_initial_samples evenly spaced samples, each curve is split in
+        two, with a new sample in the middle, until the curve is within
+        error_tolerance of the function at a quarter, half and three quarters
+        of its interval of t, so the samples are dense only where the curve
+        bends.  Splitting a curve changes the handles of its neighbours,
+        which are then measured again.  Features narrower than the initial
+        spacing of the samples may be missed.
+
+        The curve is broken where the function isn't finite, and the
+        tolerance is measured in the coordinates of the points returned by
+        the function, before any transformation of the mobject.
+        """
+        tolerance = self.error_tolerance
+        if tolerance is None:
+            tolerance = 0.5 * config["frame_width"] / config["pixel_width"]
+        t_values = np.linspace(t1, t2, max(self.num_initial_samples, 2))
+        points = self.sample_function(t_values)
+        # Per curve, the number of times it was split, whether it was
+        # compared with the function and its points back then, and the value
+        # of the function in its middle, known once its parent was measured
+        num_curves = len(t_values) - 1
+        depths = np.zeros(num_curves, dtype=int)
+        checked = np.zeros(num_curves, dtype=bool)
+        checked_curves = np.full((num_curves, 4, self.dim), np.nan)
+        has_mid_point = np.zeros(num_curves, dtype=bool)
+        mid_points = np.full((num_curves, self.dim), np.nan)
+        # The bezier curves at a quarter, half and three quarters
+        weights = np.array([[27, 27, 9, 1], [8, 24, 24, 8], [1, 9, 27, 27]]) / 64
+        while True:
+            curves = fit_bezier_curves(t_values, points)
+            is_unchanged = (curves == checked_curves) | (
+                np.isnan(curves) & np.isnan(checked_curves)
+            )
+            checked &= is_unchanged.all(axis=(1, 2))
+            indices = np.flatnonzero(~checked & (depths < self.max_refinements))
+            if len(indices) == 0:
+                break
+            starts, ends = t_values[indices], t_values[indices + 1]
+            missing = indices[~has_mid_point[indices]]
+            if len(missing) > 0:
+                mid_points[missing] = self.sample_function(
+                    (t_values[missing] + t_values[missing + 1]) / 2
+                )
+                has_mid_point[missing] = True
+            quarter_points = self.sample_function(
+                np.concatenate([(3 * starts + ends) / 4, (starts + 3 * ends) / 4])
+            ).reshape((2, len(indices), self.dim))
+            samples = np.stack(
+                [quarter_points[0], mid_points[indices], quarter_points[1]]
+            )
+            curve_samples = np.einsum("sk,nkd->snd", weights, curves[indices])
+            errors = np.linalg.norm(curve_samples - samples, axis=2).max(axis=0)
+            # Curves which aren't finite are split too, to come closer to
+            # where the function stops being finite
+            split = ~(errors <= tolerance)
+            t_values = np.insert(
+                t_values, indices[split] + 1, (starts + ends)[split] / 2
+            )
+            points = np.insert(
+                points, indices[split] + 1, mid_points[indices[split]], axis=0
+            )
+            checked[indices] = True
+            checked_curves[indices] = curves[indices]
+            is_split = np.zeros(len(depths), dtype=bool)
+            is_split[indices[split]] = True
+            counts = np.where(is_split, 2, 1)
+            first_halves = (np.cumsum(counts) - counts)[is_split]
+            depths = np.repeat(depths + is_split, counts)
+            checked = np.repeat(checked & ~is_split, counts)
+            checked_curves = np.repeat(checked_curves, counts, axis=0)
+            has_mid_point = np.repeat(has_mid_point & ~is_split, counts)
+            mid_points = np.repeat(mid_points, counts, axis=0)
+            # The quarters of a split curve are the middles of its halves
+            mid_points[first_halves] = quarter_points[0][split]
+            mid_points[first_halves + 1] = quarter_points[1][split]
+            has_mid_point[first_halves] = True
+            has_mid_point[first_halves + 1] = True
+        # Runs of consecutive finite curves make the subpaths
+        is_finite = np.isfinite(curves).all(axis=(1, 2))
+        bounds = np.flatnonzero(np.diff(np.concatenate([[0], is_finite, [0]])))
+        for start, end in zip(bounds[0::2], bounds[1::2]):
+            self.append_points(curves[start:end].reshape((-1, self.dim)))
         return self
 
 
+def fit_bezier_curves(t_values, points):
+    """
+    Fits cubic bezier curves between consecutive points of a function, whose
+    handles follow its derivative, estimated from the neighbouring points.
+
+    Parameters
+    ----------
+    t_values : np.ndarray
+        The increasing values at which the function was sampled.
+    points : np.ndarray
+        The values of the function there, possibly not finite.
+
+    Returns
+    -------
+    np.ndarray
+        The points of each curve, of shape (len(t_values) - 1, 4, dim).
+        The curves from or to points which aren't finite are filled with NaN.
+    """
+    curves = np.full((len(points) - 1, 4, points.shape[1]), np.nan)
+    is_finite = np.isfinite(points).all(axis=1)
+    bounds = np.flatnonzero(np.diff(np.concatenate([[0], is_finite, [0]])))
+    for start, end in zip(bounds[0::2], bounds[1::2]):
+        if end - start < 2:
+            continue
+        t, p = t_values[start:end], points[start:end]
+        derivatives = get_derivatives(t, p)
+        dt = np.diff(t)[:, np.newaxis] / 3
+        curves[start : end - 1, 0] = p[:-1]
+        curves[start : end - 1, 1] = p[:-1] + derivatives[:-1] * dt
+        curves[start : end - 1, 2] = p[1:] - derivatives[1:] * dt
+        curves[start : end - 1, 3] = p[1:]
+    return curves
+
+
+def get_derivatives(t, points):
+    """
+    Estimates the derivative of a function at each of its samples, from the
+    parabola through the sample and its neighbours, or from the line
+    through both samples if there are only two.
+    """
+    h = np.diff(t)[:, np.newaxis]
+    if len(points) == 2:
+        slope = (points[1] - points[0]) / h[0]
+        return np.array([slope, slope])
+    h0, h1 = h[:-1], h[1:]
+    p0, p1, p2 = points[:-2], points[1:-1], points[2:]
+    derivatives = np.zeros(points.shape)
+    derivatives[1:-1] = (
+        -h1 / (h0 * (h0 + h1)) * p0
+        + (h1 - h0) / (h0 * h1) * p1
+        + h0 / (h1 * (h0 + h1)) * p2
+    )
+    # At both ends, from the parabola through the three nearest samples
+    h0, h1 = h[0], h[1]
+    derivatives[0] = (
+        -(2 * h0 + h1) / (h0 * (h0 + h1)) * points[0]
+        + (h0 + h1) / (h0 * h1) * points[1]
+        - h0 / (h1 * (h0 + h1)) * points[2]
+    )
+    h0, h1 = h[-1], h[-2]
+    derivatives[-1] = (
+        (2 * h0 + h1) / (h0 * (h0 + h1)) * points[-1]
+        - (h0 + h1) / (h0 * h1) * points[-2]
+        + h0 / (h1 * (h0 + h1)) * points[-3]
+    )
+    return derivatives
+
+
 class FunctionGraph(ParametricFunction):
     CONFIG = {
         "color": YELLOW,
@@ -84,8 +286,12 @@ class FunctionGraph(ParametricFunction):
     def __init__(self, function, **kwargs):
         digest_config(self, kwargs)
         self.parametric_function = lambda t: np.array([t, function(t), 0])
+        if self.use_vectorized:
+            sampled_function = lambda t: (t, function(t), 0)
+        else:
+            sampled_function = self.parametric_function
         ParametricFunction.__init__(
-            self, self.parametric_function, t_min=self.x_min, t_max=self.x_max, **kwargs
+            self, sampled_function, t_min=self.x_min, t_max=self.x_max, **kwargs
         )
         self.function = function
 
@@ -627,12 +627,14 @@ class Arrow(Line):
         if has_tip:
             self.add_tip()
             old_tips[0].points[:, :] = self.tip.points
+            old_tips[0].increment_version()
             self.remove(self.tip)
             self.tip = old_tips[0]
             self.add(self.tip)
         if has_start_tip:
             self.add_tip(at_start=True)
             old_tips[1].points[:, :] = self.start_tip.points
+            old_tips[1].increment_version()
             self.remove(self.start_tip)
             self.start_tip = old_tips[1]
             self.add(self.start_tip)
@@ -29,6 +29,16 @@ from ..utils.space_ops import rotation_matrix
 # TODO: Explain array_attrs
 
 
+# Shared by all mobjects, so that a version number is never reused
+_version_counter = it.count(1)
+
+# Changes whenever the submobjects, the updaters or the updating status of
+# any mobject change, see Mobject.get_structure_version and
+# Mobject.get_structure_stamp
+_structure_version = 0
+_structure_attrs = frozenset(["submobjects", "updaters", "updating_suspended"])
+
+
 class Mobject(Container):
     """
     Mathematical Object
@@ -49,6 +59,8 @@ class Mobject(Container):
         if self.name is None:
             self.name = self.__class__.__name__
         self.updaters = []
+        # Whether each updater takes dt, as inspecting signatures is slow
+        self.updater_takes_dt = {}
         self.updating_suspended = False
         self.reset_points()
         self.generate_points()
@@ -57,6 +69,101 @@ class Mobject(Container):
     def __str__(self):
         return str(self.name)
 
+    def __setattr__(self, attr, value):
+        # Rebinding any attribute (points, colors, submobjects...) is a
+        # mutation of the mobject, see get_version.
+        self.__dict__["_version"] = next(_version_counter)
+        if attr in _structure_attrs and attr in self.__dict__:
+            # Not when initializing the mobject, which can't have a parent yet
+            self.increment_structure_version()
+        object.__setattr__(self, attr, value)
+
+    def get_version(self):
+        """Returns a number identifying the current state of the mobject.
+
+        It changes whenever an attribute of the mobject is reassigned, as done
+        by e.g. :meth:`shift`, :meth:`set_points` or :meth:`set_fill`, and is
+        never reused, even by other mobjects.  In place modifications of its
+        arrays (e.g. ``mob.points[0] = ORIGIN``) are only taken into account
+        if followed by a call to :meth:`increment_version`.
+
+        Returns
+        -------
+        :class:`int`
+            The version of the mobject.
+        """
+        return self.__dict__.get("_version", 0)
+
+    def increment_version(self):
+        """Marks the mobject as modified, for changes not done through
+        attribute assignment.  See :meth:`get_version`.
+
+        Returns
+        -------
+        :class:`Mobject`
+            The mobject itself.
+        """
+        self.__dict__["_version"] = next(_version_counter)
+        return self
+
+    @staticmethod
+    def get_structure_version():
+        """Returns a number which changes whenever the structure of any mobject
+        changes, see :meth:`get_structure_stamp`.  Caches depending on the
+        structure of some mobjects are valid as long as it stays the same,
+        and otherwise as long as the structure stamps of these mobjects do.
+
+        Returns
+        -------
+        :class:`int`
+            The structure version.
+        """
+        return _structure_version
+
+    def get_structure_stamp(self):
+        """Returns a number identifying the current structure of the mobject.
+
+        It changes whenever the submobjects, the updaters or the updating
+        status of the mobject change, as done by e.g. :meth:`add`,
+        :meth:`add_updater` or :meth:`suspend_updating`, but not when those
+        of its submobjects do, and is never reused.  In place modifications
+        of ``submobjects`` (e.g. with ``append``, ``insert`` or ``reverse``)
+        are only taken into account if followed by a call to
+        :meth:`increment_structure_version`.
+
+        Returns
+        -------
+        :class:`int`
+            The structure stamp of the mobject.
+        """
+        return self.__dict__.get("_structure_stamp", 0)
+
+    def get_family_structure_stamps(self):
+        """Returns the structure stamps of the family of the mobject, which
+        identify how the family is made and updated.  See
+        :meth:`get_structure_stamp`.
+
+        Returns
+        -------
+        :class:`tuple`
+            The structure stamps of the mobjects of :meth:`get_family`.
+        """
+        return tuple(mob.get_structure_stamp() for mob in self.get_family())
+
+    def increment_structure_version(self):
+        """Marks the structure of the mobject as modified, for changes not
+        done through attribute assignment.  See :meth:`get_structure_stamp`.
+
+        Returns
+        -------
+        :class:`Mobject`
+            The mobject itself.
+        """
+        global _structure_version
+        _structure_version += 1
+        self.__dict__["_structure_stamp"] = next(_version_counter)
+        return self
+
     def reset_points(self):
         self.points = np.zeros((0, self.dim))
 
@@ -83,6 +190,8 @@ class Mobject(Container):
         for mobject in mobjects:
             if mobject in self.submobjects:
                 self.submobjects.remove(mobject)
+        self.increment_version()
+        self.increment_structure_version()
         return self
 
     def get_array_attrs(self):
@@ -129,9 +238,15 @@ class Mobject(Container):
 
         copy_mobject = copy.copy(self)
         copy_mobject.points = np.array(self.points)
-        copy_mobject.submobjects = [submob.copy() for submob in self.submobjects]
-        copy_mobject.updaters = list(self.updaters)
-        family = self.get_family()
+        # The copy is in no family yet, so no cache can depend on its
+        # structure, and only its own structure stamp changes
+        copy_mobject.__dict__.update(
+            submobjects=[submob.copy() for submob in self.submobjects],
+            updaters=list(self.updaters),
+            _structure_stamp=next(_version_counter),
+        )
+        copy_mobject.updater_takes_dt = dict(self.updater_takes_dt)
+        family = set(self.get_family())
         for attr, value in list(self.__dict__.items()):
             if isinstance(value, Mobject) and value in family and value is not self:
                 setattr(copy_mobject, attr, value.copy())
@@ -156,8 +271,7 @@ class Mobject(Container):
         if self.updating_suspended:
             return self
         for updater in self.updaters:
-            parameters = get_parameters(updater)
-            if "dt" in parameters:
+            if self.is_time_based_updater(updater):
                 updater(self, dt)
             else:
                 updater(self)
@@ -166,12 +280,53 @@ class Mobject(Container):
                 submob.update(dt, recursive)
         return self
 
+    def get_updater_calls(self, calls=None):
+        """Lists the calls to updaters made by :meth:`update`, in order.
+
+        Parameters
+        ----------
+        calls : :class:`list`, optional
+            A list to append the calls to, instead of a new one.
+
+        Returns
+        -------
+        :class:`list`
+            Tuples ``(mobject, updater, takes_dt, end)``, where ``takes_dt``
+            tells whether ``updater`` is called with ``dt`` and ``end`` is
+            the index in the list following the calls made for the family
+            of ``mobject``.
+        """
+        if calls is None:
+            calls = []
+        if self.updating_suspended:
+            return calls
+        start = len(calls)
+        calls.extend([None] * len(self.updaters))
+        for submob in self.submobjects:
+            submob.get_updater_calls(calls)
+        end = len(calls)
+        calls[start : start + len(self.updaters)] = [
+            (self, updater, self.is_time_based_updater(updater), end)
+            for updater in self.updaters
+        ]
+        return calls
+
+    def is_time_based_updater(self, updater):
+        takes_dt = self.updater_takes_dt.get(updater)
+        if takes_dt is None:
+            # Added to self.updaters without add_updater
+            takes_dt = "dt" in get_parameters(updater)
+            self.updater_takes_dt[updater] = takes_dt
+        return takes_dt
+
     def get_time_based_updaters(self):
-        return [updater for updater in self.updaters if "dt" in get_parameters(updater)]
+        return [
+            updater for updater in self.updaters if self.is_time_based_updater(updater)
+        ]
 
     def has_time_based_updater(self):
         for updater in self.updaters:
-            if "dt" in get_parameters(updater):
+            if self.is_time_based_updater(updater):
                 return True
         return False
 
@@ -186,6 +341,9 @@ class Mobject(Container):
             self.updaters.append(update_function)
         else:
             self.updaters.insert(index, update_function)
+        self.updater_takes_dt[update_function] = "dt" in get_parameters(update_function)
+        self.increment_version()
+        self.increment_structure_version()
         if call_updater:
             self.update(0)
         return self
@@ -193,10 +351,14 @@ class Mobject(Container):
     def remove_updater(self, update_function):
         while update_function in self.updaters:
             self.updaters.remove(update_function)
+        self.updater_takes_dt.pop(update_function, None)
+        self.increment_version()
+        self.increment_structure_version()
         return self
 
     def clear_updaters(self, recursive=True):
         self.updaters = []
+        self.updater_takes_dt = {}
         if recursive:
             for submob in self.submobjects:
                 submob.clear_updaters()
@@ -707,9 +869,71 @@ class Mobject(Container):
     def get_num_points(self):
         return len(self.points)
 
+    def get_points_bounds(self):
+        """Returns the smallest and largest coordinates of the points of the
+        mobject, without its submobjects.  They are cached until the version
+        of the mobject changes, see :meth:`get_version`.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or None
+            The array ``[mins, maxs]``, or None if the mobject has no points.
+        """
+        cache = self.__dict__.get("_points_bounds")
+        if cache is None or cache[0] != self.get_version():
+            points = self.points
+            bounds = None
+            if len(points) > 0:
+                bounds = np.array([points.min(0), points.max(0)])
+            cache = (self.get_version(), bounds)
+            # Written directly in __dict__, as caching is not a mutation
+            self.__dict__["_points_bounds"] = cache
+        return cache[1]
+
+    def get_family_bounds(self, get_bounds=None):
+        """Returns the smallest and largest coordinates of the points of the
+        family of the mobject.  They are cached until the version of one of
+        its mobjects changes, so that the points of the family aren't
+        gathered again by each layout method called in between.
+
+        Parameters
+        ----------
+        get_bounds : callable, optional
+            The function giving the bounds of each mobject of the family,
+            :meth:`get_points_bounds` by default.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or None
+            The array ``[mins, maxs]``, or None if the family has no points.
+        """
+        if get_bounds is None:
+            get_bounds = Mobject.get_points_bounds
+        family = self.get_family()
+        versions = tuple(mob.get_version() for mob in family)
+        caches = self.__dict__.get("_family_bounds", {})
+        cache = caches.get(get_bounds.__name__)
+        if cache is None or cache[0] != versions:
+            all_bounds = [get_bounds(mob) for mob in family]
+            all_bounds = [bounds for bounds in all_bounds if bounds is not None]
+            bounds = None
+            if len(all_bounds) > 0:
+                all_bounds = np.array(all_bounds)
+                bounds = np.array([all_bounds[:, 0].min(0), all_bounds[:, 1].max(0)])
+            cache = (versions, bounds)
+            # Replaced rather than updated, as copy.copy shares it
+            self.__dict__["_family_bounds"] = {**caches, get_bounds.__name__: cache}
+        return cache[1]
+
+    def get_boundary_bounds(self):
+        """Same as :meth:`get_family_bounds`, for the points given by
+        :meth:`get_points_defining_boundary`."""
+        return self.get_family_bounds()
+
     def get_extremum_along_dim(self, points=None, dim=0, key=0):
         if points is None:
-            points = self.get_points_defining_boundary()
+            bounds = self.get_boundary_bounds()
+            points = self.get_points_defining_boundary() if bounds is None else bounds
         values = points[:, dim]
         if key < 0:
             return np.min(values)
@@ -724,15 +948,15 @@ class Mobject(Container):
         9 'critical points': 4 corners, 4 edge center, the
         center.  This returns one of them.
         """
-        result = np.zeros(self.dim)
-        all_points = self.get_points_defining_boundary()
-        if len(all_points) == 0:
-            return result
-        for dim in range(self.dim):
-            result[dim] = self.get_extremum_along_dim(
-                all_points, dim=dim, key=direction[dim]
-            )
-        return result
+        bounds = self.get_boundary_bounds()
+        if bounds is None:
+            return np.zeros(self.dim)
+        # Same as get_extremum_along_dim, along all the dimensions at once
+        mins, maxs = bounds
+        direction = np.asarray(direction)
+        return np.where(
+            direction < 0, mins, np.where(direction > 0, maxs, (mins + maxs) / 2)
+        )
 
     # Pseudonyms for more general get_critical_point method
 
@@ -772,9 +996,10 @@ class Mobject(Container):
         return self.get_edge_center(IN)
 
     def length_over_dim(self, dim):
-        return self.reduce_across_dimension(
-            np.max, np.max, dim
-        ) - self.reduce_across_dimension(np.min, np.min, dim)
+        bounds = self.get_family_bounds()
+        if bounds is None:
+            return 0
+        return bounds[1, dim] - bounds[0, dim]
 
     def get_width(self):
         return self.length_over_dim(0)
@@ -910,9 +1135,54 @@ class Mobject(Container):
         return result + self.submobjects
 
     def get_family(self):
-        sub_families = list(map(Mobject.get_family, self.submobjects))
-        all_mobjects = [self] + list(it.chain(*sub_families))
-        return remove_list_redundancies(all_mobjects)
+        return [self, *self.get_descendants()]
+
+    def get_descendants(self):
+        """Returns the family of the mobject, without the mobject itself.
+
+        The list is cached until the structure of one of the mobjects of the
+        family changes (see :meth:`get_structure_stamp`), so that the family
+        is only walked again after submobjects are added or removed, and must
+        not be modified.  Modifying ``submobjects`` in place (e.g. with
+        ``append``, ``insert`` or ``reverse``) must thus be followed by a call
+        to :meth:`increment_structure_version`, otherwise the family, and
+        everything acting on it such as :meth:`shift` or :meth:`scale`,
+        does not see the change.
+
+        Returns
+        -------
+        :class:`list`
+            The submobjects of the mobject, their submobjects and so on.
+        """
+        cache = self.__dict__.get("_family_cache")
+        # Also checks the owner of the cache, which copy.copy shares
+        if cache is not None and cache[1] == id(self):
+            if cache[0] == _structure_version:
+                return cache[2]
+            family = [self, *cache[2]]
+            if all(
+                mob.get_structure_stamp() == stamp
+                for mob, stamp in zip(family, cache[3])
+            ):
+                # Only other mobjects changed
+                self.__dict__["_family_cache"] = (_structure_version, *cache[1:])
+                return cache[2]
+        all_mobjects = [self]
+        for submob in self.submobjects:
+            all_mobjects.append(submob)
+            all_mobjects.extend(submob.get_descendants())
+        descendants = remove_list_redundancies(all_mobjects)
+        # Not a mobject of its own family, unless the tree has a cycle
+        descendants.remove(self)
+        stamps = tuple(mob.get_structure_stamp() for mob in [self, *descendants])
+        # Written directly in __dict__, as caching is not a mutation
+        self.__dict__["_family_cache"] = (
+            _structure_version,
+            id(self),
+            descendants,
+            stamps,
+        )
+        return descendants
 
     def family_members_with_points(self):
         return [m for m in self.get_family() if m.get_num_points() > 0]
@@ -949,6 +1219,8 @@ class Mobject(Container):
         if submob_func is None:
             submob_func = lambda m: point_to_num_func(m.get_center())
         self.submobjects.sort(key=submob_func)
+        self.increment_version()
+        self.increment_structure_version()
         return self
 
     def shuffle(self, recursive=False):
@@ -956,6 +1228,8 @@ class Mobject(Container):
             for submob in self.submobjects:
                 submob.shuffle(recursive=True)
         random.shuffle(self.submobjects)
+        self.increment_version()
+        self.increment_structure_version()
 
     # Just here to keep from breaking old scenes.
     def arrange_submobjects(self, *args, **kwargs):
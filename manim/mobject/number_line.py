@@ -109,6 +109,17 @@ class NumberLine(Line):
             alpha,
         )
 
+    def numbers_to_points(self, numbers):
+        """Same as number_to_point, for an array of numbers at once."""
+        alpha = (np.asarray(numbers, dtype=float) - self.x_min) / (
+            self.x_max - self.x_min
+        )
+        return interpolate(
+            self.get_start() + self.add_start * RIGHT,
+            self.get_end() - self.add_end * RIGHT,
+            alpha[..., np.newaxis],
+        )
+
     def point_to_number(self, point):
         start_point, end_point = self.get_start_and_end()
         full_vect = end_point - start_point
@@ -1,7 +1,12 @@
 from ..constants import *
+from ..config import config
 from ..mobject.svg.tex_mobject import SingleStringTexMobject
 from ..mobject.types.vectorized_mobject import VMobject
 
+# Glyphs of DecimalNumbers and their bounding boxes, by tex string and style,
+# see DecimalNumber.get_glyphs
+glyph_cache = {}
+
 
 class DecimalNumber(VMobject):
     CONFIG = {
@@ -20,6 +25,27 @@ class DecimalNumber(VMobject):
         self.number = number
         self.initial_config = kwargs
 
+        num_string = self.get_num_string(number)
+        glyphs = self.get_glyphs(num_string, **kwargs)
+
+        # Add non-numerical bits
+        if self.show_ellipsis:
+            glyphs += self.get_glyphs(["\\dots"])
+
+        if self.unit is not None:
+            glyphs += self.get_glyphs([self.unit], color=self.color)
+
+        self.add(*[glyph for glyph, bounding_boxes in glyphs])
+        if self.unit is not None:
+            self.unit_sign = self.submobjects[-1]
+        self.arrange_glyphs(
+            num_string, np.array([bounding_boxes for glyph, bounding_boxes in glyphs])
+        )
+        #
+        if self.include_background_rectangle:
+            self.add_background_rectangle()
+
+    def get_num_string(self, number):
         if isinstance(number, complex):
             formatter = self.get_complex_formatter()
         else:
@@ -32,36 +58,95 @@ class DecimalNumber(VMobject):
                 num_string = "+" + num_string[1:]
             else:
                 num_string = num_string[1:]
+        return num_string
 
-        self.add(*[SingleStringTexMobject(char, **kwargs) for char in num_string])
+    def get_glyphs(self, tex_strings, **kwargs):
+        """
+        Returns copies of SingleStringTexMobject(tex_string, **kwargs) for
+        each tex string, which are only built once for each tex string and
+        style, along with their bounding boxes, as numbers are often updated
+        on every frame.
+
+        Returns
+        -------
+        List[Tuple[:class:`SingleStringTexMobject`, :class:`numpy.ndarray`]]
+            Each glyph, and the minimum and maximum coordinates of its anchors
+            then of all its points, of shape (4, 3).
+        """
+        style = (config["tex_template"].body, repr(sorted(kwargs.items())))
+        result = []
+        for tex_string in tex_strings:
+            key = (tex_string, style)
+            if key not in glyph_cache:
+                glyph = SingleStringTexMobject(tex_string, **kwargs)
+                anchors = glyph.get_points_defining_boundary()
+                points = glyph.get_all_points()
+                glyph_cache[key] = (
+                    glyph,
+                    np.array(
+                        [anchors.min(0), anchors.max(0), points.min(0), points.max(0)]
+                    ),
+                )
+            glyph, bounding_boxes = glyph_cache[key]
+            result.append((glyph.copy(), bounding_boxes.copy()))
+        return result
+
+    def arrange_glyphs(self, num_string, bounding_boxes):
+        """
+        Arranges the glyphs in a row, aligned to the bottom except for signs
+        and commas. This gives the same result as calling arrange, next_to and
+        align_to on the glyphs, but reads the coordinates needed from their
+        bounding boxes (see get_glyphs), shifted along with them, instead of
+        from their points.
+        """
+        glyphs = self.submobjects
+        buff = self.digit_to_digit_buff
 
-        # Add non-numerical bits
-        if self.show_ellipsis:
-            self.add(SingleStringTexMobject("\\dots"))
+        def shift(i, vector):
+            glyphs[i].shift(vector)
+            bounding_boxes[i] += vector
 
-        if num_string.startswith("-"):
-            minus = self.submobjects[0]
-            minus.next_to(self.submobjects[1], LEFT, buff=self.digit_to_digit_buff)
+        def get_critical_point(i, direction):
+            anchors_min, anchors_max = bounding_boxes[i, 0], bounding_boxes[i, 1]
+            return np.where(
+                direction < 0,
+                anchors_min,
+                np.where(direction > 0, anchors_max, (anchors_min + anchors_max) / 2),
+            )
 
-        if self.unit is not None:
-            self.unit_sign = SingleStringTexMobject(self.unit, color=self.color)
-            self.add(self.unit_sign)
+        def get_height(i):
+            return bounding_boxes[i, 3, 1] - bounding_boxes[i, 2, 1]
 
-        self.arrange(buff=self.digit_to_digit_buff, aligned_edge=DOWN)
+        if num_string.startswith("-"):
+            # next_to(glyphs[1], LEFT)
+            vector = get_critical_point(1, LEFT) - get_critical_point(0, RIGHT)
+            shift(0, vector + buff * LEFT)
+
+        # arrange(aligned_edge=DOWN)
+        for i in range(1, len(glyphs)):
+            vector = get_critical_point(i - 1, DR) - get_critical_point(i, DL)
+            shift(i, vector + buff * RIGHT)
+        anchors_min = bounding_boxes[:, 0].min(0)
+        anchors_max = bounding_boxes[:, 1].max(0)
+        center = (anchors_min + anchors_max) / 2
+        for i in range(len(glyphs)):
+            shift(i, -center)
 
         # Handle alignment of parts that should be aligned
         # to the bottom
         for i, c in enumerate(num_string):
             if c == "-" and len(num_string) > i + 1:
-                self[i].align_to(self[i + 1], UP)
-                self[i].shift(self[i + 1].get_height() * DOWN / 2)
+                # align_to(glyphs[i + 1], UP)
+                top = bounding_boxes[i + 1, 1, 1] - bounding_boxes[i, 1, 1]
+                shift(i, np.array([0, top, 0]))
+                shift(i, get_height(i + 1) * DOWN / 2)
             elif c == ",":
-                self[i].shift(self[i].get_height() * DOWN / 2)
+                shift(i, get_height(i) * DOWN / 2)
         if self.unit and self.unit.startswith("^"):
-            self.unit_sign.align_to(self, UP)
-        #
-        if self.include_background_rectangle:
-            self.add_background_rectangle()
+            # align_to(self, UP)
+            top = bounding_boxes[:, 1, 1].max() - bounding_boxes[-1, 1, 1]
+            shift(-1, np.array([0, top, 0]))
+        return self
 
     def get_formatter(self, **kwargs):
         """
@@ -111,7 +196,7 @@ class DecimalNumber(VMobject):
         # Make sure last digit has constant height
         new_decimal.scale(self[-1].get_height() / new_decimal[-1].get_height())
         new_decimal.move_to(self, self.edge_to_fix)
-        new_decimal.match_style(self)
+        new_decimal.copy_style_of(self)
 
         old_family = self.get_family()
         self.submobjects = new_decimal.submobjects
@@ -119,6 +204,7 @@ class DecimalNumber(VMobject):
             # Dumb hack...due to how scene handles families
             # of animated mobjects
             mob.points[:] = 0
+            mob.increment_version()
         self.number = number
         return self
 
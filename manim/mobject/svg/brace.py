@@ -105,6 +105,7 @@ class BraceLabel(VMobject):
         self.brace = Brace(obj, self.brace_direction, **kwargs)
         self.brace.put_at_tip(self.label)
         self.submobjects[0] = self.brace
+        self.increment_structure_version()
         return self
 
     def change_label(self, *text, **kwargs):
@@ -114,6 +115,7 @@ class BraceLabel(VMobject):
 
         self.brace.put_at_tip(self.label)
         self.submobjects[1] = self.label
+        self.increment_structure_version()
         return self
 
     def change_brace_label(self, obj, *text):
@@ -474,6 +474,7 @@ class ThoughtBubble(Bubble):
     def __init__(self, **kwargs):
         Bubble.__init__(self, **kwargs)
         self.submobjects.sort(key=lambda m: m.get_bottom()[1])
+        self.increment_structure_version()
 
     def make_green_screen(self):
         self.submobjects[-1].set_fill(GREEN_SCREEN, opacity=1)
@@ -1,10 +1,11 @@
+import hashlib
 import itertools as it
 import re
 import os
 import string
 import warnings
 
-from xml.dom import minidom
+from xml.etree import ElementTree
 
 from ...constants import *
 from ...mobject.geometry import Circle
@@ -12,6 +13,7 @@ from ...mobject.geometry import Rectangle
 from ...mobject.geometry import RoundedRectangle
 from ...mobject.types.vectorized_mobject import VGroup
 from ...mobject.types.vectorized_mobject import VMobject
+from ...utils.bezier import interpolate
 from ...utils.color import *
 from ...utils.config_ops import digest_config
 from ...utils.config_ops import digest_locals
@@ -23,6 +25,130 @@ def string_to_numbers(num_string):
     return [float(s) for s in re.split("[ ,]", num_string) if s != ""]
 
 
+# Tokens of svg path data, see VMobjectFromSVGPathstring.path_string_to_points
+NUMBER_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+# The flags of arcs may not be separated from the next number
+ARC_ARGUMENTS_RE = re.compile(
+    r"[\s,]*".join(["(%s)" % NUMBER_RE.pattern] * 3 + ["([01])"] * 2)
+    + r"[\s,]*"
+    + r"[\s,]*".join(["(%s)" % NUMBER_RE.pattern] * 2)
+)
+# Numbers taken by each command, which can be repeated
+PATH_COMMAND_SIZES = {
+    "M": 2,
+    "L": 2,
+    "H": 1,
+    "V": 1,
+    "C": 6,
+    "S": 4,
+    "Q": 4,
+    "T": 2,
+    "A": 7,
+    "Z": 0,
+}
+LINE_SEGMENT = 0
+CUBIC_SEGMENT = 1
+QUADRATIC_SEGMENT = 2
+ARC_SEGMENT = 3
+# Same handles as VMobject.add_line_to
+LINE_HANDLE_ALPHAS = np.linspace(0, 1, 4)
+
+
+def elliptical_arcs_to_cubics(starts, ends, parameters):
+    """
+    Approximates elliptical arcs, as described by svg path data, with cubic
+    bezier curves spanning at most a quarter of their ellipses.
+
+    Parameters
+    ----------
+    starts : :class:`numpy.ndarray`
+        The start points of the arcs, of shape (n, 2).
+    ends : :class:`numpy.ndarray`
+        The end points of the arcs, of shape (n, 2), which must differ from
+        the start points.
+    parameters : :class:`numpy.ndarray`
+        The radii, x axis rotation (in degrees), large arc flag and sweep
+        flag of each arc, of shape (n, 5).
+
+    Returns
+    -------
+    Tuple[:class:`numpy.ndarray`, :class:`numpy.ndarray`]
+        The control points of the curves, of shape (k, 4, 2), and the number
+        of curves of each arc.
+    """
+    # See the implementation notes of the svg specification, F.6.5
+    rx, ry, rotation, large_arc, sweep = parameters.T
+    rx, ry = np.abs(rx), np.abs(ry)
+    cos, sin = np.cos(rotation * DEGREES), np.sin(rotation * DEGREES)
+    half_dx, half_dy = ((starts - ends) / 2).T
+    x1 = cos * half_dx + sin * half_dy
+    y1 = -sin * half_dx + cos * half_dy
+    # Radii too small to join the points are scaled up
+    scale = np.sqrt(np.maximum(1, (x1 / rx) ** 2 + (y1 / ry) ** 2))
+    rx, ry = rx * scale, ry * scale
+    numerator = (rx * ry) ** 2 - (rx * y1) ** 2 - (ry * x1) ** 2
+    denominator = (rx * y1) ** 2 + (ry * x1) ** 2
+    factor = np.sqrt(np.maximum(0, numerator) / denominator)
+    factor[large_arc == sweep] *= -1
+    center_x1, center_y1 = factor * rx * y1 / ry, -factor * ry * x1 / rx
+    centers = (
+        np.transpose(
+            [cos * center_x1 - sin * center_y1, sin * center_x1 + cos * center_y1,]
+        )
+        + (starts + ends) / 2
+    )
+    start_angles = np.arctan2((y1 - center_y1) / ry, (x1 - center_x1) / rx)
+    end_angles = np.arctan2((-y1 - center_y1) / ry, (-x1 - center_x1) / rx)
+    angles = (end_angles - start_angles) % TAU
+    angles[(sweep == 0) & (angles > 0)] -= TAU
+    counts = np.maximum(1, np.ceil(np.abs(angles) / (TAU / 4) - 1e-9)).astype(int)
+
+    # Curves on the unit circle, then stretched onto the ellipses
+    arc_indices = np.repeat(np.arange(len(counts)), counts)
+    curve_indices = np.arange(len(arc_indices)) - np.repeat(
+        np.cumsum(counts) - counts, counts
+    )
+    step = (angles / counts)[arc_indices]
+    angles1 = start_angles[arc_indices] + curve_indices * step
+    angles2 = angles1 + step
+    handle_length = 4 / 3 * np.tan(step / 4)
+    xs = np.transpose(
+        [
+            np.cos(angles1),
+            np.cos(angles1) - handle_length * np.sin(angles1),
+            np.cos(angles2) + handle_length * np.sin(angles2),
+            np.cos(angles2),
+        ]
+    )
+    ys = np.transpose(
+        [
+            np.sin(angles1),
+            np.sin(angles1) + handle_length * np.cos(angles1),
+            np.sin(angles2) - handle_length * np.cos(angles2),
+            np.sin(angles2),
+        ]
+    )
+    xs *= rx[arc_indices, np.newaxis]
+    ys *= ry[arc_indices, np.newaxis]
+    cos, sin = cos[arc_indices, np.newaxis], sin[arc_indices, np.newaxis]
+    curves = np.stack([cos * xs - sin * ys, sin * xs + cos * ys], axis=-1)
+    curves += centers[arc_indices, np.newaxis]
+    # The anchors at both ends are exactly the given points
+    first_curves = np.cumsum(counts) - counts
+    curves[first_curves, 0] = starts
+    curves[first_curves + counts - 1, 3] = ends
+    return curves, counts
+
+
+def get_tag(element):
+    # Strips the namespace ElementTree prepends to tags and attributes
+    return element.tag.rpartition("}")[2]
+
+
+# Mobjects parsed from svg files, see SVGMobject.generate_points
+svg_mobjects_cache = {}
+
+
 class SVGMobject(VMobject):
     CONFIG = {
         "should_center": True,
@@ -59,45 +185,61 @@ class SVGMobject(VMobject):
         raise IOError("No file matching %s in image directory" % self.file_name)
 
     def generate_points(self):
-        doc = minidom.parse(self.file_path)
+        # Parsing is slow, and the same files are often used again and again
+        # (e.g. for the digits of DecimalNumbers), so the parsed mobjects are
+        # cached and copied
+        key = self.get_svg_cache_key()
+        if key not in svg_mobjects_cache:
+            svg_mobjects_cache[key] = self.parse_svg_file()
+        self.add(*[mob.copy() for mob in svg_mobjects_cache[key]])
+
+    def get_svg_cache_key(self):
+        with open(self.file_path, "rb") as svg_file:
+            content_hash = hashlib.blake2b(svg_file.read(), digest_size=16).digest()
+        # Subclasses may parse the same file differently
+        return (type(self), self.unpack_groups, content_hash)
+
+    def parse_svg_file(self):
+        # ElementTree is much faster and lighter than minidom on large files
+        root = ElementTree.parse(self.file_path).getroot()
         self.ref_to_element = {}
-        for svg in doc.getElementsByTagName("svg"):
+        result = []
+        for svg in root.iter():
+            if get_tag(svg) != "svg":
+                continue
             mobjects = self.get_mobjects_from(svg)
             if self.unpack_groups:
-                self.add(*mobjects)
+                result += mobjects
             else:
-                self.add(*mobjects[0].submobjects)
-        doc.unlink()
+                result += mobjects[0].submobjects
+        return result
 
     def get_mobjects_from(self, element):
         result = []
-        if not isinstance(element, minidom.Element):
-            return result
-        if element.tagName == "defs":
+        tag = get_tag(element)
+        if tag == "defs":
             self.update_ref_to_element(element)
-        elif element.tagName == "style":
+        elif tag == "style":
             pass  # TODO, handle style
-        elif element.tagName in ["g", "svg", "symbol"]:
-            result += it.chain(
-                *[self.get_mobjects_from(child) for child in element.childNodes]
-            )
-        elif element.tagName == "path":
-            temp = element.getAttribute("d")
+        elif tag in ["g", "svg", "symbol"]:
+            result += it.chain(*[self.get_mobjects_from(child) for child in element])
+        elif tag == "path":
+            temp = element.get("d", "")
             if temp != "":
                 result.append(self.path_string_to_mobject(temp))
-        elif element.tagName == "use":
+        elif tag == "use":
             result += self.use_to_mobjects(element)
-        elif element.tagName == "rect":
+        elif tag == "rect":
             result.append(self.rect_to_mobject(element))
-        elif element.tagName == "circle":
+        elif tag == "circle":
             result.append(self.circle_to_mobject(element))
-        elif element.tagName == "ellipse":
+        elif tag == "ellipse":
             result.append(self.ellipse_to_mobject(element))
-        elif element.tagName in ["polygon", "polyline"]:
+        elif tag in ["polygon", "polyline"]:
             result.append(self.polygon_to_mobject(element))
         else:
             pass  # TODO
-            # warnings.warn("Unknown element type: " + element.tagName)
+            # warnings.warn("Unknown element type: " + tag)
         result = [m for m in result if m is not None]
         self.handle_transforms(element, VGroup(*result))
         if len(result) > 1 and not self.unpack_groups:
@@ -115,7 +257,8 @@ class SVGMobject(VMobject):
 
     def use_to_mobjects(self, use_element):
         # Remove initial "#" character
-        ref = use_element.getAttribute("xlink:href")[1:]
+        href = use_element.get("{http://www.w3.org/1999/xlink}href")
+        ref = (href or use_element.get("href", ""))[1:]
         if ref not in self.ref_to_element:
             warnings.warn("%s not recognized" % ref)
             return VGroup()
@@ -129,7 +272,7 @@ class SVGMobject(VMobject):
 
     def polygon_to_mobject(self, polygon_element):
         # TODO, This seems hacky...
-        path_string = polygon_element.getAttribute("points")
+        path_string = polygon_element.get("points", "")
         for digit in string.digits:
             path_string = path_string.replace(" " + digit, " L" + digit)
         path_string = "M" + path_string
@@ -139,8 +282,8 @@ class SVGMobject(VMobject):
 
     def circle_to_mobject(self, circle_element):
         x, y, r = [
-            self.attribute_to_float(circle_element.getAttribute(key))
-            if circle_element.hasAttribute(key)
+            self.attribute_to_float(circle_element.get(key))
+            if key in circle_element.attrib
             else 0.0
             for key in ("cx", "cy", "r")
         ]
@@ -148,18 +291,18 @@ class SVGMobject(VMobject):
 
     def ellipse_to_mobject(self, circle_element):
         x, y, rx, ry = [
-            self.attribute_to_float(circle_element.getAttribute(key))
-            if circle_element.hasAttribute(key)
+            self.attribute_to_float(circle_element.get(key))
+            if key in circle_element.attrib
             else 0.0
             for key in ("cx", "cy", "rx", "ry")
         ]
         return Circle().scale(rx * RIGHT + ry * UP).shift(x * RIGHT + y * DOWN)
 
     def rect_to_mobject(self, rect_element):
-        fill_color = rect_element.getAttribute("fill")
-        stroke_color = rect_element.getAttribute("stroke")
-        stroke_width = rect_element.getAttribute("stroke-width")
-        corner_radius = rect_element.getAttribute("rx")
+        fill_color = rect_element.get("fill", "")
+        stroke_color = rect_element.get("stroke", "")
+        stroke_width = rect_element.get("stroke-width", "")
+        corner_radius = rect_element.get("rx", "")
 
         # input preprocessing
         if fill_color in ["", "none", "#FFF", "#FFFFFF"] or Color(fill_color) == Color(
@@ -186,8 +329,8 @@ class SVGMobject(VMobject):
 
         if corner_radius == 0:
             mob = Rectangle(
-                width=self.attribute_to_float(rect_element.getAttribute("width")),
-                height=self.attribute_to_float(rect_element.getAttribute("height")),
+                width=self.attribute_to_float(rect_element.get("width", "")),
+                height=self.attribute_to_float(rect_element.get("height", "")),
                 stroke_width=stroke_width,
                 stroke_color=stroke_color,
                 fill_color=fill_color,
@@ -195,8 +338,8 @@ class SVGMobject(VMobject):
             )
         else:
             mob = RoundedRectangle(
-                width=self.attribute_to_float(rect_element.getAttribute("width")),
-                height=self.attribute_to_float(rect_element.getAttribute("height")),
+                width=self.attribute_to_float(rect_element.get("width", "")),
+                height=self.attribute_to_float(rect_element.get("height", "")),
                 stroke_width=stroke_width,
                 stroke_color=stroke_color,
                 fill_color=fill_color,
@@ -210,14 +353,14 @@ class SVGMobject(VMobject):
     def handle_transforms(self, element, mobject):
         x, y = 0, 0
         try:
-            x = self.attribute_to_float(element.getAttribute("x"))
+            x = self.attribute_to_float(element.get("x", ""))
             # Flip y
-            y = -self.attribute_to_float(element.getAttribute("y"))
+            y = -self.attribute_to_float(element.get("y", ""))
             mobject.shift(x * RIGHT + y * UP)
         except:
             pass
 
-        transform = element.getAttribute("transform")
+        transform = element.get("transform", "")
 
         try:  # transform matrix
             prefix = "matrix("
@@ -278,18 +421,15 @@ class SVGMobject(VMobject):
         return output_list
 
     def get_all_childNodes_have_id(self, element):
-        all_childNodes_have_id = []
-        if not isinstance(element, minidom.Element):
-            return
-        if element.hasAttribute("id"):
+        if "id" in element.attrib:
             return [element]
-        for e in element.childNodes:
-            all_childNodes_have_id.append(self.get_all_childNodes_have_id(e))
-        return self.flatten([e for e in all_childNodes_have_id if e])
+        return self.flatten(
+            [self.get_all_childNodes_have_id(child) for child in element]
+        )
 
     def update_ref_to_element(self, defs):
         new_refs = dict(
-            [(e.getAttribute("id"), e) for e in self.get_all_childNodes_have_id(defs)]
+            [(e.get("id"), e) for e in self.get_all_childNodes_have_id(defs)]
         )
         self.ref_to_element.update(new_refs)
 
@@ -324,96 +464,166 @@ class VMobjectFromSVGPathstring(VMobject):
         return result
 
     def generate_points(self):
-        pattern = "[%s]" % ("".join(self.get_path_commands()))
-        pairs = list(
-            zip(
-                re.findall(pattern, self.path_string),
-                re.split(pattern, self.path_string)[1:],
-            )
-        )
-        # Which mobject should new points be added to
-        self = self
-        for command, coord_string in pairs:
-            self.handle_command(command, coord_string)
+        self.points = self.path_string_to_points(self.path_string)
         # people treat y-coordinate differently
         self.rotate(np.pi, RIGHT, about_point=ORIGIN)
 
-    def handle_command(self, command, coord_string):
-        isLower = command.islower()
-        command = command.upper()
-        # new_points are the points that will be added to the curr_points
-        # list. This variable may get modified in the conditionals below.
-        points = self.points
-        new_points = self.string_to_points(coord_string)
-
-        if isLower and len(points) > 0:
-            new_points += points[-1]
-
-        if command == "M":  # moveto
-            self.start_new_path(new_points[0])
-            if len(new_points) <= 1:
-                return
-
-            # Draw relative line-to values.
-            points = self.points
-            new_points = new_points[1:]
-            command = "L"
-
-            for p in new_points:
-                if isLower:
-                    # Treat everything as relative line-to until empty
-                    p[0] += self.points[-1, 0]
-                    p[1] += self.points[-1, 1]
-                self.add_line_to(p)
-            return
-
-        elif command in ["L", "H", "V"]:  # lineto
-            if command == "H":
-                new_points[0, 1] = points[-1, 1]
-            elif command == "V":
-                if isLower:
-                    new_points[0, 0] -= points[-1, 0]
-                    new_points[0, 0] += points[-1, 1]
-                new_points[0, 1] = new_points[0, 0]
-                new_points[0, 0] = points[-1, 0]
-            self.add_line_to(new_points[0])
-            return
-
-        if command == "C":  # curveto
-            pass  # Yay! No action required
-        elif command in ["S", "T"]:  # smooth curveto
-            self.add_smooth_curve_to(*new_points)
-            # handle1 = points[-1] + (points[-1] - points[-2])
-            # new_points = np.append([handle1], new_points, axis=0)
-            return
-        elif command == "Q":  # quadratic Bezier curve
-            # TODO, this is a suboptimal approximation
-            new_points = np.append([new_points[0]], new_points, axis=0)
-        elif command == "A":  # elliptical Arc
-            raise Exception("Not implemented")
-        elif command == "Z":  # closepath
-            return
-
-        # Add first three points
-        self.add_cubic_bezier_curve_to(*new_points[0:3])
-
-        # Handle situations where there's multiple relative control points
-        if len(new_points) > 3:
-            # Add subsequent offset points relatively.
-            for i in range(3, len(new_points), 3):
-                if isLower:
-                    new_points[i : i + 3] -= points[-1]
-                    new_points[i : i + 3] += new_points[i - 1]
-                self.add_cubic_bezier_curve_to(*new_points[i : i + 3])
-
-    def string_to_points(self, coord_string):
-        numbers = string_to_numbers(coord_string)
-        if len(numbers) % 2 == 1:
-            numbers.append(0)
-        num_points = len(numbers) // 2
-        result = np.zeros((num_points, self.dim))
-        result[:, :2] = np.array(numbers).reshape((num_points, 2))
-        return result
+    def path_string_to_points(self, path_string):
+        """
+        Converts svg path data into the points of cubic bezier curves.
+
+        The commands are read in a single pass, which only tracks the current
+        point and writes the coordinates of each segment in a flat buffer.
+        Lines, quadratic curves and elliptical arcs are then converted into
+        cubic curves all at once.
+        """
+        pattern = "([%s])" % ("".join(self.get_path_commands()))
+        parts = re.split(pattern, path_string)
+        # Coordinates of the 4 control points of each segment, the unused
+        # ones of lines, quadratic curves and arcs being computed afterwards
+        coords = []
+        kinds = []
+        arcs = []
+        add_coords, add_kind = coords.extend, kinds.append
+        x = y = start_x = start_y = 0.0
+        # Control points reflected by the smooth curve commands S and T
+        cubic_control = quadratic_control = None
+
+        for command, coord_string in zip(parts[1::2], parts[2::2]):
+            upper_command = command.upper()
+            if upper_command == "Z":
+                if x != start_x or y != start_y:
+                    add_coords((x, y, 0, 0, 0, 0, start_x, start_y))
+                    add_kind(LINE_SEGMENT)
+                x, y = start_x, start_y
+                cubic_control = quadratic_control = None
+                continue
+            elif upper_command == "A":
+                numbers = [
+                    float(number)
+                    for match in ARC_ARGUMENTS_RE.findall(coord_string)
+                    for number in match
+                ]
+            else:
+                numbers = list(map(float, NUMBER_RE.findall(coord_string)))
+            is_relative = command != upper_command
+            size = PATH_COMMAND_SIZES[upper_command]
+            if len(numbers) == size:
+                groups = [numbers]
+            else:
+                # Repeated command
+                groups = [
+                    numbers[i : i + size]
+                    for i in range(0, len(numbers) - size + 1, size)
+                ]
+            for values in groups:
+                if is_relative:
+                    if upper_command == "H":
+                        values[0] += x
+                    elif upper_command == "V":
+                        values[0] += y
+                    elif upper_command == "A":
+                        values[5] += x
+                        values[6] += y
+                    else:
+                        values[0::2] = [value + x for value in values[0::2]]
+                        values[1::2] = [value + y for value in values[1::2]]
+                if upper_command == "C":
+                    add_coords((x, y, *values))
+                    add_kind(CUBIC_SEGMENT)
+                    cubic_control = values[2:4]
+                    quadratic_control = None
+                    x, y = values[4:6]
+                    continue
+                elif upper_command == "M":
+                    x, y = start_x, start_y = values
+                    # The next coordinates are those of lines
+                    upper_command = "L"
+                elif upper_command in ["L", "H", "V"]:
+                    if upper_command == "H":
+                        values.append(y)
+                    elif upper_command == "V":
+                        values.insert(0, x)
+                    add_coords((x, y, 0, 0, 0, 0, *values))
+                    add_kind(LINE_SEGMENT)
+                    x, y = values
+                elif upper_command == "S":
+                    if cubic_control is None:
+                        handle_x, handle_y = x, y
+                    else:
+                        handle_x = x + (x - cubic_control[0])
+                        handle_y = y + (y - cubic_control[1])
+                    add_coords((x, y, handle_x, handle_y, *values))
+                    add_kind(CUBIC_SEGMENT)
+                    cubic_control = values[0:2]
+                    quadratic_control = None
+                    x, y = values[2:4]
+                    continue
+                elif upper_command in ["Q", "T"]:
+                    if upper_command == "T":
+                        if quadratic_control is None:
+                            values[0:0] = [x, y]
+                        else:
+                            values[0:0] = [
+                                x + (x - quadratic_control[0]),
+                                y + (y - quadratic_control[1]),
+                            ]
+                    add_coords((x, y, *values[0:2], 0, 0, *values[2:4]))
+                    add_kind(QUADRATIC_SEGMENT)
+                    cubic_control = None
+                    quadratic_control = values[0:2]
+                    x, y = values[2:4]
+                    continue
+                elif upper_command == "A":
+                    end_x, end_y = values[5:7]
+                    if end_x != x or end_y != y:
+                        add_coords((x, y, 0, 0, 0, 0, end_x, end_y))
+                        if values[0] == 0 or values[1] == 0:
+                            add_kind(LINE_SEGMENT)
+                        else:
+                            add_kind(ARC_SEGMENT)
+                            arcs.append(values[0:5])
+                    x, y = end_x, end_y
+                cubic_control = quadratic_control = None
+
+        segments = np.array(coords).reshape((-1, 4, 2))
+        kinds = np.array(kinds, dtype=int)
+        # Same handles as VMobject.add_line_to
+        is_line = kinds == LINE_SEGMENT
+        lines = segments[is_line]
+        for i, alpha in enumerate(LINE_HANDLE_ALPHAS[1:-1]):
+            lines[:, i + 1] = interpolate(lines[:, 0], lines[:, 3], alpha)
+        segments[is_line] = lines
+        if QUADRATIC_SEGMENT in kinds:
+            # Quadratic curves are exactly cubic curves with these handles
+            is_quadratic = kinds == QUADRATIC_SEGMENT
+            quadratics = segments[is_quadratic]
+            control = quadratics[:, 1].copy()
+            quadratics[:, 1] = interpolate(quadratics[:, 0], control, 2 / 3)
+            quadratics[:, 2] = interpolate(quadratics[:, 3], control, 2 / 3)
+            segments[is_quadratic] = quadratics
+        if arcs:
+            # Each arc is split into several cubic curves
+            is_arc = kinds == ARC_SEGMENT
+            arc_curves, arc_counts = elliptical_arcs_to_cubics(
+                segments[is_arc, 0], segments[is_arc, 3], np.array(arcs)
+            )
+            counts = np.ones(len(segments), dtype=int)
+            counts[is_arc] = arc_counts
+            indices = np.cumsum(counts) - counts
+            curves = np.empty((counts.sum(), 4, 2))
+            curves[indices[~is_arc]] = segments[~is_arc]
+            curves[
+                np.repeat(
+                    indices[is_arc] - (np.cumsum(arc_counts) - arc_counts), arc_counts
+                )
+                + np.arange(len(arc_curves))
+            ] = arc_curves
+            segments = curves
+
+        points = np.zeros((len(segments) * 4, self.dim))
+        points[:, :2] = segments.reshape((-1, 2))
+        return points
 
     def get_original_path_string(self):
         return self.path_string
@@ -11,6 +11,8 @@ from ...mobject.types.vectorized_mobject import VectorizedPoint
 from ...utils.config_ops import digest_config
 from ...utils.strings import split_string_list_to_isolate_substrings
 from ...utils.tex_file_writing import tex_to_svg_file
+from ...utils.tex_file_writing import tex_to_svg_files
+from ...utils.tex_file_writing import tex_to_svg_file_async
 
 TEX_MOB_SCALE_FACTOR = 0.05
 
@@ -45,6 +47,55 @@ class SingleStringTexMobject(SVGMobject):
         if self.organize_left_to_right:
             self.organize_submobjects_left_to_right()
 
+    @classmethod
+    def prefetch(cls, *mobjects_tex_strings, wait=True, **kwargs):
+        """
+        Compiles the expressions of several mobjects of this class at once,
+        which is much faster than starting LaTeX for each of them as they
+        get created. The mobjects then find their svg files in the cache.
+
+        Parameters
+        ----------
+        *mobjects_tex_strings : str or list of str
+            The tex string(s) of each mobject, as passed to its constructor.
+        wait : bool, optional
+            Whether to wait for the compilation to finish, by default True.
+            Otherwise the expressions are compiled in the background, in
+            parallel rather than in a single document, and each mobject
+            only waits for its own expressions when created.
+        **kwargs
+            The keyword arguments the mobjects are created with.
+
+        Examples
+        --------
+        ::
+
+            TexMobject.prefetch("x^2", ["a", "=", "b"])
+            square = TexMobject("x^2")
+            equation = TexMobject("a", "=", "b")
+        """
+        expressions_by_type = {}
+        for tex_strings in mobjects_tex_strings:
+            if isinstance(tex_strings, str):
+                tex_strings = [tex_strings]
+            mobject = cls.__new__(cls)
+            digest_config(mobject, kwargs)
+            for expression, source_type in mobject.get_tex_expressions(*tex_strings):
+                expressions_by_type.setdefault(source_type, []).append(expression)
+        for source_type, expressions in expressions_by_type.items():
+            if wait:
+                tex_to_svg_files(expressions, source_type)
+            else:
+                for expression in expressions:
+                    tex_to_svg_file_async(expression, source_type)
+
+    def get_tex_expressions(self, tex_string):
+        """
+        Returns the expressions compiled when creating the mobject, as
+        (expression, source_type) pairs. Used by prefetch.
+        """
+        return [(self.get_modified_expression(tex_string), self.type)]
+
     def get_modified_expression(self, tex_string):
         result = self.alignment + " " + tex_string
         result = result.strip()
@@ -146,6 +197,20 @@ class TexMobject(SingleStringTexMobject):
         if self.organize_left_to_right:
             self.organize_submobjects_left_to_right()
 
+    def get_tex_expressions(self, *tex_strings):
+        tex_strings = self.break_up_tex_strings(tex_strings)
+        expressions = SingleStringTexMobject.get_tex_expressions(
+            self, self.arg_separator.join(tex_strings)
+        )
+        # Same as the parts created by break_up_by_substrings
+        config = dict(self.CONFIG)
+        config["alignment"] = ""
+        part = SingleStringTexMobject.__new__(SingleStringTexMobject)
+        digest_config(part, config)
+        for tex_string in tex_strings:
+            expressions += part.get_tex_expressions(tex_string)
+        return expressions
+
     def break_up_tex_strings(self, tex_strings):
         substrings_to_isolate = op.add(
             self.substrings_to_isolate, list(self.tex_to_color_map.keys())
@@ -233,6 +298,8 @@ class TexMobject(SingleStringTexMobject):
 
     def sort_alphabetically(self):
         self.submobjects.sort(key=lambda m: m.get_tex_string())
+        self.increment_version()
+        self.increment_structure_version()
 
 
 class TextMobject(TexMobject):
@@ -148,6 +148,7 @@ class Text(SVGMobject):
             space.move_to(np.array([-text_width / 2, max_height / 2, 0]))
             self.next_to(space, direction=RIGHT, buff=0)
             self.submobjects.insert(0, space)
+            self.increment_structure_version()
 
         i = -1
         last_spaces_count = 0
@@ -170,6 +171,7 @@ class Text(SVGMobject):
             space.move_to(np.array([-text_width / 2, max_height / 2, 0]))
             self.next_to(space, direction=LEFT, buff=0)
             self.submobjects.append(space)
+            self.increment_structure_version()
         self.move_to(np.array([0, 0, 0]))
 
     def apply_space_chars(self):
@@ -184,6 +186,7 @@ class Text(SVGMobject):
                 space = Dot(fill_opacity=0, stroke_opacity=0)
                 space.move_to(self.submobjects[char_index - 1].get_center())
                 self.submobjects.insert(char_index, space)
+                self.increment_structure_version()
 
     def remove_last_M(self, file_name):
         with open(file_name, "r") as fpr:
@@ -352,6 +355,7 @@ class TextWithFixHeight(Text):
             width=0, height=max_height, fill_opacity=0, stroke_opacity=0, stroke_width=0
         )
         self.submobjects.append(rectangle)
+        self.increment_structure_version()
 
 
 class Paragraph(VGroup):
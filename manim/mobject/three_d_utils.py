@@ -54,3 +54,42 @@ def get_3d_vmob_start_corner_unit_normal(vmob):
 
 def get_3d_vmob_end_corner_unit_normal(vmob):
     return get_3d_vmob_unit_normal(vmob, get_3d_vmob_end_corner_index(vmob))
+
+
+def get_3d_vmobs_corners_and_unit_normals(vmobs):
+    """
+    Vectorized equivalent of the start and end corners of the vmobjects and
+    of their unit normals there, for all of them at once.
+
+    Parameters
+    ----------
+    vmobs : list
+        VMobjects with points.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        The corners and the unit normals, of shape (len(vmobs), 2, 3), with
+        the start corners first.
+    """
+    n_points = np.array([vmob.get_num_points() for vmob in vmobs])[:, np.newaxis]
+    points = np.concatenate([vmob.points for vmob in vmobs])
+    offsets = np.cumsum(n_points)[:, np.newaxis] - n_points
+
+    def get_points(indices):
+        # Clipped for the vmobjects with few points, whose normal is UP
+        return points[offsets + np.clip(indices, 0, n_points - 1)]
+
+    # Same indices as in get_3d_vmob_unit_normal
+    i = np.append(np.zeros(n_points.shape, dtype=int), (n_points - 1) // 6 * 3, axis=1)
+    im3 = np.where(i > 2, i - 3, n_points - 4)
+    ip3 = np.where(i < n_points - 3, i + 3, 3)
+    corners = get_points(i)
+    normals = np.cross(get_points(ip3) - corners, get_points(im3) - corners)
+    norms = np.sqrt((normals ** 2).sum(axis=-1))[..., np.newaxis]
+    unit_normals = np.divide(
+        normals, norms, out=np.tile(UP, normals.shape[:-1] + (1,)), where=norms > 0
+    )
+    # Those with at most two anchors
+    unit_normals[n_points[:, 0] < 8] = UP
+    return corners, unit_normals
@@ -1,7 +1,9 @@
 from ..constants import *
 from ..mobject.geometry import Square
+from ..mobject.types.mesh_mobject import MeshMobject
 from ..mobject.types.vectorized_mobject import VGroup
 from ..mobject.types.vectorized_mobject import VMobject
+from ..utils.color import color_to_rgba
 from ..utils.iterables import tuplify
 from ..utils.space_ops import z_to_vector
 
@@ -90,6 +92,81 @@ class ParametricSurface(VGroup):
             face.set_fill(colors[c_index], opacity=opacity)
 
 
+class ParametricMeshSurface(MeshMobject):
+    """
+    Same surface as ParametricSurface, but as a single MeshMobject, whose
+    faces are quadrilaterals between the images of the grid of (u, v) values,
+    rather than one ThreeDVMobject per face, so that surfaces with a high
+    resolution are fast to create and to display.  The faces are drawn from
+    back to front by the ThreeDCamera, but together, so other mobjects are
+    drawn either in front of all of them or behind all of them.
+
+    Parameters
+    ----------
+    func : callable
+        The function of u and v giving the points of the surface.  With
+        use_vectorized, it is called once, with the arrays of all the values
+        of u and v, and returns the x, y and z coordinates as arrays, or as
+        numbers for the coordinates which are constant, like
+        ``lambda u, v: (u, v, 0)``.
+    """
+
+    CONFIG = {
+        "u_min": 0,
+        "u_max": 1,
+        "v_min": 0,
+        "v_max": 1,
+        "resolution": 32,
+        "fill_color": BLUE_D,
+        "fill_opacity": 1.0,
+        "checkerboard_colors": [BLUE_D, BLUE_E],
+        "stroke_color": LIGHT_GREY,
+        "stroke_width": 0.5,
+        "use_vectorized": True,
+    }
+
+    def __init__(self, func, **kwargs):
+        self.func = func
+        MeshMobject.__init__(self, **kwargs)
+
+    get_u_values_and_v_values = ParametricSurface.get_u_values_and_v_values
+
+    def generate_points(self):
+        u_values, v_values = self.get_u_values_and_v_values()
+        u_grid, v_grid = np.meshgrid(u_values, v_values, indexing="ij")
+        if self.use_vectorized:
+            vertices = np.zeros(u_grid.shape + (self.dim,))
+            for i, coordinate in enumerate(self.func(u_grid, v_grid)):
+                vertices[..., i] = coordinate
+        else:
+            vertices = np.array(
+                [self.func(u, v) for u, v in zip(u_grid.ravel(), v_grid.ravel())]
+            )
+        # Same faces as ParametricSurface, in the same order
+        n_u, n_v = len(u_values) - 1, len(v_values) - 1
+        self.u_indices, self.v_indices = [
+            indices.ravel() for indices in np.indices((n_u, n_v))
+        ]
+        corners = self.u_indices * (n_v + 1) + self.v_indices
+        faces = np.array([corners, corners + n_v + 1, corners + n_v + 2, corners + 1])
+        self.points = vertices.reshape((-1, self.dim))
+        self.faces = faces.T
+
+    def init_colors(self):
+        MeshMobject.init_colors(self)
+        if self.checkerboard_colors:
+            self.set_fill_by_checkerboard(*self.checkerboard_colors)
+        return self
+
+    def set_fill_by_checkerboard(self, *colors, opacity=None):
+        c_indices = (self.u_indices + self.v_indices) % len(colors)
+        rgbas = np.array([color_to_rgba(color) for color in colors])
+        self.set_fill_by_face(rgbas[c_indices, :3])
+        if opacity is not None:
+            self.set_fill(opacity=opacity, family=False)
+        return self
+
+
 # Specific shapes
 
 
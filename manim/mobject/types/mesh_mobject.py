@@ -0,0 +1,238 @@
+from ...constants import *
+from ...mobject.mobject import Mobject
+from ...utils.bezier import interpolate
+from ...utils.color import color_to_rgba
+from ...utils.color import rgba_to_color
+from ...utils.iterables import stretch_array_to_length
+
+
+class MeshMobject(Mobject):
+    """
+    A mobject made of polygonal faces sharing their vertices, like a surface,
+    kept in numpy arrays rather than as one VMobject per face, so that meshes
+    with many faces are fast to create, transform and display.
+
+    The vertices are the points of the mobject, so it moves like any other,
+    and the faces are the indices of their vertices, with the same number of
+    vertices for all faces.  Each face has its own fill color, while the
+    stroke is the same for all of them.
+
+    Parameters
+    ----------
+    vertices : np.ndarray, optional
+        The vertices, of shape (n_vertices, 3).
+    faces : np.ndarray, optional
+        The indices of the vertices of each face, in order around the face,
+        of shape (n_faces, n_vertices_per_face).
+    """
+
+    CONFIG = {
+        "fill_color": None,
+        "fill_opacity": 1.0,
+        "stroke_color": None,
+        "stroke_opacity": 1.0,
+        "stroke_width": DEFAULT_STROKE_WIDTH,
+        # Whether the ThreeDCamera shades the faces depending on the light
+        # source and draws them from back to front
+        "shade_in_3d": True,
+    }
+
+    def __init__(self, vertices=None, faces=None, **kwargs):
+        Mobject.__init__(self, **kwargs)
+        if vertices is not None:
+            self.set_mesh(vertices, faces)
+
+    def reset_points(self):
+        self.points = np.zeros((0, self.dim))
+        self.faces = np.zeros((0, 4), dtype=int)
+        self.fill_rgbas = np.zeros((0, 4))
+        return self
+
+    def init_colors(self):
+        self.fill_rgbas = np.repeat(
+            [color_to_rgba(self.fill_color or self.color, self.fill_opacity)],
+            len(self.faces),
+            axis=0,
+        )
+        self.stroke_rgbas = np.array(
+            [color_to_rgba(self.stroke_color or self.color, self.stroke_opacity)]
+        )
+        return self
+
+    def set_mesh(self, vertices, faces):
+        """
+        Replaces the vertices and faces of the mesh, whose faces all get the
+        fill color of the mobject.
+        """
+        self.points = np.array(vertices, dtype=float).reshape((-1, self.dim))
+        self.faces = np.array(faces, dtype=int)
+        self.init_colors()
+        return self
+
+    def get_faces(self):
+        return self.faces
+
+    def get_num_faces(self):
+        return len(self.faces)
+
+    def get_face_vertices(self):
+        """Returns the vertices of each face, of shape (n_faces, n, 3)."""
+        return self.points[self.faces]
+
+    def get_face_centers(self):
+        """Returns the centers of the bounding boxes of the faces."""
+        vertices = self.get_face_vertices()
+        return (vertices.min(axis=1) + vertices.max(axis=1)) / 2
+
+    # Style
+
+    def set_fill(self, color=None, opacity=None, family=True):
+        if color is not None:
+            self.fill_rgbas[:, :3] = color_to_rgba(color)[:3]
+            self.fill_color = color
+        if opacity is not None:
+            self.fill_rgbas[:, 3] = opacity
+            self.fill_opacity = opacity
+        self.increment_version()
+        if family:
+            for submob in self.submobjects:
+                submob.set_fill(color, opacity, family)
+        return self
+
+    def set_stroke(self, color=None, width=None, opacity=None, family=True):
+        if color is not None:
+            self.stroke_rgbas[:, :3] = color_to_rgba(color)[:3]
+            self.stroke_color = color
+        if opacity is not None:
+            self.stroke_rgbas[:, 3] = opacity
+            self.stroke_opacity = opacity
+        if width is not None:
+            self.stroke_width = width
+        self.increment_version()
+        if family:
+            for submob in self.submobjects:
+                submob.set_stroke(color, width, opacity, family=family)
+        return self
+
+    def set_fill_by_face(self, rgbas):
+        """
+        Sets the fill color of each face.
+
+        Parameters
+        ----------
+        rgbas : np.ndarray
+            The colors of the faces, of shape (n_faces, 4), or (n_faces, 3)
+            to keep their opacities.
+        """
+        rgbas = np.array(rgbas)
+        self.fill_rgbas[:, : rgbas.shape[1]] = rgbas
+        self.increment_version()
+        return self
+
+    def set_color(self, color, family=True):
+        self.set_fill(color, family=family)
+        self.set_stroke(color, family=family)
+        self.color = color
+        return self
+
+    def set_opacity(self, opacity, family=True):
+        self.set_fill(opacity=opacity, family=family)
+        self.set_stroke(opacity=opacity, family=family)
+        return self
+
+    def fade(self, darkness=0.5, family=True):
+        factor = 1.0 - darkness
+        self.fill_rgbas[:, 3] *= factor
+        self.stroke_rgbas[:, 3] *= factor
+        self.increment_version()
+        super().fade(darkness, family)
+        return self
+
+    def get_fill_rgbas(self):
+        return self.fill_rgbas
+
+    def get_fill_color(self):
+        return rgba_to_color(self.fill_rgbas[0]) if len(self.fill_rgbas) else None
+
+    def get_fill_opacity(self):
+        return self.fill_rgbas[0, 3] if len(self.fill_rgbas) else self.fill_opacity
+
+    def get_stroke_rgbas(self, background=False):
+        return self.stroke_rgbas
+
+    def get_stroke_color(self, background=False):
+        return rgba_to_color(self.stroke_rgbas[0])
+
+    def get_stroke_width(self, background=False):
+        # The stroke of meshes is only drawn above their faces
+        return 0 if background else self.stroke_width
+
+    def get_stroke_opacity(self, background=False):
+        return self.stroke_rgbas[0, 3]
+
+    def get_color(self):
+        return self.get_fill_color() or self.get_stroke_color()
+
+    # Alignment
+
+    def align_points(self, mobject):
+        if not isinstance(mobject, MeshMobject):
+            raise Exception(
+                "Can't align {} with {}".format(
+                    self.__class__.__name__, mobject.__class__.__name__
+                )
+            )
+        if len(self.points) == len(mobject.points) and np.array_equal(
+            self.faces, mobject.faces
+        ):
+            return self
+        # Otherwise, each face gets its own vertices, and faces are repeated
+        # until both meshes have as many, with as many vertices each
+        n_faces = max(len(self.faces), len(mobject.faces))
+        n_vertices = max(self.faces.shape[1], mobject.faces.shape[1])
+        for mesh in self, mobject:
+            mesh.separate_faces(n_faces, n_vertices)
+        return self
+
+    def separate_faces(self, n_faces, n_vertices):
+        """
+        Gives each face its own vertices, and repeats faces and the last
+        vertex of each face until there are n_faces faces with n_vertices
+        vertices each, which doesn't change how the mesh looks.
+        """
+        indices = stretch_array_to_length(np.arange(len(self.faces)), n_faces)
+        faces = self.faces[indices]
+        faces = np.append(
+            faces, faces[:, -1:].repeat(n_vertices - faces.shape[1], axis=1), axis=1
+        )
+        self.points = self.points[faces].reshape((-1, self.dim))
+        self.faces = np.arange(n_faces * n_vertices).reshape((n_faces, n_vertices))
+        self.fill_rgbas = self.fill_rgbas[indices]
+        return self
+
+    def get_point_mobject(self, center=None):
+        if center is None:
+            center = self.get_center()
+        point = self.copy()
+        point.set_mesh([center], np.zeros((1, self.faces.shape[1]), dtype=int))
+        if len(self.fill_rgbas) > 0:
+            point.fill_rgbas[:] = self.fill_rgbas[0]
+        return point
+
+    def interpolate_color(self, mobject1, mobject2, alpha):
+        self.fill_rgbas = interpolate(mobject1.fill_rgbas, mobject2.fill_rgbas, alpha)
+        self.stroke_rgbas = interpolate(
+            mobject1.stroke_rgbas, mobject2.stroke_rgbas, alpha
+        )
+        self.stroke_width = interpolate(
+            mobject1.stroke_width, mobject2.stroke_width, alpha
+        )
+        return self
+
+    def pointwise_become_partial(self, mobject, a, b):
+        # Keeps the faces from the proportion a to b of the faces of mobject
+        lower_index, upper_index = [int(x * len(mobject.faces)) for x in (a, b)]
+        self.points = np.array(mobject.points)
+        self.faces = mobject.faces[lower_index:upper_index]
+        self.fill_rgbas = mobject.fill_rgbas[lower_index:upper_index]
+        return self
@@ -43,6 +43,7 @@ class PMobject(Mobject):
         mobs = self.family_members_with_points() if family else [self]
         for mob in mobs:
             mob.rgbas[:, :] = rgba
+            mob.increment_version()
         self.color = color
         return self
 
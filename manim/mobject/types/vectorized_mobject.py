@@ -10,7 +10,7 @@ from ...utils.bezier import bezier
 from ...utils.bezier import get_smooth_handle_points
 from ...utils.bezier import interpolate
 from ...utils.bezier import integer_interpolate
-from ...utils.bezier import partial_bezier_points
+from ...utils.bezier import partial_bezier_curves
 from ...utils.color import color_to_rgba
 from ...utils.iterables import make_even
 from ...utils.iterables import stretch_array_to_length
@@ -127,6 +127,7 @@ class VMobject(Mobject):
             curr_rgbas[:, :3] = rgbas[:, :3]
         if opacity is not None:
             curr_rgbas[:, 3] = rgbas[:, 3]
+        self.increment_version()
         return self
 
     def set_fill(self, color=None, opacity=None, family=True):
@@ -224,6 +225,29 @@ class VMobject(Mobject):
                 sm1.match_style(sm2)
         return self
 
+    def copy_style_of(self, vmobject, family=True):
+        """
+        Same as match_style, but copies the color arrays of vmobject directly
+        instead of converting them to colors and back, which is much faster.
+        """
+        for array_name in ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]:
+            setattr(self, array_name, np.array(getattr(vmobject, array_name)))
+        self.stroke_width = vmobject.get_stroke_width()
+        self.background_stroke_width = vmobject.get_stroke_width(background=True)
+        self.sheen_factor = vmobject.get_sheen_factor()
+        self.sheen_direction = vmobject.get_sheen_direction()
+        self.background_image_file = vmobject.get_background_image_file()
+
+        if family:
+            submobs1, submobs2 = self.submobjects, vmobject.submobjects
+            if len(submobs1) == 0:
+                return self
+            elif len(submobs2) == 0:
+                submobs2 = [vmobject]
+            for sm1, sm2 in zip(*make_even(submobs1, submobs2)):
+                sm1.copy_style_of(sm2)
+        return self
+
     def set_color(self, color, family=True):
         self.set_fill(color, family=family)
         self.set_stroke(color, family=family)
@@ -388,6 +412,7 @@ class VMobject(Mobject):
         arrays = [anchors1, handles1, handles2, anchors2]
         for index, array in enumerate(arrays):
             self.points[index::nppcc] = array
+        self.increment_version()
         return self
 
     def clear_points(self):
@@ -469,8 +494,21 @@ class VMobject(Mobject):
         return self.consider_points_equals(self.points[0], self.points[-1])
 
     def add_points_as_corners(self, points):
-        for point in points:
-            self.add_line_to(point)
+        """
+        Same as calling add_line_to on each point, but appends all the
+        lines at once.
+        """
+        if len(points) == 0:
+            return points
+        nppcc = self.n_points_per_cubic_curve
+        anchors = np.append([self.get_last_point()], points, axis=0)
+        a1, a2 = anchors[:-1], anchors[1:]
+        curves = [a1] + [interpolate(a1, a2, a) for a in np.linspace(0, 1, nppcc)[1:]]
+        new_points = np.stack(curves, axis=1).reshape((-1, self.dim))
+        if self.has_new_path_started():
+            # The first line starts from the last point
+            new_points = new_points[1:]
+        self.append_points(new_points)
         return points
 
     def set_points_as_corners(self, points):
@@ -490,8 +528,13 @@ class VMobject(Mobject):
         assert mode in ["jagged", "smooth"]
         nppcc = self.n_points_per_cubic_curve
         for submob in self.family_members_with_points():
-            subpaths = submob.get_subpaths()
+            points = submob.get_points()
+            subpaths = [
+                points[start:end]
+                for start, end in zip(*submob.get_subpath_bounds_from_points(points))
+            ]
             submob.clear_points()
+            new_subpaths = []
             for subpath in subpaths:
                 anchors = np.append(subpath[::nppcc], subpath[-1:], 0)
                 if mode == "smooth":
@@ -504,7 +547,9 @@ class VMobject(Mobject):
                 new_subpath = np.array(subpath)
                 new_subpath[1::nppcc] = h1
                 new_subpath[2::nppcc] = h2
-                submob.append_points(new_subpath)
+                new_subpaths.append(new_subpath)
+            if new_subpaths:
+                submob.append_points(np.concatenate(new_subpaths))
         return self
 
     def make_smooth(self):
@@ -578,7 +623,11 @@ class VMobject(Mobject):
 
     # Information about line
     def get_cubic_bezier_tuples_from_points(self, points):
-        return np.array(list(self.gen_cubic_bezier_tuples_from_points(points)))
+        nppcc = VMobject.CONFIG["n_points_per_cubic_curve"]
+        points = np.array(points)
+        remainder = len(points) % nppcc
+        points = points[: len(points) - remainder]
+        return points.reshape((-1, nppcc) + points.shape[1:])
 
     def gen_cubic_bezier_tuples_from_points(self, points):
         """
@@ -618,6 +667,63 @@ class VMobject(Mobject):
             lambda n: not self.consider_points_equals_2d(points[n - 1], points[n]),
         )
 
+    def get_subpath_bounds_from_points_2d(self, points):
+        """
+        Vectorized equivalent of gen_subpaths_from_points_2d, returning
+        the bounds of the subpaths instead of the subpaths themselves.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            The points of the path.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The start and end indices of each subpath, such that the
+            subpaths are ``points[start:end]``.
+        """
+        nppcc = self.n_points_per_cubic_curve
+        indices = np.arange(nppcc, len(points), nppcc)
+        # Same test as consider_points_equals_2d, for all curve joints at once
+        p0 = points[indices - 1, :2]
+        p1 = points[indices, :2]
+        atol = self.tolerance_for_point_equality
+        is_split = (np.abs(p0 - p1) > atol + 1.0e-5 * np.abs(p1)).any(axis=1)
+        bounds = np.concatenate([[0], indices[is_split], [len(points)]])
+        starts, ends = bounds[:-1], bounds[1:]
+        long_enough = (ends - starts) >= nppcc
+        return starts[long_enough], ends[long_enough]
+
+    def get_subpath_bounds_from_points(self, points):
+        """
+        Vectorized equivalent of get_subpaths_from_points, returning
+        the bounds of the subpaths instead of the subpaths themselves.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            The points of the path.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The start and end indices of each subpath, such that the
+            subpaths are ``points[start:end]``.
+        """
+        nppcc = self.n_points_per_cubic_curve
+        indices = np.arange(nppcc, len(points), nppcc)
+        # Same test as consider_points_equals, for all curve joints at once
+        p0 = points[indices - 1]
+        p1 = points[indices]
+        atol = self.tolerance_for_point_equality
+        is_close = np.abs(p0 - p1) <= atol + 1.0e-5 * np.abs(p1)
+        is_split = ~is_close.all(axis=1)
+        bounds = np.concatenate([[0], indices[is_split], [len(points)]])
+        starts, ends = bounds[:-1], bounds[1:]
+        long_enough = (ends - starts) >= nppcc
+        return starts[long_enough], ends[long_enough]
+
     def get_subpaths(self):
         return self.get_subpaths_from_points(self.get_points())
 
@@ -666,6 +772,33 @@ class VMobject(Mobject):
     def get_points_defining_boundary(self):
         return np.array(list(it.chain(*[sm.get_anchors() for sm in self.get_family()])))
 
+    def get_anchors_bounds(self):
+        """
+        Same as get_points_bounds, for the points given by get_anchors.
+        """
+        cache = self.__dict__.get("_anchors_bounds")
+        if cache is None or cache[0] != self.get_version():
+            if self.points.shape[0] == 1:
+                anchors = self.points
+            else:
+                # Like get_anchors, which pairs start and end anchors
+                start_anchors = self.get_start_anchors()
+                end_anchors = self.get_end_anchors()
+                n_pairs = min(len(start_anchors), len(end_anchors))
+                anchors = np.append(
+                    start_anchors[:n_pairs], end_anchors[:n_pairs], axis=0
+                )
+            bounds = None
+            if len(anchors) > 0:
+                bounds = np.array([anchors.min(0), anchors.max(0)])
+            cache = (self.get_version(), bounds)
+            # Written directly in __dict__, as caching is not a mutation
+            self.__dict__["_anchors_bounds"] = cache
+        return cache[1]
+
+    def get_boundary_bounds(self):
+        return self.get_family_bounds(VMobject.get_anchors_bounds)
+
     def get_arc_length(self, n_sample_points=None):
         if n_sample_points is None:
             n_sample_points = 4 * self.get_num_curves() + 1
@@ -693,30 +826,36 @@ class VMobject(Mobject):
                 mob.add_line_to(mob.get_last_point())
 
         # Figure out what the subpaths are, and align
-        subpaths1 = self.get_subpaths()
-        subpaths2 = vmobject.get_subpaths()
-        n_subpaths = max(len(subpaths1), len(subpaths2))
-        # Start building new ones
-        new_path1 = np.zeros((0, self.dim))
-        new_path2 = np.zeros((0, self.dim))
-
         nppcc = self.n_points_per_cubic_curve
-
-        def get_nth_subpath(path_list, n):
-            if n >= len(path_list):
-                # Create a null path at the very end
-                return [path_list[-1][-1]] * nppcc
-            return path_list[n]
-
-        for n in range(n_subpaths):
-            sp1 = get_nth_subpath(subpaths1, n)
-            sp2 = get_nth_subpath(subpaths2, n)
-            diff1 = max(0, (len(sp2) - len(sp1)) // nppcc)
-            diff2 = max(0, (len(sp1) - len(sp2)) // nppcc)
-            sp1 = self.insert_n_curves_to_point_list(diff1, sp1)
-            sp2 = self.insert_n_curves_to_point_list(diff2, sp2)
-            new_path1 = np.append(new_path1, sp1, axis=0)
-            new_path2 = np.append(new_path2, sp2, axis=0)
+        mobs = [self, vmobject]
+        bounds = [mob.get_subpath_bounds_from_points(mob.get_points()) for mob in mobs]
+        n_subpaths = max(len(starts) for starts, ends in bounds)
+        plans = []
+        for mob, (starts, ends) in zip(mobs, bounds):
+            points = mob.get_points()
+            bezier_quads = mob.get_cubic_bezier_tuples_from_points(points)
+            # Missing subpaths are null paths at the very end,
+            # each made of a single curve of its own
+            n_null_paths = n_subpaths - len(starts)
+            null_quads = np.zeros((n_null_paths, nppcc, mob.dim))
+            if n_null_paths > 0:
+                null_quads[:] = points[ends[-1] - 1]
+            first_curves = np.append(
+                starts // nppcc, len(bezier_quads) + np.arange(n_null_paths)
+            )
+            lengths = np.append(ends - starts, np.full(n_null_paths, nppcc))
+            plans.append(
+                (np.append(bezier_quads, null_quads, axis=0), first_curves, lengths)
+            )
+        (quads1, first_curves1, lengths1), (quads2, first_curves2, lengths2) = plans
+        diffs1 = np.maximum(0, (lengths2 - lengths1) // nppcc)
+        diffs2 = np.maximum(0, (lengths1 - lengths2) // nppcc)
+        new_path1 = self.split_curve_groups(
+            quads1, first_curves1, lengths1 // nppcc, lengths1 // nppcc + diffs1
+        )
+        new_path2 = self.split_curve_groups(
+            quads2, first_curves2, lengths2 // nppcc, lengths2 // nppcc + diffs2
+        )
         self.set_points(new_path1)
         vmobject.set_points(new_path2)
         return self
@@ -739,30 +878,67 @@ class VMobject(Mobject):
             return np.repeat(points, nppcc * n, 0)
         bezier_quads = self.get_cubic_bezier_tuples_from_points(points)
         curr_num = len(bezier_quads)
-        target_num = curr_num + n
-        # This is an array with values ranging from 0
-        # up to curr_num,  with repeats such that
-        # it's total length is target_num.  For example,
-        # with curr_num = 10, target_num = 15, this would
-        # be [0, 0, 1, 2, 2, 3, 4, 4, 5, 6, 6, 7, 8, 8, 9]
-        repeat_indices = (np.arange(target_num) * curr_num) // target_num
-
-        # If the nth term of this list is k, it means
-        # that the nth curve of our path should be split
-        # into k pieces.  In the above example, this would
-        # be [2, 1, 2, 1, 2, 1, 2, 1, 2, 1]
-        split_factors = [sum(repeat_indices == i) for i in range(curr_num)]
-        new_points = np.zeros((0, self.dim))
-        for quad, sf in zip(bezier_quads, split_factors):
-            # What was once a single cubic curve defined
-            # by "quad" will now be broken into sf
-            # smaller cubic curves
-            alphas = np.linspace(0, 1, sf + 1)
-            for a1, a2 in zip(alphas, alphas[1:]):
-                new_points = np.append(
-                    new_points, partial_bezier_points(quad, a1, a2), axis=0
-                )
-        return new_points
+        if curr_num == 0:
+            return np.zeros((0, self.dim))
+        return self.split_curve_groups(bezier_quads, [0], [curr_num], [curr_num + n])
+
+    def split_curve_groups(self, bezier_quads, first_curves, sizes, target_sizes):
+        """
+        Splits groups of consecutive curves into more curves, the
+        way insert_n_curves_to_point_list does for a single group,
+        for all groups at once.
+
+        Parameters
+        ----------
+        bezier_quads : np.ndarray
+            The curves, of shape (n_curves, n_points_per_cubic_curve, dim).
+        first_curves : np.ndarray
+            The index of the first curve of each group, in increasing order.
+        sizes : np.ndarray
+            The number of curves of each group, at least 1.
+        target_sizes : np.ndarray
+            The number of curves each group is split into, at least its size.
+
+        Returns
+        -------
+        np.ndarray
+            The points of the new curves of all the groups, in order.
+        """
+        first_curves = np.asarray(first_curves)
+        sizes = np.asarray(sizes)
+        target_sizes = np.asarray(target_sizes)
+        target_num = target_sizes.sum()
+        group_indices = np.repeat(np.arange(len(sizes)), target_sizes)
+        indices_in_group = np.arange(target_num) - np.repeat(
+            np.cumsum(target_sizes) - target_sizes, target_sizes
+        )
+        # This is an array with values ranging from first_curve
+        # up to first_curve + size for each group, with repeats
+        # such that it's total length is target_size.  For example,
+        # with size = 10, target_size = 15, this would be
+        # first_curve + [0, 0, 1, 2, 2, 3, 4, 4, 5, 6, 6, 7, 8, 8, 9]
+        repeat_indices = first_curves[group_indices] + (
+            indices_in_group * sizes[group_indices] // target_sizes[group_indices]
+        )
+
+        # If the nth term of this array is k, it means
+        # that the nth curve should be split into k pieces.
+        # In the above example, this would be
+        # [2, 1, 2, 1, 2, 1, 2, 1, 2, 1]
+        split_factors = np.bincount(repeat_indices, minlength=len(bezier_quads))
+        # What was once a single cubic curve defined by a quad
+        # will now be broken into split_factor smaller cubic
+        # curves, the pieces between multiples of 1 / split_factor
+        piece_indices = np.arange(target_num) - np.repeat(
+            np.cumsum(split_factors) - split_factors, split_factors
+        )
+        n_pieces = split_factors[repeat_indices]
+        new_quads = partial_bezier_curves(
+            bezier_quads[repeat_indices],
+            piece_indices / n_pieces,
+            (piece_indices + 1) / n_pieces,
+        )
+        return new_quads.reshape((-1, self.dim))
 
     def align_rgbas(self, vmobject):
         attrs = ["fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"]
@@ -822,20 +998,15 @@ class VMobject(Mobject):
         if num_cubics == 0:
             return self
         if lower_index == upper_index:
-            self.append_points(
-                partial_bezier_points(
-                    bezier_quads[lower_index], lower_residue, upper_residue
-                )
+            quads = partial_bezier_curves(
+                bezier_quads[[lower_index]], lower_residue, upper_residue
             )
         else:
-            self.append_points(
-                partial_bezier_points(bezier_quads[lower_index], lower_residue, 1)
-            )
-            for quad in bezier_quads[lower_index + 1 : upper_index]:
-                self.append_points(quad)
-            self.append_points(
-                partial_bezier_points(bezier_quads[upper_index], 0, upper_residue)
+            quads = np.array(bezier_quads[lower_index : upper_index + 1])
+            quads[[0, -1]] = partial_bezier_curves(
+                quads[[0, -1]], [lower_residue, 0], [1, upper_residue]
             )
+        self.set_points(quads.reshape((-1, self.dim)))
         return self
 
     def get_subcurve(self, a, b):
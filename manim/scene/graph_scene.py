@@ -202,6 +202,28 @@ class GraphScene(Scene):
         result += self.y_axis.number_to_point(y)[1] * UP
         return result
 
+    def coords_to_points(self, x, y):
+        """
+        Same as coords_to_point, for arrays of coordinates at once.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            The x values
+
+        y : np.ndarray
+            The y values
+
+        Returns
+        -------
+        np.ndarray
+            The array of the points, one per row.
+        """
+        assert hasattr(self, "x_axis") and hasattr(self, "y_axis")
+        result = self.x_axis.numbers_to_points(x)[:, 0:1] * RIGHT
+        result += self.y_axis.numbers_to_points(y)[:, 1:2] * UP
+        return result
+
     def point_to_coords(self, point):
         """
         The scene is smaller than the graph.
@@ -244,7 +266,10 @@ class GraphScene(Scene):
             The higher x_value until which to plot the curve.
 
         **kwargs :
-            Any valid keyword arguments of ParametricFunction.
+            Any valid keyword arguments of ParametricFunction.  With
+            ``use_vectorized=True``, func is called once, with the array
+            of all the sampled x values, and must return the array of the
+            y values.
 
         Return
         ------
@@ -266,6 +291,14 @@ class GraphScene(Scene):
                 y = self.y_max
             return self.coords_to_point(x, y)
 
+        def vectorized_parameterized_function(alpha):
+            x = interpolate(x_min, x_max, alpha)
+            y = np.full(np.shape(x), func(x), dtype=float)
+            y[~np.isfinite(y)] = self.y_max
+            return self.coords_to_points(x, y).T
+
+        if kwargs.get("use_vectorized", False):
+            parameterized_function = vectorized_parameterized_function
         graph = ParametricFunction(parameterized_function, color=color, **kwargs)
         graph.underlying_function = func
         return graph
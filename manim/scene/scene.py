@@ -17,7 +17,12 @@ from ..logger import logger
 from ..mobject.mobject import Mobject
 from ..scene.scene_file_writer import SceneFileWriter
 from ..utils.iterables import list_update
-from ..utils.hashing import get_hash_from_play_call, get_hash_from_wait_call
+from ..utils.hashing import (
+    get_camera_dict_for_hashing,
+    get_fingerprint,
+    get_hash_from_play_call,
+    get_hash_from_wait_call,
+)
 
 
 class Scene(Container):
@@ -63,6 +68,13 @@ class Scene(Container):
         self.foreground_mobjects = []
         self.num_plays = 0
         self.time = 0
+        # Turned off while a worker process renders the current play-like call
+        self.render_frames = True
+        # Key and pixel array of the last frame rendered by get_static_frame
+        self.static_frame_key = None
+        self.static_frame = None
+        # Calls made by update_mobjects, see get_updater_calls
+        self.updater_calls = {}
         self.original_skipping_status = file_writer_config["skip_animations"]
         if self.random_seed is not None:
             random.seed(self.random_seed)
@@ -243,6 +255,8 @@ class Scene(Container):
         **kwargs
 
         """
+        if not self.render_frames:
+            return
         if file_writer_config["skip_animations"] and not ignore_skipping:
             return
         if mobjects is None:
@@ -255,6 +269,79 @@ class Scene(Container):
         kwargs["include_submobjects"] = include_submobjects
         self.capture_mobjects_in_camera(mobjects, **kwargs)
 
+    def get_static_frame(self, excluded_mobjects):
+        """
+        Renders the frame showing every mobject of the scene except
+        `excluded_mobjects`, which is used as background while they move.
+
+        The frame of the previous call is reused if the same mobjects are
+        to be rendered, none of them changed since (see
+        :meth:`~.Mobject.get_version`) and neither did the camera.
+
+        Parameters
+        ----------
+        excluded_mobjects : list
+            The mobjects not to render, together with their family.
+
+        Returns
+        -------
+        np.ndarray
+            The pixel array of the frame.
+        """
+        if not self.render_frames:
+            return self.get_frame()
+        mobjects = self.camera.get_mobjects_to_display(
+            list_update(self.mobjects, self.foreground_mobjects),
+            excluded_mobjects=excluded_mobjects,
+        )
+        # Versions are never reused, so they also identify the mobjects
+        key = (
+            self.camera,
+            id(self.camera.background),
+            get_fingerprint(get_camera_dict_for_hashing(self.camera)),
+            [mob.get_version() for mob in mobjects],
+        )
+        if key == self.static_frame_key:
+            self.set_camera_pixel_array(self.static_frame)
+        else:
+            self.update_frame(excluded_mobjects=excluded_mobjects)
+            self.static_frame_key = key
+            self.static_frame = self.get_frame()
+        return self.static_frame
+
+    def update_frame_of_moving_mobjects(self, moving_mobjects, static_image, dirty_box):
+        """
+        Equivalent to ``update_frame(moving_mobjects, static_image)``, except
+        that only the part of the frame which can differ from `static_image`
+        is reset, rather than the whole frame.
+
+        Parameters
+        ----------
+        moving_mobjects : list
+            The mobjects to display on top of `static_image`.
+        static_image : np.ndarray
+            Pixel array of the other mobjects, see :meth:`get_static_frame`.
+        dirty_box : np.ndarray or None
+            Pixel box outside of which the current frame is `static_image`,
+            as returned by the previous call, or None if unknown.
+
+        Returns
+        -------
+        np.ndarray or None
+            Pixel box outside of which the updated frame is `static_image`,
+            see :meth:`~.Camera.get_pixel_bounding_box`.
+        """
+        if not self.render_frames:
+            return None
+        if dirty_box is None:
+            self.update_frame(moving_mobjects, static_image)
+        else:
+            x_min, y_min, x_max, y_max = dirty_box
+            region = (slice(y_min, y_max), slice(x_min, x_max))
+            self.camera.pixel_array[region] = static_image[region]
+            self.capture_mobjects_in_camera(moving_mobjects)
+        return self.camera.get_pixel_bounding_box(moving_mobjects)
+
     def freeze_background(self):
         self.update_frame()
         self.set_camera(Camera(self.get_frame()))
@@ -271,8 +358,100 @@ class Scene(Container):
         dt: int or float
             Change in time between updates. Defaults (mostly) to 1/frames_per_second
         """
+        previous_updater_calls = self.updater_calls
+        # Only the mobjects still in the Scene are kept
+        self.updater_calls = {}
         for mobject in self.mobjects:
-            mobject.update(dt)
+            cache = self.updater_calls.get(mobject, previous_updater_calls.get(mobject))
+            self.make_updater_calls(mobject, self.get_updater_calls(mobject, cache), dt)
+
+    def get_updater_calls(self, mobject, cache=None):
+        """
+        Returns the calls to updaters made by updating `mobject`, as given by
+        Mobject.get_updater_calls, which are only listed again once the
+        structure of its family changes (see Mobject.get_structure_stamp).
+
+        Parameters
+        ----------
+        mobject : Mobject
+            The mobject to update.
+        cache : tuple, optional
+            What this returned for `mobject` the last time.
+
+        Returns
+        -------
+        tuple
+            The structure version when last checked, the structure stamps of
+            the family of `mobject`, and the calls.
+        """
+        version = Mobject.get_structure_version()
+        if cache is None or cache[0] != version:
+            stamps = mobject.get_family_structure_stamps()
+            if cache is None or cache[1] != stamps:
+                cache = (version, stamps, mobject.get_updater_calls())
+            else:
+                cache = (version, *cache[1:])
+        self.updater_calls[mobject] = cache
+        return cache
+
+    def make_updater_calls(self, mobject, updater_calls, dt):
+        """
+        Makes the calls to updaters returned by get_updater_calls for
+        `mobject`.  If an updater changes the structure of its family, the
+        rest of the family is updated the way Mobject.update does.
+
+        Parameters
+        ----------
+        mobject : Mobject
+            The mobject to update.
+        updater_calls : tuple
+            What get_updater_calls returned for `mobject`.
+        dt : int or float
+            Change in time between updates.
+        """
+        structure_version, stamps, calls = updater_calls
+        index = 0
+        while index < len(calls):
+            updated_mobject = calls[index][0]
+            while index < len(calls) and calls[index][0] is updated_mobject:
+                _, updater, takes_dt, _ = calls[index]
+                if takes_dt:
+                    updater(updated_mobject, dt)
+                else:
+                    updater(updated_mobject)
+                index += 1
+            if Mobject.get_structure_version() == structure_version:
+                continue
+            structure_version = Mobject.get_structure_version()
+            if mobject.get_family_structure_stamps() == stamps:
+                # Only other mobjects changed
+                continue
+            path = self.get_path_to_descendant(mobject, updated_mobject)
+            if path is not None:
+                for submob in updated_mobject.submobjects:
+                    submob.update(dt)
+                # Then the submobjects following each of its ancestors
+                for parent, child in reversed(list(zip(path, path[1:]))):
+                    submobjects = parent.submobjects
+                    if child in submobjects:
+                        index = submobjects.index(child)
+                        for submob in submobjects[index + 1 :]:
+                            submob.update(dt)
+            return
+
+    def get_path_to_descendant(self, mobject, descendant):
+        """
+        Returns the mobjects from `mobject` down to `descendant`, each one
+        being a submobject of the previous one, or None if `descendant` is
+        not in the family of `mobject`.
+        """
+        if mobject is descendant:
+            return [mobject]
+        for submob in mobject.submobjects:
+            path = self.get_path_to_descendant(submob, descendant)
+            if path is not None:
+                return [mobject, *path]
+        return None
 
     def should_update_mobjects(self):
         """
@@ -380,14 +559,14 @@ class Scene(Container):
 
     def add_mobjects_from_animations(self, animations):
 
-        curr_mobjects = self.get_mobject_family_members()
+        curr_mobjects = set(self.get_mobject_family_members())
         for animation in animations:
             # Anything animated that's not already in the
             # scene gets added to the scene
             mob = animation.mobject
             if mob not in curr_mobjects:
                 self.add(mob)
-                curr_mobjects += mob.get_family()
+                curr_mobjects.update(mob.get_family())
 
     def remove(self, *mobjects):
         """
@@ -937,13 +1116,42 @@ class Scene(Container):
         def wrapper(self, *args, **kwargs):
             self.update_skipping_status()
             allow_write = not file_writer_config["skip_animations"]
-            self.file_writer.begin_animation(allow_write)
-            func(self, *args, **kwargs)
-            self.file_writer.end_animation(allow_write)
+            if allow_write and self.file_writer.renders_partial_movies_in_workers():
+                self.play_in_worker(func, *args, **kwargs)
+            else:
+                self.file_writer.begin_animation(allow_write)
+                func(self, *args, **kwargs)
+                self.file_writer.end_animation(allow_write)
             self.num_plays += 1
 
         return wrapper
 
+    def play_in_worker(self, func, *args, **kwargs):
+        """
+        This method is used internally to render a play-like call
+        in a worker process forked from the scene, which writes the
+        corresponding partial movie file. Meanwhile, the scene goes
+        through the same call without rasterizing any frame, so that
+        it reaches the state in which the call leaves the mobjects.
+
+        Parameters
+        ----------
+        func : function
+            The play() like function to render.
+        """
+
+        def render_partial_movie():
+            self.file_writer.begin_animation(True)
+            func(self, *args, **kwargs)
+            self.file_writer.end_animation(True)
+
+        self.file_writer.write_partial_movie_in_worker(render_partial_movie)
+        self.render_frames = False
+        try:
+            func(self, *args, **kwargs)
+        finally:
+            self.render_frames = True
+
     def begin_animations(self, animations):
         """
         This method begins the list of animations that is passed,
@@ -973,8 +1181,9 @@ class Scene(Container):
         # Paint all non-moving objects onto the screen, so they don't
         # have to be rendered every frame
         moving_mobjects = self.get_moving_mobjects(*animations)
-        self.update_frame(excluded_mobjects=moving_mobjects)
-        static_image = self.get_frame()
+        static_image = self.get_static_frame(moving_mobjects)
+        # Nothing was drawn on top of the static image yet
+        dirty_box = self.camera.get_pixel_bounding_box([])
         last_t = 0
         for t in self.get_animation_time_progression(animations):
             dt = t - last_t
@@ -984,8 +1193,11 @@ class Scene(Container):
                 alpha = t / animation.run_time
                 animation.interpolate(alpha)
             self.update_mobjects(dt)
-            self.update_frame(moving_mobjects, static_image)
-            self.add_frames(self.get_frame())
+            dirty_box = self.update_frame_of_moving_mobjects(
+                moving_mobjects, static_image, dirty_box
+            )
+            # No need to copy the pixel array, write_frame copies it
+            self.add_frames(self.camera.get_pixel_array())
 
     def finish_animations(self, animations):
         """
@@ -1138,7 +1350,7 @@ class Scene(Container):
                 last_t = t
                 self.update_mobjects(dt)
                 self.update_frame()
-                self.add_frames(self.get_frame())
+                self.add_frames(self.camera.get_pixel_array())
                 if stop_condition is not None and stop_condition():
                     time_progression.close()
                     break
@@ -1211,7 +1423,7 @@ class Scene(Container):
         """
         dt = 1 / self.camera.frame_rate
         self.increment_time(len(frames) * dt)
-        if file_writer_config["skip_animations"]:
+        if file_writer_config["skip_animations"] or not self.render_frames:
             return
         for frame in frames:
             self.file_writer.write_frame(frame)
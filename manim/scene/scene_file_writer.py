@@ -2,12 +2,23 @@ import numpy as np
 from pydub import AudioSegment
 import shutil
 import subprocess
+import multiprocessing
+from multiprocessing.connection import wait as wait_for_processes
 import os
 import _thread as thread
+import queue
+import threading
 from time import sleep
 import datetime
+from fractions import Fraction
 from PIL import Image
 
+try:
+    # Optional: used to encode partial movie files without spawning ffmpeg
+    import av
+except ImportError:
+    av = None
+
 from ..constants import FFMPEG_BIN, GIF_FILE_EXTENSION
 from ..config import file_writer_config
 from ..logger import logger, console
@@ -42,6 +53,10 @@ class SceneFileWriter(object):
         self.init_output_directories()
         self.init_audio()
         self.frame_count = 0
+        self.movie_container = None
+        self.frame_writer = None
+        self.frame_buffers = []
+        self.init_partial_movie_workers()
 
     # Output directories and files
     def init_output_directories(self):
@@ -85,6 +100,24 @@ class SceneFileWriter(object):
                 os.path.join(movie_dir, "partial_movie_files", scene_name,)
             )
 
+    def init_partial_movie_workers(self):
+        """
+        Prepares the worker processes used to render partial movie
+        files in parallel, if more than one segment job was requested.
+        Workers are forked from the scene, so this is only possible on
+        platforms supporting fork.
+        """
+        self.partial_movie_workers = []
+        self.max_partial_movie_workers = file_writer_config["segment_jobs"]
+        if (
+            self.max_partial_movie_workers > 1
+            and "fork" not in multiprocessing.get_all_start_methods()
+        ):
+            logger.warning(
+                "Partial movie files can only be rendered in parallel on platforms supporting fork."
+            )
+            self.max_partial_movie_workers = 1
+
     def get_default_module_directory(self):
         """
         This method gets the name of the directory containing
@@ -279,6 +312,7 @@ class SceneFileWriter(object):
         """
         if file_writer_config["write_to_movie"] and allow_write:
             self.open_movie_pipe()
+            self.start_frame_writer()
 
     def end_animation(self, allow_write=False):
         """
@@ -291,12 +325,171 @@ class SceneFileWriter(object):
             Whether or not to write to a video file.
         """
         if file_writer_config["write_to_movie"] and allow_write:
+            self.stop_frame_writer()
             self.close_movie_pipe()
 
+    def renders_partial_movies_in_workers(self):
+        """
+        Returns
+        -------
+        bool
+            Whether partial movie files are rendered by worker processes.
+        """
+        return (
+            file_writer_config["write_to_movie"] and self.max_partial_movie_workers > 1
+        )
+
+    def write_partial_movie_in_worker(self, render_partial_movie):
+        """
+        Forks a worker process which renders and writes the next partial
+        movie file, by calling `render_partial_movie`. Since the worker is
+        a fork, it sees the scene exactly as it is at the time of this call.
+        If too many workers are already running, this waits for one of them
+        to finish first.
+
+        Parameters
+        ----------
+        render_partial_movie : Callable[[], None]
+            Function rendering the partial movie file, from the worker.
+        """
+        while len(self.partial_movie_workers) >= self.max_partial_movie_workers:
+            wait_for_processes([w.sentinel for w in self.partial_movie_workers])
+            for worker in [w for w in self.partial_movie_workers if not w.is_alive()]:
+                self.join_partial_movie_worker(worker)
+        worker = multiprocessing.get_context("fork").Process(
+            target=render_partial_movie
+        )
+        worker.start()
+        self.partial_movie_workers.append(worker)
+
+    def join_partial_movie_worker(self, worker):
+        """
+        Waits for a worker forked by `write_partial_movie_in_worker` to finish.
+
+        Parameters
+        ----------
+        worker : :class:`multiprocessing.Process`
+            The worker to wait for.
+        """
+        worker.join()
+        self.partial_movie_workers.remove(worker)
+        if worker.exitcode != 0:
+            raise Exception(
+                f"A partial movie file could not be rendered (exit code {worker.exitcode})"
+            )
+
+    def join_partial_movie_workers(self):
+        """
+        Waits for all partial movie files rendered by workers to be written.
+        """
+        for worker in list(self.partial_movie_workers):
+            self.join_partial_movie_worker(worker)
+
+    def start_frame_writer(self):
+        """
+        Starts the background thread encoding the frames passed to
+        write_frame, so that the next frames can be rendered in the
+        meantime. At most `frame_queue_size` frames can wait to be encoded;
+        when the encoder falls behind, write_frame blocks until one of
+        them is written. Does nothing if `frame_queue_size` is 0.
+        """
+        self.frame_writer = None
+        if file_writer_config["frame_queue_size"] <= 0:
+            return
+        self.frame_queue = queue.Queue()
+        self.free_frame_buffers = queue.Queue()
+        for buffer in self.frame_buffers:
+            self.free_frame_buffers.put(buffer)
+        self.frame_writer_error = None
+        self.frame_writer = threading.Thread(target=self.run_frame_writer, daemon=True)
+        self.frame_writer.start()
+
+    def run_frame_writer(self):
+        """
+        Body of the thread started by start_frame_writer. Encodes the
+        queued frame buffers until it receives None, and hands each buffer
+        back to write_frame once written. If encoding fails, the error is
+        kept to be raised by stop_frame_writer, and the remaining frames
+        are dropped so that write_frame never blocks forever.
+        """
+        while True:
+            buffer = self.frame_queue.get()
+            if buffer is None:
+                return
+            if self.frame_writer_error is None:
+                try:
+                    self.encode_frame(buffer)
+                except Exception as error:
+                    self.frame_writer_error = error
+            self.free_frame_buffers.put(buffer)
+
+    def stop_frame_writer(self):
+        """
+        Waits for all the frames queued by write_frame to be encoded, and
+        stops the thread started by start_frame_writer.
+        """
+        if self.frame_writer is None:
+            return
+        self.frame_queue.put(None)
+        self.frame_writer.join()
+        self.frame_writer = None
+        if self.frame_writer_error is not None:
+            raise self.frame_writer_error
+
+    def get_free_frame_buffer(self, frame):
+        """
+        Returns a frame buffer which is not queued for encoding, waiting
+        for one to be written if all of them are. Buffers are allocated up
+        to `frame_queue_size` and reused across partial movie files.
+
+        Parameters
+        ----------
+        frame : np.array
+            Pixel array of the frame to be copied into the buffer.
+
+        Returns
+        -------
+        np.array
+            A buffer with the same shape and dtype as `frame`.
+        """
+        try:
+            buffer = self.free_frame_buffers.get_nowait()
+        except queue.Empty:
+            if len(self.frame_buffers) < file_writer_config["frame_queue_size"]:
+                buffer = np.empty_like(frame)
+                self.frame_buffers.append(buffer)
+            else:
+                buffer = self.free_frame_buffers.get()
+        if buffer.shape != frame.shape or buffer.dtype != frame.dtype:
+            # Removed by identity, as == compares arrays elementwise
+            self.frame_buffers = [b for b in self.frame_buffers if b is not buffer]
+            buffer = np.empty_like(frame)
+            self.frame_buffers.append(buffer)
+        return buffer
+
+    def encode_frame(self, frame):
+        """
+        Used internally by Manim to encode a frame into the
+        current partial movie file.
+
+        Parameters
+        ----------
+        frame : np.array
+            Pixel array of the frame.
+        """
+        if self.movie_container is not None:
+            video_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+            for packet in self.video_stream.encode(video_frame):
+                self.movie_container.mux(packet)
+        else:
+            # Writes the pixels through the buffer protocol, without copying them
+            self.writing_process.stdin.write(np.ascontiguousarray(frame).data)
+
     def write_frame(self, frame):
         """
         Used internally by Manim to write a frame to
-        the FFMPEG input buffer.
+        the FFMPEG input buffer. The frame is copied, so
+        the caller is free to modify it afterwards.
 
         Parameters
         ----------
@@ -304,7 +497,12 @@ class SceneFileWriter(object):
             Pixel array of the frame.
         """
         if file_writer_config["write_to_movie"]:
-            self.writing_process.stdin.write(frame.tostring())
+            if self.frame_writer is not None:
+                buffer = self.get_free_frame_buffer(frame)
+                np.copyto(buffer, frame)
+                self.frame_queue.put(buffer)
+            else:
+                self.encode_frame(frame)
         if file_writer_config["save_pngs"]:
             path, extension = os.path.splitext(self.image_file_path)
             Image.fromarray(frame).save(f"{path}{self.frame_count}{extension}")
@@ -351,6 +549,7 @@ class SceneFileWriter(object):
         if file_writer_config["write_to_movie"]:
             if hasattr(self, "writing_process"):
                 self.writing_process.terminate()
+            self.join_partial_movie_workers()
             self.combine_movie_files()
             if file_writer_config["flush_cache"]:
                 self.flush_cache_directory()
@@ -374,6 +573,10 @@ class SceneFileWriter(object):
         )
         self.partial_movie_file_path = file_path
         self.temp_partial_movie_file_path = temp_file_path
+        self.movie_container = None
+        if av is not None and file_writer_config["use_pyav"]:
+            self.open_movie_container(temp_file_path)
+            return
 
         fps = self.scene.camera.frame_rate
         height = self.scene.camera.get_pixel_height()
@@ -415,14 +618,51 @@ class SceneFileWriter(object):
         command += [temp_file_path]
         self.writing_process = subprocess.Popen(command, stdin=subprocess.PIPE)
 
+    def open_movie_container(self, file_path):
+        """
+        Used internally by Manim to encode the next partial movie
+        file in-process with PyAV, rather than piping its frames to
+        a new FFMPEG process. The codecs and pixel formats are the
+        same as the ones of open_movie_pipe, but the ffmpeg loglevel
+        of the config is not applied.
+
+        Parameters
+        ----------
+        file_path : str
+            The path of the file to write.
+        """
+        self.movie_container = av.open(file_path, mode="w")
+        self.video_stream = self.movie_container.add_stream(
+            # TODO, the test for a transparent background should not be based on
+            # the file extension.
+            "qtrle"
+            if file_writer_config["movie_file_extension"] == ".mov"
+            else "libx264",
+            rate=Fraction(self.scene.camera.frame_rate).limit_denominator(),
+        )
+        self.video_stream.width = self.scene.camera.get_pixel_width()
+        self.video_stream.height = self.scene.camera.get_pixel_height()
+        self.video_stream.pix_fmt = (
+            "argb"
+            if file_writer_config["movie_file_extension"] == ".mov"
+            else "yuv420p"
+        )
+
     def close_movie_pipe(self):
         """
         Used internally by Manim to gracefully stop writing to FFMPEG's
         input buffer, and move the temporary files into their permananant
         locations
         """
-        self.writing_process.stdin.close()
-        self.writing_process.wait()
+        if self.movie_container is not None:
+            # Flush the frames buffered by the encoder
+            for packet in self.video_stream.encode():
+                self.movie_container.mux(packet)
+            self.movie_container.close()
+            self.movie_container = None
+        else:
+            self.writing_process.stdin.close()
+            self.writing_process.wait()
         shutil.move(
             self.temp_partial_movie_file_path, self.partial_movie_file_path,
         )
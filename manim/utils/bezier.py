@@ -23,15 +23,47 @@ def partial_bezier_points(points, a, b):
     return an array of the same size, which
     describes the portion of the original bezier
     curve on the interval [a, b].
-
-    This algorithm is pretty nifty, and pretty dense.
     """
-    if a == 1:
-        return [points[-1]] * len(points)
+    return partial_bezier_curves(np.array([points]), a, b)[0]
+
 
-    a_to_1 = np.array([bezier(points[i:])(a) for i in range(len(points))])
-    end_prop = (b - a) / (1.0 - a)
-    return np.array([bezier(a_to_1[: i + 1])(end_prop) for i in range(len(points))])
+def partial_bezier_curves(curves, a, b):
+    """
+    Same as partial_bezier_points, for many curves at once, each with its
+    own interval.
+
+    Parameters
+    ----------
+    curves : :class:`numpy.ndarray`
+        The points defining each curve, of shape (n_curves, degree + 1, dim).
+    a : float or :class:`numpy.ndarray`
+        The start of the portion of each curve, of shape (n_curves,).
+    b : float or :class:`numpy.ndarray`
+        The end of the portion of each curve, of shape (n_curves,).
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        The points defining the portion of each curve, of the same shape as
+        curves.
+    """
+    curves = np.asarray(curves, dtype=float)
+    shape = (-1,) + (1,) * (curves.ndim - 1)
+    a, b = np.reshape(a, shape), np.reshape(b, shape)
+    degree = curves.shape[1] - 1
+    result = np.empty_like(curves)
+    # The i-th point of the portion is the blossom of the curve at
+    # degree - i copies of a and i copies of b, given by de Casteljau's
+    # algorithm run with a for degree - i steps, then with b
+    a_steps = curves
+    for i in range(degree, -1, -1):
+        b_steps = a_steps
+        for _ in range(i):
+            b_steps = interpolate(b_steps[:, :-1], b_steps[:, 1:], b)
+        result[:, i] = b_steps[:, 0]
+        if i > 0:
+            a_steps = interpolate(a_steps[:, :-1], a_steps[:, 1:], a)
+    return result
 
 
 # Linear interpolation variants
@@ -113,26 +145,34 @@ def get_smooth_handle_points(points):
     def solve_func(b):
         return linalg.solve_banded((l, u), diag, b)
 
-    use_closed_solve_function = is_closed(points)
-    if use_closed_solve_function:
-        # Get equations to relate first and last points
-        matrix = diag_to_matrix((l, u), diag)
+    if is_closed(points):
+        # Get equations to relate first and last points.  They only replace
+        # the first and last rows of the banded matrix, so the system is
+        # solved with the Woodbury formula, which only needs banded solves,
+        # instead of with a dense matrix, too large for curves with many
+        # anchors
+        first_row = banded_matrix_row((l, u), diag, 0)
+        last_row = banded_matrix_row((l, u), diag, -1)
         # last row handles second derivative
-        matrix[-1, [0, 1, -2, -1]] = [2, -1, 1, -2]
+        new_last_row = np.array(last_row)
+        new_last_row[[0, 1, -2, -1]] = [2, -1, 1, -2]
         # first row handles first derivative
-        matrix[0, :] = np.zeros(matrix.shape[1])
-        matrix[0, [0, -1]] = [1, 1]
+        new_first_row = np.zeros(len(first_row))
+        new_first_row[[0, -1]] = [1, 1]
         b[0] = 2 * points[0]
         b[-1] = np.zeros(dim)
-
-        def closed_curve_solve_func(b):
-            return linalg.solve(matrix, b)
-
-    handle_pairs = np.zeros((2 * num_handles, dim))
-    for i in range(dim):
-        if use_closed_solve_function:
-            handle_pairs[:, i] = closed_curve_solve_func(b[:, i])
-        else:
+        # The closed matrix is the banded one plus U * V^T
+        U = np.zeros((2 * num_handles, 2))
+        U[0, 0] = U[-1, 1] = 1
+        V_T = np.array([new_first_row - first_row, new_last_row - last_row])
+        # Solved for U and b at once, to factor the matrix only once
+        solutions = solve_func(np.append(U, b, axis=1))
+        Z, y = solutions[:, :2], solutions[:, 2:]
+        capacitance = np.identity(2) + V_T.dot(Z)
+        handle_pairs = y - Z.dot(np.linalg.solve(capacitance, V_T.dot(y)))
+    else:
+        handle_pairs = np.zeros((2 * num_handles, dim))
+        for i in range(dim):
             handle_pairs[:, i] = solve_func(b[:, i])
     return handle_pairs[0::2], handle_pairs[1::2]
 
@@ -153,5 +193,19 @@ def diag_to_matrix(l_and_u, diag):
     return matrix
 
 
+def banded_matrix_row(l_and_u, diag, i):
+    """
+    Returns the row i of the matrix represented by diag in diagonal form,
+    as in diag_to_matrix, without building the whole matrix.
+    """
+    l, u = l_and_u
+    dim = diag.shape[1]
+    i %= dim
+    row = np.zeros(dim)
+    cols = np.arange(max(0, i - l), min(dim, i + u + 1))
+    row[cols] = diag[u + i - cols, cols]
+    return row
+
+
 def is_closed(points):
     return np.allclose(points[0], points[-1])
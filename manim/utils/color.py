@@ -104,3 +104,16 @@ def get_shaded_rgb(rgb, point, unit_normal_vect, light_source):
     result = rgb + factor
     clip_in_place(rgb + factor, 0, 1)
     return result
+
+
+def get_shading_factors(points, unit_normal_vects, light_source):
+    """
+    Returns what get_shaded_rgb adds to the rgb values of colors at each
+    point, for arrays of points and normals, of shape (..., 3).
+    """
+    to_sun = light_source - points
+    norms = np.sqrt((to_sun ** 2).sum(axis=-1))[..., np.newaxis]
+    to_sun = np.divide(to_sun, norms, out=np.zeros(to_sun.shape), where=norms > 0)
+    factors = 0.5 * (unit_normal_vects * to_sun).sum(axis=-1) ** 3
+    factors[factors < 0] *= 0.5
+    return factors
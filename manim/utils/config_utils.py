@@ -150,12 +150,29 @@ def _parse_file_writer_config(config_parser, args):
         if ffmpeg_loglevel is None
         else ffmpeg_loglevel
     )
+    fw_config["use_pyav"] = config_parser["ffmpeg"].getboolean(
+        "use_pyav", fallback=False
+    )
+    fw_config["frame_queue_size"] = config_parser["ffmpeg"].getint(
+        "frame_queue_size", fallback=8
+    )
 
     # Parse the progress_bar flag
     progress_bar = getattr(args, "progress_bar")
     if progress_bar is None:
         progress_bar = default.getboolean("progress_bar")
     fw_config["progress_bar"] = progress_bar
+
+    # Parse the jobs flag, i.e. the number of scenes rendered in parallel
+    jobs = getattr(args, "jobs")
+    fw_config["jobs"] = default.getint("jobs") if jobs is None else jobs
+
+    # Parse the segment_jobs flag, i.e. the number of partial movie files
+    # of a single scene rendered in parallel
+    segment_jobs = getattr(args, "segment_jobs")
+    fw_config["segment_jobs"] = (
+        default.getint("segment_jobs") if segment_jobs is None else segment_jobs
+    )
     return fw_config
 
 
@@ -406,6 +423,19 @@ def _parse_cli(arg_list, input=True):
         help="Display the progress bar",
         metavar="True/False",
     )
+
+    # Specify the number of scenes to render at the same time
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of worker processes used to render several scenes in parallel",
+    )
+    parser.add_argument(
+        "--segment_jobs",
+        type=int,
+        help="Number of worker processes used to render the partial movie files of a scene in parallel",
+    )
     parsed = parser.parse_args(arg_list)
     if hasattr(parsed, "subcommands"):
         if _subcommand_name() == "cfg":
@@ -1,8 +1,17 @@
+import errno
 import os
 import subprocess as sp
 import platform
 import numpy as np
 import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    # Windows
+    fcntl = None
+    import msvcrt
 
 
 def add_extension_if_not_present(file_name, extension):
@@ -42,6 +51,41 @@ def modify_atime(file_path):
     os.utime(file_path, times=(time.time(), os.path.getmtime(file_path)))
 
 
+@contextmanager
+def file_lock(file_path):
+    """Context manager holding an exclusive lock on the file `file_path`
+    (created if needed), to synchronize processes working on the same files.
+    The lock is released by the OS if the process dies.
+
+    Parameters
+    ----------
+    file_path : :class:`str`
+        The path of the lock file.
+    """
+    with open(file_path, "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        else:
+            lock_file.seek(0)
+            while True:
+                try:
+                    # LK_LOCK itself retries for 10 seconds before failing
+                    # with EDEADLOCK, in which case it is called again
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError as error:
+                    if error.errno != errno.EDEADLOCK:
+                        raise
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+            else:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
 def open_file(file_path, in_browser=False):
     current_os = platform.system()
     if current_os == "Windows":
@@ -1,12 +1,14 @@
 import json
 import zlib
+import hashlib
 import inspect
 import copy
 import dis
 import numpy as np
-from types import ModuleType
+from types import ModuleType, CodeType
 
 from ..logger import logger
+from ..mobject.mobject import Mobject
 
 
 class CustomEncoder(json.JSONEncoder):
@@ -98,6 +100,226 @@ def get_json(obj):
     return json.dumps(obj, cls=CustomEncoder)
 
 
+# Size in bytes of the digests computed by the fingerprinting functions below.
+FINGERPRINT_DIGEST_SIZE = 16
+
+
+def _new_hasher():
+    return hashlib.blake2b(digest_size=FINGERPRINT_DIGEST_SIZE)
+
+
+def get_fingerprint(obj, memo=None):
+    """Compute a structural fingerprint of `obj`.
+
+    Contrary to :func:`get_json`, nothing is converted to an intermediate
+    representation : numpy arrays are hashed through their raw buffer, functions
+    through their bytecode, constants and captured variables, and any other object
+    through its ``__dict__``. Objects reached several times (e.g. a mobject that is
+    both on screen and animated) are only hashed once, thanks to `memo`.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to fingerprint.
+
+    memo : Optional[:class:`dict`]
+        The digests of the objects already fingerprinted, indexed by their id.
+        Share it between calls to hash the same objects only once.
+
+    Returns
+    -------
+    :class:`bytes`
+        The digest of `obj`.
+    """
+    if memo is None:
+        memo = {}
+    hasher = _new_hasher()
+    _update_fingerprint(hasher, obj, memo)
+    return hasher.digest()
+
+
+def _update_fingerprint(hasher, obj, memo):
+    """Feed the structure of `obj` into `hasher`. See :func:`get_fingerprint`."""
+    if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+        hasher.update(f"{type(obj).__name__}:{obj!r};".encode())
+    elif isinstance(obj, np.ndarray):
+        hasher.update(f"ndarray:{obj.dtype.str}:{obj.shape};".encode())
+        if obj.dtype.hasobject:
+            for item in obj.flat:
+                _update_fingerprint(hasher, item, memo)
+        else:
+            # No copy is made when the array is already contiguous
+            hasher.update(np.ascontiguousarray(obj).data)
+    elif isinstance(obj, np.generic):
+        hasher.update(f"{obj.dtype.str}:".encode())
+        hasher.update(obj.tobytes())
+    elif isinstance(obj, (bytes, bytearray)):
+        hasher.update(f"bytes:{len(obj)};".encode())
+        hasher.update(obj)
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(f"{type(obj).__name__}:{len(obj)};".encode())
+        for item in obj:
+            _update_fingerprint(hasher, item, memo)
+    elif isinstance(obj, dict):
+        hasher.update(f"dict:{len(obj)};".encode())
+        for key, value in obj.items():
+            _update_fingerprint(hasher, key, memo)
+            _update_fingerprint(hasher, value, memo)
+    elif isinstance(obj, (set, frozenset)):
+        # The iteration order of sets is not stable between two runs
+        hasher.update(f"set:{len(obj)};".encode())
+        for digest in sorted(get_fingerprint(item, memo) for item in obj):
+            hasher.update(digest)
+    elif isinstance(obj, ModuleType):
+        hasher.update(f"module:{obj.__name__};".encode())
+    elif isinstance(obj, type):
+        hasher.update(f"type:{obj.__module__}.{obj.__qualname__};".encode())
+    else:
+        hasher.update(_get_memoized_fingerprint(obj, memo))
+
+
+def _get_memoized_fingerprint(obj, memo):
+    """Return the digest of `obj`, computing it only if `obj` was not met before.
+
+    The memo keeps a reference to `obj`, so that its id cannot be reused by
+    another object while the memo is alive.
+    """
+    key = id(obj)
+    if key in memo:
+        digest = memo[key][1]
+        # `obj` is still being hashed : this is a reference cycle.
+        return digest if digest is not None else b"cycle"
+    memo[key] = (obj, None)
+    hasher = _new_hasher()
+    if inspect.ismethod(obj):
+        # Do not hash `__self__`, which is often the whole scene.
+        _update_fingerprint(hasher, obj.__func__, memo)
+    elif inspect.isfunction(obj):
+        cvars = inspect.getclosurevars(obj)
+        hasher.update(f"function:{obj.__qualname__};".encode())
+        _update_code_fingerprint(hasher, obj.__code__, memo)
+        for value in [obj.__defaults__, obj.__kwdefaults__]:
+            _update_fingerprint(hasher, value, memo)
+        _update_fingerprint(hasher, dict(cvars.nonlocals), memo)
+        _update_fingerprint(hasher, dict(cvars.globals), memo)
+    elif callable(obj) and not hasattr(obj, "__dict__"):
+        # Builtin functions, numpy ufuncs, ...
+        name = getattr(obj, "__qualname__", getattr(obj, "__name__", ""))
+        hasher.update(f"callable:{type(obj).__qualname__}:{name};".encode())
+    elif isinstance(obj, Mobject):
+        _update_mobject_fingerprint(hasher, obj, memo)
+    elif hasattr(obj, "__dict__"):
+        hasher.update(f"object:{type(obj).__qualname__};".encode())
+        _update_fingerprint(hasher, obj.__dict__, memo)
+    else:
+        # Same behaviour as CustomEncoder : unknown types do not affect the hash.
+        hasher.update(f"unsupported:{type(obj).__qualname__};".encode())
+    digest = hasher.digest()
+    memo[key] = (obj, digest)
+    return digest
+
+
+# Bookkeeping attributes of mobjects which do not describe their state
+_MOBJECT_ATTRS_NOT_HASHED = {
+    "_version",
+    "_structure_stamp",
+    "_fingerprint_cache",
+    "_family_fingerprint_cache",
+    "_family_cache",
+    "_points_bounds",
+    "_anchors_bounds",
+    "_family_bounds",
+    "_shading_factors",
+}
+
+
+def _is_tracked_by_version(value):
+    """Whether `value` can only change along with the version of the mobject
+    holding it (see :meth:`~.Mobject.get_version`)."""
+    if value is None or isinstance(value, (bool, int, float, complex, str)):
+        return True
+    return isinstance(value, np.ndarray) and not value.dtype.hasobject
+
+
+def _get_mobject_own_fingerprint(mobject):
+    """Return the digest of the attributes of `mobject` tracked by its
+    version, and the names of its other attributes, except ``submobjects``.
+
+    Both are cached on the mobject until its version changes.
+    """
+    version = mobject.get_version()
+    cache = mobject.__dict__.get("_fingerprint_cache")
+    if cache is None or cache[0] != version:
+        hasher = _new_hasher()
+        hasher.update(f"mobject:{type(mobject).__qualname__};".encode())
+        other_attrs = []
+        for key, value in mobject.__dict__.items():
+            if key in _MOBJECT_ATTRS_NOT_HASHED or key == "submobjects":
+                continue
+            if _is_tracked_by_version(value):
+                hasher.update(f"{key}=".encode())
+                _update_fingerprint(hasher, value, {})
+            else:
+                other_attrs.append(key)
+        cache = (version, hasher.digest(), other_attrs)
+        # Written directly in __dict__, as caching is not a mutation
+        mobject.__dict__["_fingerprint_cache"] = cache
+    return cache[1], cache[2]
+
+
+def _get_family_fingerprint(mobject):
+    """Return the digest of the attributes of the family of `mobject` tracked
+    by versions, including how the family is nested.
+
+    It is cached on `mobject` until the structure stamp (see
+    :meth:`~.Mobject.get_structure_stamp`) or the version of a mobject of the
+    family changes, so that an unchanged family is never hashed again.
+    """
+    family = mobject.get_family()
+    key = (
+        tuple(mob.get_structure_stamp() for mob in family),
+        tuple(mob.get_version() for mob in family),
+    )
+    cache = mobject.__dict__.get("_family_fingerprint_cache")
+    if cache is None or cache[0] != key:
+        hasher = _new_hasher()
+        indices = {id(mob): index for index, mob in enumerate(family)}
+        for mob in family:
+            hasher.update(_get_mobject_own_fingerprint(mob)[0])
+            hasher.update(
+                repr([indices[id(submob)] for submob in mob.submobjects]).encode()
+            )
+        cache = (key, hasher.digest())
+        mobject.__dict__["_family_fingerprint_cache"] = cache
+    return cache[1]
+
+
+def _update_mobject_fingerprint(hasher, mobject, memo):
+    """Feed `mobject` into `hasher`.
+
+    Numbers, strings and arrays held by the mobjects of its family only change
+    along with their versions (see :meth:`~.Mobject.get_version`), so their
+    digest is cached, see :func:`_get_family_fingerprint`. Attributes
+    referencing other objects (updaters, other mobjects...) are hashed again
+    each time, as those objects can change on their own.
+    """
+    hasher.update(_get_family_fingerprint(mobject))
+    for mob in mobject.get_family():
+        for key in _get_mobject_own_fingerprint(mob)[1]:
+            hasher.update(f"{key}=".encode())
+            _update_fingerprint(hasher, mob.__dict__.get(key), memo)
+
+
+def _update_code_fingerprint(hasher, code, memo):
+    hasher.update(code.co_code)
+    hasher.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            _update_code_fingerprint(hasher, const, memo)
+        else:
+            _update_fingerprint(hasher, const, memo)
+
+
 def get_camera_dict_for_hashing(camera_object):
     """Remove some keys from `camera_object.__dict__` that are very heavy and useless for the caching functionality.
 
@@ -115,7 +337,15 @@ def get_camera_dict_for_hashing(camera_object):
     # We have to clean a little bit of camera_dict, as pixel_array and background are two very big numpy arrays.
     # They are not essential to caching process.
     # We also have to remove pixel_array_to_cairo_context as it contains used memory adress (set randomly). See l.516 get_cached_cairo_context in camera.py
-    for to_clean in ["background", "pixel_array", "pixel_array_to_cairo_context"]:
+    # The cache of extract_mobject_family_members depends on the previous calls.
+    for to_clean in [
+        "background",
+        "pixel_array",
+        "pixel_array_to_cairo_context",
+        "family_members_cache",
+        "previous_family_members_cache",
+        "family_members_cache_version",
+    ]:
         camera_object_dict.pop(to_clean, None)
     return camera_object_dict
 
@@ -139,16 +369,14 @@ def get_hash_from_play_call(camera_object, animations_list, current_mobjects_lis
     :class:`str` 
         A string concatenation of the respective hashes of `camera_object`, `animations_list` and `current_mobjects_list`, separated by `_`.
     """
-    camera_json = get_json(get_camera_dict_for_hashing(camera_object))
-    animations_list_json = [
-        get_json(x) for x in sorted(animations_list, key=lambda obj: str(obj))
-    ]
-    current_mobjects_list_json = [
-        get_json(x) for x in sorted(current_mobjects_list, key=lambda obj: str(obj))
-    ]
+    memo = {}
     hash_camera, hash_animations, hash_current_mobjects = [
-        zlib.crc32(repr(json_val).encode())
-        for json_val in [camera_json, animations_list_json, current_mobjects_list_json]
+        get_fingerprint(obj, memo).hex()
+        for obj in [
+            get_camera_dict_for_hashing(camera_object),
+            sorted(animations_list, key=lambda obj: str(obj)),
+            sorted(current_mobjects_list, key=lambda obj: str(obj)),
+        ]
     ]
     return "{}_{}_{}".format(hash_camera, hash_animations, hash_current_mobjects)
 
@@ -171,14 +399,15 @@ def get_hash_from_wait_call(
     :class:`str`
         A concatenation of the respective hashes of `animations_list and `current_mobjects_list`, separated by `_`.
     """
-    camera_json = get_json(get_camera_dict_for_hashing(camera_object))
-    current_mobjects_list_json = [
-        get_json(x) for x in sorted(current_mobjects_list, key=lambda obj: str(obj))
-    ]
-    hash_current_mobjects = zlib.crc32(repr(current_mobjects_list_json).encode())
-    hash_camera = zlib.crc32(repr(camera_json).encode())
+    memo = {}
+    hash_camera = get_fingerprint(
+        get_camera_dict_for_hashing(camera_object), memo
+    ).hex()
+    hash_current_mobjects = get_fingerprint(
+        sorted(current_mobjects_list, key=lambda obj: str(obj)), memo
+    ).hex()
     if stop_condition_function is not None:
-        hash_function = zlib.crc32(get_json(stop_condition_function).encode())
+        hash_function = get_fingerprint(stop_condition_function, memo).hex()
         return "{}_{}{}_{}".format(
             hash_camera,
             str(wait_time).replace(".", "-"),
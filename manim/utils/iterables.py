@@ -22,11 +22,25 @@ def list_update(l1, l2):
     Used instead of list(set(l1).update(l2)) to maintain order,
     making sure duplicates are removed from l1, not l2.
     """
-    return [e for e in l1 if e not in l2] + list(l2)
+    l2 = list(l2)
+    to_remove = as_set_if_hashable(l2)
+    return [e for e in l1 if e not in to_remove] + l2
 
 
 def list_difference_update(l1, l2):
-    return [e for e in l1 if e not in l2]
+    to_remove = as_set_if_hashable(l2)
+    return [e for e in l1 if e not in to_remove]
+
+
+def as_set_if_hashable(l):
+    """
+    Returns the elements of l as a set, for faster membership
+    tests, unless they aren't hashable.
+    """
+    try:
+        return set(l)
+    except TypeError:
+        return l
 
 
 def all_elements_are_instances(iterable, Class):
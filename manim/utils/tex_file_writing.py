@@ -1,10 +1,35 @@
 import os
+import re
 import hashlib
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .. import constants
 from ..config import file_writer_config, config
 from ..logger import logger
+from .file_ops import file_lock
+
+# Compilations running in the background, by tex file, see tex_to_svg_file_async
+tex_executor = None
+tex_futures = {}
+tex_futures_lock = threading.RLock()
+
+
+def reset_tex_executor():
+    """
+    Forgets about the compilations running in the background, whose
+    threads don't exist in forked processes.
+    """
+    global tex_executor, tex_futures_lock
+    tex_executor = None
+    tex_futures.clear()
+    tex_futures_lock = threading.RLock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reset_tex_executor)
 
 
 def tex_hash(expression):
@@ -18,21 +43,204 @@ def tex_hash(expression):
 def tex_to_svg_file(expression, source_type):
     tex_template = config["tex_template"]
     tex_file = generate_tex_file(expression, tex_template, source_type)
-    dvi_file = tex_to_dvi(tex_file, tex_template.use_ctex)
-    return dvi_to_svg(dvi_file, use_ctex=tex_template.use_ctex)
+    with tex_futures_lock:
+        future = tex_futures.get(tex_file)
+    if future is not None:
+        # Already being compiled by tex_to_svg_file_async
+        return future.result()
+    return compile_tex_file(tex_file, tex_template.use_ctex)
 
 
-def generate_tex_file(expression, tex_template, source_type):
+def tex_to_svg_file_async(expression, source_type):
+    """
+    Same as tex_to_svg_file, but compiles the expression in the background,
+    with at most one LaTeX or dvisvgm process per CPU. Requests for an
+    expression which is already being compiled share its future, and
+    tex_to_svg_file waits for it instead of compiling the expression again.
+
+    Parameters
+    ----------
+    expression : str
+        The expression to compile.
+    source_type : str
+        Either "tex" or "text", see tex_to_svg_file.
+
+    Returns
+    -------
+    :class:`concurrent.futures.Future`
+        The future path of the svg file of the expression.
+    """
+    global tex_executor
+    tex_template = config["tex_template"]
+    tex_file = generate_tex_file(expression, tex_template, source_type)
+    with tex_futures_lock:
+        future = tex_futures.get(tex_file)
+        if future is None:
+            if tex_executor is None:
+                tex_executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+            future = tex_executor.submit(
+                compile_tex_file, tex_file, tex_template.use_ctex
+            )
+            tex_futures[tex_file] = future
+            # Once done, the svg file is in the cache
+            future.add_done_callback(lambda _: forget_tex_future(tex_file))
+    return future
+
+
+def forget_tex_future(tex_file):
+    with tex_futures_lock:
+        tex_futures.pop(tex_file, None)
+
+
+def compile_tex_file(tex_file, use_ctex=False):
+    """
+    Compiles a tex file into an svg file, unless it already exists.
+    Processes compiling the same file wait for each other, and the svg
+    file only appears once complete, so concurrent manim processes can
+    share the cache.
+
+    Returns
+    -------
+    str
+        The path of the svg file.
+    """
+    svg_file = get_svg_file(tex_file)
+    if os.path.exists(svg_file):
+        # Possibly compiled by tex_to_svg_files, without its own dvi file
+        return svg_file
+    with file_lock(get_lock_file(tex_file)):
+        if os.path.exists(svg_file):
+            # Compiled by another process in the meantime
+            return svg_file
+        dvi_file = tex_to_dvi(tex_file, use_ctex)
+        return dvi_to_svg(dvi_file, use_ctex=use_ctex)
+
+
+def tex_to_svg_files(expressions, source_type):
+    """
+    Same as calling tex_to_svg_file on each expression, except that
+    the expressions which aren't cached yet are compiled at once, as
+    the pages of a single document, to start LaTeX and dvisvgm only once.
+    If that fails, they are compiled separately, in parallel.
+
+    Parameters
+    ----------
+    expressions : list of str
+        The expressions to compile.
+    source_type : str
+        Either "tex" or "text", see tex_to_svg_file.
+
+    Returns
+    -------
+    list of str
+        The paths of the svg files of the expressions.
+    """
+    tex_template = config["tex_template"]
+    pending = {}
+    for expression in expressions:
+        tex_file = generate_tex_file(expression, tex_template, source_type)
+        if not os.path.exists(get_svg_file(tex_file)):
+            pending[tex_file] = expression
+    if len(pending) > 1:
+        try:
+            batch_tex_file = generate_batch_tex_file(
+                list(pending.values()), tex_template, source_type
+            )
+            if batch_tex_file is not None:
+                with file_lock(get_lock_file(batch_tex_file)):
+                    dvi_file = tex_to_dvi(batch_tex_file, tex_template.use_ctex)
+                    svg_pages = dvi_to_svg_pages(dvi_file)
+                    if len(svg_pages) != len(pending):
+                        raise Exception(
+                            f"{len(svg_pages)} pages were generated from {dvi_file}"
+                            f" instead of {len(pending)}"
+                        )
+                    for tex_file, svg_page in zip(pending, svg_pages):
+                        shutil.move(svg_page, get_svg_file(tex_file))
+        except Exception as exception:
+            logger.debug(f"Compiling the expressions separately: {exception}")
+    futures = [
+        tex_to_svg_file_async(expression, source_type) for expression in expressions
+    ]
+    return [future.result() for future in futures]
+
+
+def get_tex_file_content(expression, tex_template, source_type):
     if source_type == "text":
-        output = tex_template.get_text_for_text_mode(expression)
+        return tex_template.get_text_for_text_mode(expression)
     elif source_type == "tex":
-        output = tex_template.get_text_for_tex_mode(expression)
+        return tex_template.get_text_for_tex_mode(expression)
+
+
+def get_svg_file(tex_file):
+    # Same path as given by tex_to_dvi and dvi_to_svg
+    return Path(tex_file.replace(".tex", ".svg")).as_posix()
+
+
+def get_lock_file(tex_file):
+    return Path(tex_file.replace(".tex", ".lock")).as_posix()
+
+
+def get_temporary_file(file_path):
+    # Unique to the thread, so that only complete files are seen by others
+    root, extension = os.path.splitext(file_path)
+    return f"{root}.{os.getpid()}.{threading.get_ident()}.tmp{extension}"
+
+
+def write_tex_file(file_path, content):
+    temporary_file = get_temporary_file(file_path)
+    with open(temporary_file, "w", encoding="utf-8") as outfile:
+        outfile.write(content)
+    os.replace(temporary_file, file_path)
+
+
+def generate_tex_file(expression, tex_template, source_type):
+    output = get_tex_file_content(expression, tex_template, source_type)
 
     result = os.path.join(file_writer_config["tex_dir"], tex_hash(output)) + ".tex"
     if not os.path.exists(result):
         logger.info('Writing "%s" to %s' % ("".join(expression), result))
-        with open(result, "w", encoding="utf-8") as outfile:
-            outfile.write(output)
+        write_tex_file(result, output)
+    return result
+
+
+def generate_batch_tex_file(expressions, tex_template, source_type):
+    """
+    Writes a tex file typesetting each expression on its own page, using
+    the multi-page mode of the standalone document class.
+
+    Returns
+    -------
+    str or None
+        The path of the tex file, or None if the template doesn't use the
+        standalone document class.
+    """
+    prefix, text_to_replace, suffix = tex_template.body.partition(
+        tex_template.text_to_replace
+    )
+    document_class = re.search(
+        r"\\documentclass(?:\[([^\]]*)\])?\{standalone\}", prefix
+    )
+    if not text_to_replace or document_class is None:
+        return None
+    pages = []
+    for expression in expressions:
+        # The text get_tex_file_content puts in place of text_to_replace
+        content = get_tex_file_content(expression, tex_template, source_type)
+        content = content[len(prefix) : len(content) - len(suffix)]
+        pages.append("\\begin{standalone}\n%s\n\\end{standalone}" % content)
+    options = [option for option in (document_class[1] or "").split(",") if option]
+    prefix = "{}\\documentclass[{}]{{standalone}}{}".format(
+        prefix[: document_class.start()],
+        ",".join(options + ["multi"]),
+        prefix[document_class.end() :],
+    )
+    output = prefix + "\n".join(pages) + suffix
+
+    result = os.path.join(file_writer_config["tex_dir"], tex_hash(output)) + ".tex"
+    if not os.path.exists(result):
+        logger.info(f"Writing {len(expressions)} expressions to {result}")
+        write_tex_file(result, output)
     return result
 
 
@@ -89,6 +297,7 @@ def dvi_to_svg(dvi_file, use_ctex=False, regen_if_exists=False):
     result = Path(result).as_posix()
     dvi_file = Path(dvi_file).as_posix()
     if not os.path.exists(result):
+        temporary_file = get_temporary_file(result)
         commands = [
             "dvisvgm",
             '"{}"'.format(dvi_file),
@@ -96,9 +305,45 @@ def dvi_to_svg(dvi_file, use_ctex=False, regen_if_exists=False):
             "-v",
             "0",
             "-o",
-            '"{}"'.format(result),
+            '"{}"'.format(temporary_file),
             ">",
             os.devnull,
         ]
         os.system(" ".join(commands))
+        if os.path.exists(temporary_file):
+            os.replace(temporary_file, result)
     return result
+
+
+def dvi_to_svg_pages(dvi_file):
+    """
+    Converts each page of a dvi (or xdv) file into its own svg file.
+
+    Returns
+    -------
+    list of str
+        The paths of the svg files, in the order of the pages.
+    """
+    dvi_file = Path(dvi_file).as_posix()
+    stem = os.path.splitext(dvi_file)[0]
+    commands = [
+        "dvisvgm",
+        '"{}"'.format(dvi_file),
+        "--page=1-",
+        "-n",
+        "-v",
+        "0",
+        "-o",
+        '"{}-%p.svg"'.format(stem),
+        ">",
+        os.devnull,
+    ]
+    os.system(" ".join(commands))
+    # dvisvgm pads the page numbers with zeros depending on the page count
+    page_pattern = re.compile(re.escape(os.path.basename(stem)) + r"-(\d+)\.svg")
+    pages = {}
+    for file_name in os.listdir(os.path.dirname(stem) or "."):
+        match = page_pattern.fullmatch(file_name)
+        if match:
+            pages[int(match[1])] = Path(os.path.dirname(stem), file_name).as_posix()
+    return [pages[number] for number in sorted(pages)]
@@ -0,0 +1,57 @@
+"""Compare the graphs of typical functions sampled with the default step size
+and with the "adaptive" one: their number of points, how long building them
+takes, their largest vertical distance to the function, and how long
+transforming each graph into the next one takes, for 60 frames.
+
+Usage: python scripts/benchmarks/benchmark_adaptive_sampling.py
+"""
+import timeit
+
+from manim import *
+
+FUNCTIONS = [
+    ("sin(x)", np.sin),
+    ("x^2 / 4", lambda x: x ** 2 / 4),
+    ("sin(5x)", lambda x: np.sin(5 * x)),
+    ("|x|", np.abs),
+    ("exp(-x^2)", lambda x: np.exp(-(x ** 2))),
+]
+
+
+def get_max_error(graph, function):
+    # The bezier curves are evaluated at several points each
+    curves = graph.points.reshape((-1, 4, 3))
+    s = np.linspace(0, 1, 9)
+    bernstein = np.array(
+        [(1 - s) ** 3, 3 * s * (1 - s) ** 2, 3 * s ** 2 * (1 - s), s ** 3]
+    )
+    points = np.einsum("ks,ckd->csd", bernstein, curves).reshape((-1, 3))
+    return np.abs(points[:, 1] - function(points[:, 0])).max()
+
+
+def main():
+    for step_size in [0.01, "adaptive"]:
+        print(f"step_size={step_size}")
+        graphs = []
+        for name, function in FUNCTIONS:
+            build = lambda: FunctionGraph(function, step_size=step_size)
+            graph = build()
+            graphs.append(graph)
+            duration = min(timeit.repeat(build, number=1, repeat=3))
+            print(
+                f"{name:>12}: {len(graph.points):6d} points, built in "
+                f"{duration * 1000:6.2f} ms, error {get_max_error(graph, function):.1e}"
+            )
+
+        def transform():
+            for graph, target in zip(graphs, graphs[1:]):
+                animation = Transform(graph.copy(), target)
+                animation.begin()
+                for alpha in np.linspace(0, 1, 60):
+                    animation.interpolate(alpha)
+
+        duration = min(timeit.repeat(transform, number=1, repeat=3))
+        print(f"{'transforms':>12}: {duration * 1000:6.2f} ms")
+
+if __name__ == "__main__":
+    main()
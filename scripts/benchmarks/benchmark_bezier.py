@@ -0,0 +1,131 @@
+"""Measure how many cubic curves per second are subdivided by the bezier kernels,
+by VMobject.insert_n_curves and by VMobject.pointwise_become_partial, compared
+with the former implementation, which subdivided the curves one at a time.
+
+Usage: python scripts/benchmarks/benchmark_bezier.py [number_of_curves]
+"""
+import sys
+import timeit
+
+from manim import *
+from manim.utils.bezier import bezier
+from manim.utils.bezier import partial_bezier_curves
+
+
+def old_partial_bezier_points(points, a, b):
+    """The implementation of partial_bezier_points before vectorization."""
+    if a == 1:
+        return [points[-1]] * len(points)
+
+    a_to_1 = np.array([bezier(points[i:])(a) for i in range(len(points))])
+    end_prop = (b - a) / (1.0 - a)
+    return np.array([bezier(a_to_1[: i + 1])(end_prop) for i in range(len(points))])
+
+
+class OldVMobject(VMobject):
+    """The implementation of the subdivisions of VMobject before vectorization."""
+
+    def insert_n_curves_to_point_list(self, n, points):
+        if len(points) == 1:
+            nppcc = self.n_points_per_cubic_curve
+            return np.repeat(points, nppcc * n, 0)
+        bezier_quads = self.get_cubic_bezier_tuples_from_points(points)
+        curr_num = len(bezier_quads)
+        target_num = curr_num + n
+        repeat_indices = (np.arange(target_num) * curr_num) // target_num
+        split_factors = [sum(repeat_indices == i) for i in range(curr_num)]
+        new_points = np.zeros((0, self.dim))
+        for quad, sf in zip(bezier_quads, split_factors):
+            alphas = np.linspace(0, 1, sf + 1)
+            for a1, a2 in zip(alphas, alphas[1:]):
+                new_points = np.append(
+                    new_points, old_partial_bezier_points(quad, a1, a2), axis=0
+                )
+        return new_points
+
+    def pointwise_become_partial(self, vmobject, a, b):
+        assert isinstance(vmobject, VMobject)
+        if a <= 0 and b >= 1:
+            self.set_points(vmobject.points)
+            return self
+        bezier_quads = vmobject.get_cubic_bezier_tuples()
+        num_cubics = len(bezier_quads)
+
+        lower_index, lower_residue = integer_interpolate(0, num_cubics, a)
+        upper_index, upper_residue = integer_interpolate(0, num_cubics, b)
+
+        self.clear_points()
+        if num_cubics == 0:
+            return self
+        if lower_index == upper_index:
+            self.append_points(
+                old_partial_bezier_points(
+                    bezier_quads[lower_index], lower_residue, upper_residue
+                )
+            )
+        else:
+            self.append_points(
+                old_partial_bezier_points(bezier_quads[lower_index], lower_residue, 1)
+            )
+            for quad in bezier_quads[lower_index + 1 : upper_index]:
+                self.append_points(quad)
+            self.append_points(
+                old_partial_bezier_points(bezier_quads[upper_index], 0, upper_residue)
+            )
+        return self
+
+
+def report(name, func, n_curves):
+    duration = min(timeit.repeat(func, number=1, repeat=3))
+    print(
+        f"{name:>32}: {duration * 1000:9.2f} ms, "
+        f"{n_curves / duration:12.0f} curves per second"
+    )
+
+
+def main(n_curves):
+    rng = np.random.RandomState(0)
+    curves = rng.uniform(-5, 5, (n_curves, 4, 3))
+    alphas = np.sort(rng.uniform(0, 1, (2, n_curves)), axis=0)
+
+    report(
+        "old partial_bezier_points",
+        lambda: [
+            old_partial_bezier_points(curve, a, b)
+            for curve, a, b in zip(curves, *alphas)
+        ],
+        n_curves,
+    )
+    report(
+        "partial_bezier_curves",
+        lambda: partial_bezier_curves(curves, *alphas),
+        n_curves,
+    )
+
+    # A path of n_curves / 2 curves, doubled like when aligning it with a
+    # path twice as long in a Transform
+    points = curves[: n_curves // 2].reshape((-1, 3))
+    for name, cls in [("old", OldVMobject), ("new", VMobject)]:
+        vmobject = cls()
+        report(
+            f"{name} insert_n_curves",
+            lambda: vmobject.insert_n_curves_to_point_list(n_curves // 2, points),
+            n_curves,
+        )
+
+    # Every frame of a Create animation of a path of n_curves curves
+    path = VMobject().set_points(curves.reshape((-1, 3)))
+    for name, cls in [("old", OldVMobject), ("new", VMobject)]:
+        vmobject = cls()
+        report(
+            f"{name} pointwise_become_partial x 60",
+            lambda: [
+                vmobject.pointwise_become_partial(path, 0, alpha)
+                for alpha in np.linspace(0, 1, 60)
+            ],
+            n_curves * 60,
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,71 @@
+"""Measure how long the layout queries of an updater on a large group take,
+like placing a label next to a formula and matching their widths, compared
+with the former implementation, which gathered all the points of the family of
+the group on each query.
+
+Usage: python scripts/benchmarks/benchmark_bounding_box.py [number_of_submobjects]
+"""
+import sys
+import timeit
+
+from manim import *
+
+
+class OldVGroup(VGroup):
+    """The implementation of the bounding box queries before caching."""
+
+    def get_critical_point(self, direction):
+        result = np.zeros(self.dim)
+        all_points = self.get_points_defining_boundary()
+        if len(all_points) == 0:
+            return result
+        for dim in range(self.dim):
+            result[dim] = self.get_extremum_along_dim(
+                all_points, dim=dim, key=direction[dim]
+            )
+        return result
+
+    def get_extremum_along_dim(self, points=None, dim=0, key=0):
+        if points is None:
+            points = self.get_points_defining_boundary()
+        values = points[:, dim]
+        if key < 0:
+            return np.min(values)
+        elif key == 0:
+            return (np.min(values) + np.max(values)) / 2
+        else:
+            return np.max(values)
+
+    def length_over_dim(self, dim):
+        return self.reduce_across_dimension(
+            np.max, np.max, dim
+        ) - self.reduce_across_dimension(np.min, np.min, dim)
+
+
+def main(n_submobjects):
+    dot = Dot()
+    for name, cls in [("old", OldVGroup), ("cached", VGroup)]:
+        # Groups of glyphs, like a Tex expression
+        formula = cls(
+            *[
+                VGroup(*[Circle(radius=0.05) for _ in range(5)]).arrange(RIGHT)
+                for _ in range(n_submobjects // 5)
+            ]
+        ).arrange_in_grid()
+        label = cls(*[Square(side_length=0.1) for _ in range(10)]).arrange(RIGHT)
+
+        def update():
+            # The queries of next_to, set_width, align_to...
+            label.next_to(formula, DOWN)
+            label.set_width(formula.get_width() / 2)
+            label.align_to(formula, LEFT)
+            formula.get_center()
+            formula.get_corner(UR)
+            formula.get_height()
+
+        duration = min(timeit.repeat(update, number=10, repeat=3)) / 10
+        print(f"{name:>8}: {duration * 1000:9.2f} ms per update")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
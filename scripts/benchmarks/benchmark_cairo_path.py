@@ -0,0 +1,58 @@
+"""Measure how many cubic curves per second Camera.set_cairo_context_path emits,
+compared with the former generator based implementation.
+
+Usage: python scripts/benchmarks/benchmark_cairo_path.py [number_of_curves]
+"""
+import sys
+import timeit
+
+from manim import *
+
+
+def set_cairo_context_path_with_generators(camera, ctx, vmobject):
+    """The implementation of Camera.set_cairo_context_path before vectorization."""
+    points = camera.transform_points_pre_display(vmobject, vmobject.points)
+    if len(points) == 0:
+        return
+    ctx.new_path()
+    subpaths = vmobject.gen_subpaths_from_points_2d(points)
+    for subpath in subpaths:
+        quads = vmobject.gen_cubic_bezier_tuples_from_points(subpath)
+        ctx.new_sub_path()
+        start = subpath[0]
+        ctx.move_to(*start[:2])
+        for p0, p1, p2, p3 in quads:
+            ctx.curve_to(*p1[:2], *p2[:2], *p3[:2])
+        if vmobject.consider_points_equals_2d(subpath[0], subpath[-1]):
+            ctx.close_path()
+
+
+def main(n_curves):
+    camera = Camera()
+    ctx = camera.get_cairo_context(camera.pixel_array)
+    # Many small closed subpaths, like the glyphs of a Tex mobject
+    vmobject = VMobject()
+    vmobject.append_points(
+        np.concatenate(
+            [
+                Circle(radius=0.05).shift(0.01 * i * RIGHT).points
+                for i in range(n_curves // 8)
+            ]
+        )
+    )
+    n_curves = vmobject.get_num_curves()
+    for name, func in [
+        ("generators", set_cairo_context_path_with_generators),
+        ("vectorized", Camera.set_cairo_context_path),
+    ]:
+        duration = min(
+            timeit.repeat(lambda: func(camera, ctx, vmobject), number=1, repeat=5)
+        )
+        print(
+            f"{name:>12}: {duration * 1000:9.2f} ms, "
+            f"{n_curves / duration:12.0f} curves per second"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 80000)
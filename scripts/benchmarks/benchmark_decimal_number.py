@@ -0,0 +1,79 @@
+"""Measure how many times per second DecimalNumber.set_value can update a number,
+compared with the former implementation, which built a SingleStringTexMobject
+for each character on every update.
+
+Usage: python scripts/benchmarks/benchmark_decimal_number.py [number_of_updates]
+"""
+import sys
+import timeit
+
+from manim import *
+
+
+class OldDecimalNumber(DecimalNumber):
+    """The implementation of DecimalNumber before the glyph cache."""
+
+    def __init__(self, number=0, **kwargs):
+        VMobject.__init__(self, **kwargs)
+        self.number = number
+        self.initial_config = kwargs
+        num_string = self.get_num_string(number)
+        self.add(*[SingleStringTexMobject(char, **kwargs) for char in num_string])
+        if self.show_ellipsis:
+            self.add(SingleStringTexMobject("\\dots"))
+        if num_string.startswith("-"):
+            minus = self.submobjects[0]
+            minus.next_to(self.submobjects[1], LEFT, buff=self.digit_to_digit_buff)
+        if self.unit is not None:
+            self.unit_sign = SingleStringTexMobject(self.unit, color=self.color)
+            self.add(self.unit_sign)
+        self.arrange(buff=self.digit_to_digit_buff, aligned_edge=DOWN)
+        for i, c in enumerate(num_string):
+            if c == "-" and len(num_string) > i + 1:
+                self[i].align_to(self[i + 1], UP)
+                self[i].shift(self[i + 1].get_height() * DOWN / 2)
+            elif c == ",":
+                self[i].shift(self[i].get_height() * DOWN / 2)
+        if self.unit and self.unit.startswith("^"):
+            self.unit_sign.align_to(self, UP)
+        if self.include_background_rectangle:
+            self.add_background_rectangle()
+
+    def set_value(self, number, **config):
+        full_config = dict(self.CONFIG)
+        full_config.update(self.initial_config)
+        full_config.update(config)
+        new_decimal = OldDecimalNumber(number, **full_config)
+        new_decimal.scale(self[-1].get_height() / new_decimal[-1].get_height())
+        new_decimal.move_to(self, self.edge_to_fix)
+        new_decimal.match_style(self)
+        old_family = self.get_family()
+        self.submobjects = new_decimal.submobjects
+        for mob in old_family:
+            mob.points[:] = 0
+            mob.increment_version()
+        self.number = number
+        return self
+
+
+def main(n_updates):
+    values = np.random.RandomState(0).uniform(-1e5, 1e5, n_updates)
+    for name, cls in [("old", OldDecimalNumber), ("glyph cache", DecimalNumber)]:
+        # The tex files get compiled by the first update
+        decimal = cls(0, num_decimal_places=3)
+        for digit in range(10):
+            decimal.set_value(-1111.111 * digit)
+
+        def update():
+            for value in values:
+                decimal.set_value(value)
+
+        duration = min(timeit.repeat(update, number=1, repeat=3))
+        print(
+            f"{name:>12}: {duration / n_updates * 1000:9.3f} ms per update, "
+            f"{n_updates / duration:9.0f} updates per second"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,77 @@
+"""Measure how long listing the family members of the mobjects of a scene
+takes, as done several times per frame by the scene and the camera, compared
+with the former implementation, which walked the submobjects of every mobject
+on every call.
+
+Usage: python scripts/benchmarks/benchmark_family.py [number_of_mobjects]
+"""
+import itertools as it
+import sys
+import timeit
+
+from manim import *
+from manim.utils.iterables import remove_list_redundancies
+
+
+def old_get_family(mobject):
+    """The implementation of Mobject.get_family before caching."""
+    sub_families = list(map(old_get_family, mobject.submobjects))
+    all_mobjects = [mobject] + list(it.chain(*sub_families))
+    return remove_list_redundancies(all_mobjects)
+
+
+def old_extract_mobject_family_members(mobjects, only_those_with_points=False):
+    """The implementation of Camera.extract_mobject_family_members before
+    caching."""
+    if only_those_with_points:
+        method = lambda m: [f for f in old_get_family(m) if f.get_num_points() > 0]
+    else:
+        method = old_get_family
+    return remove_list_redundancies(list(it.chain(*[method(m) for m in mobjects])))
+
+
+def old_list_difference_update(l1, l2):
+    return [e for e in l1 if e not in l2]
+
+
+class FamilyScene(Scene):
+    def construct(self):
+        pass
+
+
+def main(n_mobjects):
+    scene = FamilyScene()
+    # Groups of groups, like the glyphs of Tex expressions
+    groups = [
+        VGroup(*[VGroup(*[VMobject() for _ in range(5)]) for _ in range(10)])
+        for _ in range(n_mobjects // 60)
+    ]
+    scene.add(*groups)
+    excluded = groups[::10]
+
+    def old_frame():
+        old_extract_mobject_family_members(scene.mobjects)
+        mobjects = old_extract_mobject_family_members(
+            scene.mobjects, only_those_with_points=True
+        )
+        old_list_difference_update(
+            mobjects, old_extract_mobject_family_members(excluded)
+        )
+
+    def new_frame():
+        scene.get_mobject_family_members()
+        scene.camera.get_mobjects_to_display(
+            scene.mobjects, excluded_mobjects=excluded
+        )
+
+    n_members = len(scene.get_mobject_family_members())
+    for name, frame in [("old", old_frame), ("cached", new_frame)]:
+        duration = min(timeit.repeat(frame, number=10, repeat=3)) / 10
+        print(
+            f"{name:>8}: {duration * 1000:9.2f} ms per frame "
+            f"for {n_members} mobjects"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,51 @@
+"""Compare the fingerprint based play hashing with the former JSON based one.
+
+Usage: python scripts/benchmarks/benchmark_hashing.py [number_of_mobjects]
+"""
+import sys
+import timeit
+import zlib
+
+from manim import *
+from manim.utils.hashing import (
+    get_json,
+    get_camera_dict_for_hashing,
+    get_hash_from_play_call,
+)
+
+
+def get_json_hash_from_play_call(camera_object, animations_list, current_mobjects_list):
+    """The implementation of get_hash_from_play_call before fingerprinting."""
+    camera_json = get_json(get_camera_dict_for_hashing(camera_object))
+    animations_list_json = [
+        get_json(x) for x in sorted(animations_list, key=lambda obj: str(obj))
+    ]
+    current_mobjects_list_json = [
+        get_json(x) for x in sorted(current_mobjects_list, key=lambda obj: str(obj))
+    ]
+    hash_camera, hash_animations, hash_current_mobjects = [
+        zlib.crc32(repr(json_val).encode())
+        for json_val in [camera_json, animations_list_json, current_mobjects_list_json]
+    ]
+    return "{}_{}_{}".format(hash_camera, hash_animations, hash_current_mobjects)
+
+
+def main(n_mobjects):
+    camera = Camera()
+    mobjects = [
+        VGroup(*[Circle(radius=0.1).shift(i * RIGHT) for i in range(n_mobjects // 2)]),
+        VGroup(*[Square(side_length=0.1).shift(i * UP) for i in range(n_mobjects // 2)]),
+    ]
+    animations = [FadeIn(mobjects[0]), ApplyMethod(mobjects[1].shift, LEFT)]
+    for name, func in [
+        ("json", get_json_hash_from_play_call),
+        ("fingerprint", get_hash_from_play_call),
+    ]:
+        duration = min(
+            timeit.repeat(lambda: func(camera, animations, mobjects), number=1, repeat=5)
+        )
+        print(f"{name:>12}: {duration * 1000:9.2f} ms for {n_mobjects} mobjects")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,47 @@
+"""Compare the time spent writing partial movie files with ffmpeg pipes
+and with PyAV, on a scene made of many short animations.
+
+Usage: python scripts/benchmarks/benchmark_movie_encoding.py [number_of_plays]
+"""
+import sys
+import tempfile
+import time
+
+from manim import *
+
+
+class ManyShortPlays(Scene):
+    CONFIG = {"n_plays": 300}
+
+    def construct(self):
+        dot = Dot()
+        for i in range(self.n_plays):
+            self.play(ApplyMethod(dot.shift, 0.01 * RIGHT), run_time=1)
+
+
+def main(n_plays):
+    with tempfile.TemporaryDirectory() as media_dir:
+        file_writer_config.update(
+            {
+                "media_dir": media_dir,
+                "video_dir": os.path.join(media_dir, "videos"),
+                "disable_caching": True,
+                "write_to_movie": True,
+                "progress_bar": False,
+            }
+        )
+        config["pixel_height"] = 480
+        config["pixel_width"] = 854
+        config["frame_rate"] = 15
+        for use_pyav in [False, True]:
+            file_writer_config["use_pyav"] = use_pyav
+            start = time.time()
+            ManyShortPlays(n_plays=n_plays)
+            print(
+                f"{'pyav' if use_pyav else 'ffmpeg pipes':>12}: "
+                f"{time.time() - start:.2f}s for {n_plays} one-second plays"
+            )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 300)
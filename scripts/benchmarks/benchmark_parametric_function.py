@@ -0,0 +1,88 @@
+"""Measure how long plotting a function sampled at many points takes, with the
+function called once per sample or once for all of them, compared with the
+former implementation, which also appended the lines between the samples one
+at a time, which takes a time quadratic in the number of samples.
+
+Usage: python scripts/benchmarks/benchmark_parametric_function.py
+[number_of_samples]
+"""
+import sys
+import timeit
+
+from manim import *
+
+
+class OldParametricFunction(ParametricFunction):
+    """The implementation of ParametricFunction before vectorization."""
+
+    def generate_points(self):
+        t_min, t_max = self.t_min, self.t_max
+        dt = self.dt
+
+        discontinuities = filter(lambda t: t_min <= t <= t_max, self.discontinuities)
+        discontinuities = np.array(list(discontinuities))
+        boundary_times = [
+            self.t_min,
+            self.t_max,
+            *(discontinuities - dt),
+            *(discontinuities + dt),
+        ]
+        boundary_times.sort()
+        for t1, t2 in zip(boundary_times[0::2], boundary_times[1::2]):
+            t_range = list(np.arange(t1, t2, self.get_step_size(t1)))
+            if t_range[-1] != t2:
+                t_range.append(t2)
+            points = np.array([self.function(t) for t in t_range])
+            valid_indices = np.apply_along_axis(np.all, 1, np.isfinite(points))
+            points = points[valid_indices]
+            if len(points) > 0:
+                self.start_new_path(points[0])
+                for point in points[1:]:
+                    self.add_line_to(point)
+        self.make_smooth()
+        return self
+
+    def change_anchor_mode(self, mode):
+        nppcc = self.n_points_per_cubic_curve
+        for submob in self.family_members_with_points():
+            subpaths = submob.get_subpaths()
+            submob.clear_points()
+            for subpath in subpaths:
+                anchors = np.append(subpath[::nppcc], subpath[-1:], 0)
+                h1, h2 = get_smooth_handle_points(anchors)
+                new_subpath = np.array(subpath)
+                new_subpath[1::nppcc] = h1
+                new_subpath[2::nppcc] = h2
+                submob.append_points(new_subpath)
+        return self
+
+
+def function(t):
+    return np.array([np.cos(3 * t), np.sin(2 * t), 0])
+
+
+def vectorized_function(t):
+    return np.cos(3 * t), np.sin(2 * t), 0
+
+
+def main(n_samples):
+    # An open curve, as the former implementation solved a dense linear
+    # system of twice the number of samples for the handles of closed ones
+    config = {"t_min": 0, "t_max": PI, "step_size": PI / n_samples}
+    print(f"{n_samples} samples")
+    for name, func in [
+        ("old", lambda: OldParametricFunction(function, **config)),
+        ("scalar", lambda: ParametricFunction(function, **config)),
+        (
+            "vectorized",
+            lambda: ParametricFunction(
+                vectorized_function, use_vectorized=True, **config
+            ),
+        ),
+    ]:
+        duration = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:>12}: {duration * 1000:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
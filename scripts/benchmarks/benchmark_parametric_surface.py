@@ -0,0 +1,42 @@
+"""Measure how long creating a sphere and rendering a frame of it with the
+ThreeDCamera take, as a ParametricSurface, made of one ThreeDVMobject per face,
+and as a ParametricMeshSurface, whose faces are kept in numpy arrays.
+
+Usage: python scripts/benchmarks/benchmark_parametric_surface.py
+[resolution ...]
+"""
+import sys
+import timeit
+
+from manim import *
+
+
+def sphere_function(u, v):
+    return np.array([np.cos(v) * np.sin(u), np.sin(v) * np.sin(u), np.cos(u)])
+
+
+def main(resolutions):
+    camera = ThreeDCamera()
+    camera.set_phi(70 * DEGREES)
+    camera.set_theta(30 * DEGREES)
+    config = {"u_min": 0.001, "u_max": PI - 0.001, "v_min": 0, "v_max": TAU}
+    for resolution in resolutions:
+        print(f"resolution {resolution}: {resolution ** 2} faces")
+        for cls in [ParametricSurface, ParametricMeshSurface]:
+            create = lambda: cls(sphere_function, resolution=resolution, **config)
+            surface = create()
+
+            def render():
+                camera.reset()
+                camera.capture_mobjects([surface])
+
+            create_duration = min(timeit.repeat(create, number=1, repeat=3))
+            render_duration = min(timeit.repeat(render, number=1, repeat=3))
+            print(
+                f"{cls.__name__:>22}: created in {create_duration * 1000:8.2f} ms, "
+                f"rendered in {render_duration * 1000:8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [32, 100])
@@ -0,0 +1,152 @@
+"""Measure how long parsing a large svg file takes, like a map or a diagram made
+of many paths, compared with the former implementation, which read the file
+with minidom and appended the points of each path command one at a time,
+which takes a time quadratic in the length of the paths.
+
+Usage: python scripts/benchmarks/benchmark_svg_parsing.py [number_of_commands]
+[commands_per_path]
+"""
+import os
+import re
+import sys
+import tempfile
+import timeit
+from xml.dom import minidom
+from xml.etree import ElementTree
+
+from manim import *
+from manim.mobject.svg.svg_mobject import string_to_numbers
+from manim.mobject.svg.svg_mobject import VMobjectFromSVGPathstring
+
+
+class OldVMobjectFromSVGPathstring(VMobjectFromSVGPathstring):
+    """The implementation of VMobjectFromSVGPathstring before vectorization."""
+
+    def generate_points(self):
+        pattern = "[%s]" % ("".join(self.get_path_commands()))
+        pairs = list(
+            zip(
+                re.findall(pattern, self.path_string),
+                re.split(pattern, self.path_string)[1:],
+            )
+        )
+        for command, coord_string in pairs:
+            self.handle_command(command, coord_string)
+        self.rotate(np.pi, RIGHT, about_point=ORIGIN)
+
+    def handle_command(self, command, coord_string):
+        isLower = command.islower()
+        command = command.upper()
+        points = self.points
+        new_points = self.string_to_points(coord_string)
+        if isLower and len(points) > 0:
+            new_points += points[-1]
+        if command == "M":
+            self.start_new_path(new_points[0])
+            if len(new_points) <= 1:
+                return
+            new_points = new_points[1:]
+            for p in new_points:
+                if isLower:
+                    p[0] += self.points[-1, 0]
+                    p[1] += self.points[-1, 1]
+                self.add_line_to(p)
+            return
+        elif command in ["L", "H", "V"]:
+            if command == "H":
+                new_points[0, 1] = points[-1, 1]
+            elif command == "V":
+                if isLower:
+                    new_points[0, 0] -= points[-1, 0]
+                    new_points[0, 0] += points[-1, 1]
+                new_points[0, 1] = new_points[0, 0]
+                new_points[0, 0] = points[-1, 0]
+            self.add_line_to(new_points[0])
+            return
+        if command == "C":
+            pass
+        elif command in ["S", "T"]:
+            self.add_smooth_curve_to(*new_points)
+            return
+        elif command == "Q":
+            new_points = np.append([new_points[0]], new_points, axis=0)
+        elif command == "A":
+            raise Exception("Not implemented")
+        elif command == "Z":
+            return
+        self.add_cubic_bezier_curve_to(*new_points[0:3])
+        if len(new_points) > 3:
+            for i in range(3, len(new_points), 3):
+                if isLower:
+                    new_points[i : i + 3] -= points[-1]
+                    new_points[i : i + 3] += new_points[i - 1]
+                self.add_cubic_bezier_curve_to(*new_points[i : i + 3])
+
+    def string_to_points(self, coord_string):
+        numbers = string_to_numbers(coord_string)
+        if len(numbers) % 2 == 1:
+            numbers.append(0)
+        num_points = len(numbers) // 2
+        result = np.zeros((num_points, self.dim))
+        result[:, :2] = np.array(numbers).reshape((num_points, 2))
+        return result
+
+
+def get_path_strings(n_commands, commands_per_path):
+    # Closed outlines mixing lines and curves, with absolute coordinates,
+    # which the former implementation handled
+    rng = np.random.RandomState(0)
+    path_strings = []
+    for start in range(0, n_commands, commands_per_path):
+        n = min(commands_per_path, n_commands - start) - 2
+        coords = rng.uniform(0, 1000, (n, 6)).round(3)
+        commands = [
+            "C{} {} {} {} {} {}".format(*row)
+            if i % 3 == 0
+            else "L{} {}".format(*row[:2])
+            if i % 3 == 1
+            else "H{}".format(row[0])
+            for i, row in enumerate(coords)
+        ]
+        path_strings.append("M{} {}".format(*coords[0, :2]) + "".join(commands) + "Z")
+    return path_strings
+
+
+def write_svg_file(path_strings, file_name):
+    with open(file_name, "w") as svg_file:
+        svg_file.write('<svg xmlns="http://www.w3.org/2000/svg"><g>\n')
+        for path_string in path_strings:
+            svg_file.write('<path d="{}"/>\n'.format(path_string))
+        svg_file.write("</g></svg>\n")
+
+
+def main(n_commands, commands_per_path):
+    path_strings = get_path_strings(n_commands, commands_per_path)
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, "map.svg")
+        write_svg_file(path_strings, file_name)
+        print(f"{n_commands} commands in {len(path_strings)} paths")
+        for name, func in [
+            ("minidom", lambda: minidom.parse(file_name).unlink()),
+            ("ElementTree", lambda: ElementTree.parse(file_name)),
+            (
+                "old paths",
+                lambda: [OldVMobjectFromSVGPathstring(s) for s in path_strings],
+            ),
+            (
+                "new paths",
+                lambda: [VMobjectFromSVGPathstring(s) for s in path_strings],
+            ),
+        ]:
+            duration = min(timeit.repeat(func, number=1, repeat=3))
+            print(
+                f"{name:>12}: {duration * 1000:9.2f} ms, "
+                f"{n_commands / duration:12.0f} commands per second"
+            )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 100000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 100,
+    )
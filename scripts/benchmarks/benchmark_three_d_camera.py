@@ -0,0 +1,104 @@
+"""Measure how long the ThreeDCamera takes to sort the faces of surfaces by depth
+and to shade them on each frame while it rotates around them, compared with the
+former implementation, which computed a depth key and both shaded corners of
+each face separately in python, on every frame.
+
+Usage: python scripts/benchmarks/benchmark_three_d_camera.py [number_of_frames]
+[resolution]
+"""
+import sys
+import timeit
+
+from manim import *
+from manim.mobject.three_d_utils import get_3d_vmob_end_corner
+from manim.mobject.three_d_utils import get_3d_vmob_end_corner_unit_normal
+from manim.mobject.three_d_utils import get_3d_vmob_start_corner
+from manim.mobject.three_d_utils import get_3d_vmob_start_corner_unit_normal
+from manim.utils.color import get_shaded_rgb
+
+
+class OldThreeDCamera(ThreeDCamera):
+    """The implementation of ThreeDCamera before vectorized sorting and shading."""
+
+    def modified_rgbas(self, vmobject, rgbas):
+        if not self.should_apply_shading:
+            return rgbas
+        if vmobject.shade_in_3d and (vmobject.get_num_points() > 0):
+            light_source_point = self.light_source.points[0]
+            if len(rgbas) < 2:
+                shaded_rgbas = rgbas.repeat(2, axis=0)
+            else:
+                shaded_rgbas = np.array(rgbas[:2])
+            shaded_rgbas[0, :3] = get_shaded_rgb(
+                shaded_rgbas[0, :3],
+                get_3d_vmob_start_corner(vmobject),
+                get_3d_vmob_start_corner_unit_normal(vmobject),
+                light_source_point,
+            )
+            shaded_rgbas[1, :3] = get_shaded_rgb(
+                shaded_rgbas[1, :3],
+                get_3d_vmob_end_corner(vmobject),
+                get_3d_vmob_end_corner_unit_normal(vmobject),
+                light_source_point,
+            )
+            return shaded_rgbas
+        return rgbas
+
+    def get_mobjects_to_display(self, *args, **kwargs):
+        mobjects = Camera.get_mobjects_to_display(self, *args, **kwargs)
+        rot_matrix = self.get_rotation_matrix()
+
+        def z_key(mob):
+            if not (hasattr(mob, "shade_in_3d") and mob.shade_in_3d):
+                return np.inf
+            return np.dot(mob.get_z_index_reference_point(), rot_matrix.T)[2]
+
+        return sorted(mobjects, key=z_key)
+
+
+def main(n_frames, resolution):
+    surfaces = [
+        Sphere(resolution=(resolution, 2 * resolution)),
+        Sphere(resolution=(resolution, 2 * resolution)).shift(2 * OUT),
+    ]
+    n_faces = sum(len(surface.get_family()) - 1 for surface in surfaces)
+    print(f"{n_faces} faces, {n_frames} frames")
+    results = {}
+    for name, cls in [("old", OldThreeDCamera), ("vectorized", ThreeDCamera)]:
+        camera = cls(phi=70 * DEGREES)
+
+        def display_frames():
+            # What the camera computes before drawing each face
+            frames = []
+            for theta in np.linspace(0, TAU, n_frames):
+                camera.set_theta(theta)
+                camera.reset_rotation_matrix()
+                mobjects = camera.get_mobjects_to_display(surfaces)
+                frames.append(
+                    [
+                        (camera.get_fill_rgbas(mob), camera.get_stroke_rgbas(mob))
+                        for mob in mobjects
+                    ]
+                )
+            return frames
+
+        duration = min(timeit.repeat(display_frames, number=1, repeat=3))
+        results[name] = display_frames()
+        print(
+            f"{name:>12}: {duration / n_frames * 1000:9.2f} ms per frame, "
+            f"{n_frames / duration:9.1f} frames per second"
+        )
+    error = max(
+        np.abs(old_rgbas - new_rgbas).max()
+        for old_frame, new_frame in zip(results["old"], results["vectorized"])
+        for old_face, new_face in zip(old_frame, new_frame)
+        for old_rgbas, new_rgbas in zip(old_face, new_face)
+    )
+    print(f"largest difference between the colors: {error:.2e}")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 30,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 24,
+    )
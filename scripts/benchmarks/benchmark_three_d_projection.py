@@ -0,0 +1,56 @@
+"""Measure how long the ThreeDCamera takes to project the points of many small
+mobjects on each frame, while it rotates around them and while it stays still,
+compared with the former implementation, which projected the points of each
+mobject separately while displaying it.
+
+Usage: python scripts/benchmarks/benchmark_three_d_projection.py [number_of_frames]
+[resolution]
+"""
+import sys
+import timeit
+
+from manim import *
+
+
+class OldThreeDCamera(ThreeDCamera):
+    """The implementation of ThreeDCamera before batched projections."""
+
+    def project_mobjects(self, mobjects):
+        pass
+
+    def transform_points_pre_display(self, mobject, points):
+        points = Camera.transform_points_pre_display(self, mobject, points)
+        if mobject in self.fixed_in_frame_mobjects:
+            return points
+        if mobject in self.fixed_orientation_mobjects:
+            center = self.fixed_orientation_mobjects[mobject]()
+            return points + (self.project_point(center) - center)
+        return self.project_points(points)
+
+
+def main(n_frames, resolution):
+    surface = Sphere(resolution=(resolution, 2 * resolution))
+    print(f"{len(surface) * n_frames} projections, {n_frames} frames")
+    for name, cls in [("old", OldThreeDCamera), ("batched", ThreeDCamera)]:
+        camera = cls(phi=70 * DEGREES)
+        for moving in True, False:
+
+            def project_frames():
+                for theta in np.linspace(0, TAU if moving else 0, n_frames):
+                    camera.set_theta(theta)
+                    camera.reset_rotation_matrix()
+                    for mobject in camera.get_mobjects_to_display([surface]):
+                        camera.transform_points_pre_display(mobject, mobject.points)
+
+            duration = min(timeit.repeat(project_frames, number=1, repeat=3))
+            print(
+                f"{name:>8} ({'moving' if moving else 'still'} camera): "
+                f"{duration / n_frames * 1000:9.2f} ms per frame"
+            )
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 30,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 24,
+    )
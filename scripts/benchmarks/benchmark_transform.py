@@ -0,0 +1,120 @@
+"""Measure how long starting a Transform between two mobjects of thousands of
+curves takes, like two large Tex expressions, compared with the former
+implementation of VMobject.align_points, which appended the points of each
+subpath to the result one at a time and counted how many pieces each curve is
+split into with one pass over all the curves per curve.
+
+Usage: python scripts/benchmarks/benchmark_transform.py [number_of_curves]
+"""
+import sys
+import timeit
+
+from manim import *
+from manim.utils.bezier import partial_bezier_curves
+
+
+class OldVMobject(VMobject):
+    """The implementation of VMobject.align_points before the planner."""
+
+    def align_points(self, vmobject):
+        self.align_rgbas(vmobject)
+        if self.get_num_points() == vmobject.get_num_points():
+            return
+
+        for mob in self, vmobject:
+            if mob.has_no_points():
+                mob.start_new_path(mob.get_center())
+            if mob.has_new_path_started():
+                mob.add_line_to(mob.get_last_point())
+
+        subpaths1 = self.get_subpaths()
+        subpaths2 = vmobject.get_subpaths()
+        n_subpaths = max(len(subpaths1), len(subpaths2))
+        new_path1 = np.zeros((0, self.dim))
+        new_path2 = np.zeros((0, self.dim))
+
+        nppcc = self.n_points_per_cubic_curve
+
+        def get_nth_subpath(path_list, n):
+            if n >= len(path_list):
+                return [path_list[-1][-1]] * nppcc
+            return path_list[n]
+
+        for n in range(n_subpaths):
+            sp1 = get_nth_subpath(subpaths1, n)
+            sp2 = get_nth_subpath(subpaths2, n)
+            diff1 = max(0, (len(sp2) - len(sp1)) // nppcc)
+            diff2 = max(0, (len(sp1) - len(sp2)) // nppcc)
+            sp1 = self.insert_n_curves_to_point_list(diff1, sp1)
+            sp2 = self.insert_n_curves_to_point_list(diff2, sp2)
+            new_path1 = np.append(new_path1, sp1, axis=0)
+            new_path2 = np.append(new_path2, sp2, axis=0)
+        self.set_points(new_path1)
+        vmobject.set_points(new_path2)
+        return self
+
+    def insert_n_curves_to_point_list(self, n, points):
+        if len(points) == 1:
+            nppcc = self.n_points_per_cubic_curve
+            return np.repeat(points, nppcc * n, 0)
+        bezier_quads = self.get_cubic_bezier_tuples_from_points(points)
+        curr_num = len(bezier_quads)
+        target_num = curr_num + n
+        repeat_indices = (np.arange(target_num) * curr_num) // target_num
+        split_factors = [sum(repeat_indices == i) for i in range(curr_num)]
+        if curr_num == 0:
+            return np.zeros((0, self.dim))
+        split_factors = np.array(split_factors)
+        piece_indices = np.arange(target_num) - np.repeat(
+            np.cumsum(split_factors) - split_factors, split_factors
+        )
+        n_pieces = split_factors[repeat_indices]
+        new_quads = partial_bezier_curves(
+            bezier_quads[repeat_indices],
+            piece_indices / n_pieces,
+            (piece_indices + 1) / n_pieces,
+        )
+        return new_quads.reshape((-1, self.dim))
+
+
+def get_path(cls, n_curves, curves_per_subpath, seed):
+    # Closed subpaths of random curves, like the outlines of glyphs
+    rng = np.random.RandomState(seed)
+    points = []
+    for start in range(0, n_curves, curves_per_subpath):
+        n = min(curves_per_subpath, n_curves - start)
+        anchors = rng.uniform(-5, 5, (n, 3))
+        anchors[:, 2] = 0
+        handles = rng.uniform(-5, 5, (n, 2, 3))
+        handles[:, :, 2] = 0
+        curves = np.stack(
+            [anchors, handles[:, 0], handles[:, 1], np.roll(anchors, -1, axis=0)],
+            axis=1,
+        )
+        points.append(curves.reshape((-1, 3)))
+    path = cls()
+    path.set_points(np.concatenate(points))
+    return path
+
+
+def main(n_curves):
+    for name, cls in [("old", OldVMobject), ("planner", VMobject)]:
+        # A long outline matched with a longer one, then subpaths of
+        # different lengths on each side, some matched with null paths
+        source = get_path(cls, 4 * n_curves // 5, 4 * n_curves // 5, 0)
+        source.append_points(get_path(cls, n_curves // 5, 8, 1).points)
+        target = get_path(cls, n_curves, n_curves, 2)
+        target.append_points(get_path(cls, n_curves // 10, 12, 3).points)
+
+        def begin():
+            Transform(source.copy(), target.copy()).begin()
+
+        duration = min(timeit.repeat(begin, number=1, repeat=3))
+        print(
+            f"{name:>8}: {duration * 1000:9.2f} ms to start a Transform "
+            f"between {source.get_num_curves()} and {target.get_num_curves()} curves"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,26 @@
+import numpy as np
+
+from manim.utils.bezier import bezier
+from manim.utils.bezier import get_smooth_handle_points
+from manim.utils.bezier import partial_bezier_curves
+
+
+def test_partial_bezier_curves():
+    curves = np.random.RandomState(0).uniform(-5, 5, (10, 4, 3))
+    a = np.linspace(0, 0.9, 10)
+    b = np.linspace(0.1, 1, 10)
+    partials = partial_bezier_curves(curves, a, b)
+    for curve, partial, start, end in zip(curves, partials, a, b):
+        for t in np.linspace(0, 1, 5):
+            np.testing.assert_allclose(
+                bezier(partial)(t), bezier(curve)(start + t * (end - start))
+            )
+
+
+def test_smooth_handle_points_of_closed_curve():
+    anchors = np.random.RandomState(0).uniform(-5, 5, (20, 3))
+    anchors[-1] = anchors[0]
+    h1, h2 = get_smooth_handle_points(anchors)
+    # The derivative is continuous at each anchor, including the first one
+    np.testing.assert_allclose(h1[1:] - anchors[1:-1], anchors[1:-1] - h2[:-1])
+    np.testing.assert_allclose(h1[0] - anchors[0], anchors[-1] - h2[-1])
@@ -0,0 +1,64 @@
+import numpy as np
+from PIL import Image
+
+from manim import Camera, ThreeDCamera
+from manim import Cube, Square, VGroup, OUT, PI
+
+
+def test_overlay_rgba_array_matches_pil():
+    camera = Camera()
+    rng = np.random.RandomState(0)
+    pixel_array = rng.randint(0, 256, (60, 80, 4)).astype(np.uint8)
+    new_array = rng.randint(0, 256, (25, 30, 4)).astype(np.uint8)
+    new_array[:5, :, 3] = 0
+    new_array[-5:, :, 3] = 255
+    for ul_coords in [(0, 0), (20, 10), (-10, -5), (70, 50)]:
+        x, y = ul_coords
+        image = Image.new("RGBA", (80, 60))
+        image.paste(Image.fromarray(new_array, "RGBA"), box=(x, y, x + 30, y + 25))
+        expected = np.array(
+            Image.alpha_composite(Image.fromarray(pixel_array, "RGBA"), image)
+        )
+        result = pixel_array.copy()
+        camera.overlay_rgba_array(result, new_array, ul_coords)
+        np.testing.assert_array_equal(result, expected)
+
+
+def test_projected_points_follow_the_camera_and_the_mobjects():
+    camera = ThreeDCamera()
+    square, cube = Square(), Cube()
+    group = VGroup(square, cube)
+
+    def assert_projected(mobjects):
+        for mobject in mobjects:
+            np.testing.assert_allclose(
+                camera.transform_points_pre_display(mobject, mobject.points),
+                camera.project_points(mobject.points),
+            )
+
+    camera.get_mobjects_to_display([group])
+    family = [m for m in group.get_family() if len(m.points) > 0]
+    assert set(camera.projected_points) == set(family)
+    assert_projected(family)
+    camera.set_phi(PI / 3)
+    camera.set_theta(PI / 4)
+    # As done by capture_mobjects
+    camera.reset_rotation_matrix()
+    camera.get_mobjects_to_display([group])
+    assert_projected(family)
+    group.shift(OUT)
+    camera.get_mobjects_to_display([group])
+    assert_projected(family)
+    # Without projecting the mobjects again
+    square.shift(OUT)
+    assert_projected(family)
+
+    camera.add_fixed_in_frame_mobjects(square)
+    np.testing.assert_array_equal(
+        camera.transform_points_pre_display(square, square.points), square.points
+    )
+    camera.get_mobjects_to_display([group])
+    assert square not in camera.projected_points
+    np.testing.assert_array_equal(
+        camera.transform_points_pre_display(square, square.points), square.points
+    )
@@ -1,5 +1,6 @@
 import subprocess
 import os
+import sys
 from shutil import rmtree
 import pytest
 
@@ -70,6 +71,62 @@ def test_WriteStuff(python_version):
     rmtree(path_output)
 
 
+def test_write_all_in_parallel(python_version):
+    """Render every scene of a file with two worker processes."""
+    path_basic_scene = os.path.join("tests", "tests_data", "basic_scenes.py")
+    path_output = os.path.join("tests_cache", "media_temp")
+    command = [
+        python_version,
+        "-m",
+        "manim",
+        path_basic_scene,
+        "-a",
+        "-j",
+        "2",
+        "-l",
+        "--media_dir",
+        path_output,
+    ]
+    out, err, exitcode = capture(command)
+    assert exitcode == 0, err
+    for scene_name in ["SquareToCircle", "WriteStuff"]:
+        assert os.path.exists(
+            os.path.join(
+                path_output, "videos", "basic_scenes", "480p15", f"{scene_name}.mp4"
+            )
+        ), err
+    rmtree(path_output)
+
+
+@pytest.mark.skipif(
+    sys.platform.startswith("win32"), reason="Segment jobs require fork"
+)
+def test_segment_jobs(python_version):
+    """Render the partial movie files of SquareToCircle with two worker processes."""
+    path_basic_scene = os.path.join("tests", "tests_data", "basic_scenes.py")
+    path_output = os.path.join("tests_cache", "media_temp")
+    command = [
+        python_version,
+        "-m",
+        "manim",
+        path_basic_scene,
+        "SquareToCircle",
+        "--segment_jobs",
+        "2",
+        "-l",
+        "--media_dir",
+        path_output,
+    ]
+    out, err, exitcode = capture(command)
+    assert exitcode == 0, err
+    assert os.path.exists(
+        os.path.join(
+            path_output, "videos", "basic_scenes", "480p15", "SquareToCircle.mp4"
+        )
+    ), err
+    rmtree(path_output)
+
+
 def test_dash_as_name(python_version):
     """Simulate using - as a filename. Intended to test the feature that allows end users to type manim code on the spot."""
     path_output = os.path.join("tests_cache", "media_temp")
@@ -0,0 +1,54 @@
+import random
+
+from manim import BraceLabel, Circle, Square, Text, VGroup, RIGHT
+
+
+def walk_family(mobject):
+    # The family of the mobject, without going through any cache
+    family = [mobject]
+    for submob in mobject.submobjects:
+        family.extend(m for m in walk_family(submob) if m not in family)
+    return family
+
+
+def test_family_follows_in_place_mutations():
+    random.seed(0)
+    group = VGroup(*[Square().shift(i * RIGHT) for i in range(10)])
+    outer = VGroup(group, Circle())
+    assert outer.get_family() == walk_family(outer)
+    group.shuffle()
+    assert outer.get_family() == walk_family(outer)
+    assert group.get_family()[1:] == group.submobjects
+    group.sort()
+    assert outer.get_family() == walk_family(outer)
+    assert group.get_family()[1:] == group.submobjects
+    group.submobjects.reverse()
+    group.increment_structure_version()
+    assert outer.get_family() == walk_family(outer)
+
+
+def test_family_is_kept_while_other_mobjects_change():
+    group = VGroup(Square(), Circle())
+    descendants = group.get_descendants()
+    other = VGroup(Square())
+    other.add(Circle())
+    other.copy()
+    # Not walked again
+    assert group.get_descendants() is descendants
+    group.add(Square())
+    assert group.get_family() == walk_family(group)
+
+
+def test_family_follows_brace_label_changes():
+    label = BraceLabel(
+        Square(), "label", label_constructor=lambda *text, **kwargs: Circle()
+    )
+    assert label.get_family() == walk_family(label)
+    label.change_label("other label")
+    assert label.get_family() == walk_family(label)
+    assert label.label in label.get_family()
+
+
+def test_family_follows_text_space_insertion():
+    text = Text("  a b  ")
+    assert text.get_family() == walk_family(text)
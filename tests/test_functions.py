@@ -0,0 +1,53 @@
+import numpy as np
+
+from manim import FunctionGraph
+from manim.mobject.functions import fit_bezier_curves
+from manim.mobject.functions import get_derivatives
+from manim.utils.bezier import bezier
+
+
+def test_bezier_curves_fit_quadratics_exactly():
+    t = np.sort(np.random.RandomState(0).uniform(-2, 2, 10))
+    points = np.stack([t, t ** 2 - t, 2 * t], axis=1)
+    np.testing.assert_allclose(
+        get_derivatives(t, points),
+        np.stack([np.ones_like(t), 2 * t - 1, 2 * np.ones_like(t)], axis=1),
+    )
+    curves = fit_bezier_curves(t, points)
+    for curve, t0, t1 in zip(curves, t[:-1], t[1:]):
+        for s in np.linspace(0, 1, 5):
+            x = t0 + s * (t1 - t0)
+            np.testing.assert_allclose(bezier(curve)(s), [x, x ** 2 - x, 2 * x])
+
+
+def test_adaptive_graph_is_within_error_tolerance():
+    tolerance = 1e-4
+    graph = FunctionGraph(
+        lambda x: np.sin(x ** 2 / 4),
+        use_vectorized=True,
+        step_size="adaptive",
+        error_tolerance=tolerance,
+    )
+    curves = graph.points.reshape((-1, 4, 3))
+    # Where the tolerance is measured, as x goes along each curve at a
+    # constant speed
+    for s in [0.25, 0.5, 0.75]:
+        points = np.array([bezier(curve)(s) for curve in curves])
+        deviations = np.abs(points[:, 1] - np.sin(points[:, 0] ** 2 / 4))
+        assert deviations.max() <= tolerance
+    # Far fewer samples where the function is flat
+    anchors = curves[:, 0, 0]
+    assert np.sum(np.abs(anchors) < 1) < np.sum(np.abs(anchors) > 6)
+
+
+def test_adaptive_graph_is_broken_where_function_is_not_finite():
+    graph = FunctionGraph(
+        lambda x: np.where(np.abs(x) < 1, np.nan, x ** 2),
+        use_vectorized=True,
+        step_size="adaptive",
+    )
+    assert np.isfinite(graph.points).all()
+    assert len(graph.get_subpaths()) == 2
+    x = np.abs(graph.points[:, 0])
+    assert x.min() >= 1
+    assert x.min() < 1.01
@@ -0,0 +1,52 @@
+import numpy as np
+
+from manim import Square, Circle, ValueTracker, VGroup, RIGHT
+from manim.utils.hashing import get_fingerprint
+
+
+def test_fingerprint_depends_on_content_only():
+    a, b = Square(), Square()
+    assert get_fingerprint(a) == get_fingerprint(b)
+    b.shift(RIGHT)
+    assert get_fingerprint(a) != get_fingerprint(b)
+    assert get_fingerprint(Square()) != get_fingerprint(Circle())
+
+
+def test_fingerprint_of_arrays_and_cycles():
+    array = np.arange(12, dtype=float).reshape(3, 4)
+    assert get_fingerprint(array.T) == get_fingerprint(array.T.copy())
+    assert get_fingerprint(array) != get_fingerprint(array.astype(np.float32))
+    square = Square()
+    square.itself = square
+    assert get_fingerprint(square) == get_fingerprint(square)
+
+
+def test_fingerprint_follows_mobject_versions():
+    square = Square()
+    version = square.get_version()
+    digest = get_fingerprint(square)
+    assert get_fingerprint(square) == digest
+    square.set_fill(opacity=0.5)
+    assert square.get_version() != version
+    assert get_fingerprint(square) != digest
+    tracker = ValueTracker(0)
+    digest = get_fingerprint(tracker)
+    tracker.set_value(1)
+    assert get_fingerprint(tracker) != digest
+
+
+def test_fingerprint_of_unchanged_family_is_cached():
+    squares = VGroup(Square(), Square())
+    digest = get_fingerprint(squares)
+    # Not followed by increment_version, so not seen by the cache
+    squares[1].points[0] += RIGHT
+    assert get_fingerprint(squares) == digest
+    squares[1].increment_version()
+    digest = get_fingerprint(squares)
+    assert get_fingerprint(squares[1]) != get_fingerprint(squares[0])
+    squares[0].shift(RIGHT)
+    assert get_fingerprint(squares) != digest
+    digest = get_fingerprint(squares)
+    squares.submobjects.reverse()
+    squares.increment_structure_version()
+    assert get_fingerprint(squares) != digest
@@ -0,0 +1,82 @@
+import numpy as np
+
+from manim import Camera, ThreeDCamera
+from manim import MeshMobject, ParametricMeshSurface, ParametricSurface
+from manim import WHITE
+
+
+def test_parametric_mesh_surface_matches_parametric_surface():
+    func = lambda u, v: np.array([u, v, u * v ** 2])
+    config = dict(u_min=-1, u_max=2, v_min=0, v_max=3, resolution=(3, 4))
+    surface = ParametricSurface(func, **config)
+    mesh = ParametricMeshSurface(func, **config)
+    assert mesh.get_num_faces() == len(surface)
+    for face, vertices, rgba in zip(
+        surface, mesh.get_face_vertices(), mesh.get_fill_rgbas()
+    ):
+        np.testing.assert_allclose(vertices, face.points[::4])
+        np.testing.assert_allclose(rgba, face.get_fill_rgbas()[0])
+
+
+def test_align_meshes_with_different_faces():
+    square = MeshMobject(
+        [[-1, -1, 0], [1, -1, 0], [1, 1, 0], [-1, 1, 0]], [[0, 1, 2, 3]]
+    )
+    triangles = MeshMobject(
+        [[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]], [[0, 1, 2], [1, 3, 2]]
+    )
+    original_square = square.get_face_vertices()
+    original_triangles = triangles.get_face_vertices()
+    square.align_points(triangles)
+    for mesh in square, triangles:
+        assert mesh.faces.shape == (2, 4)
+        assert len(mesh.points) == 8
+        assert len(mesh.get_fill_rgbas()) == 2
+    np.testing.assert_array_equal(square.faces, triangles.faces)
+    # Faces are repeated, and so is the last vertex of faces with fewer
+    np.testing.assert_array_equal(
+        square.get_face_vertices(), np.repeat(original_square, 2, axis=0)
+    )
+    np.testing.assert_array_equal(
+        triangles.get_face_vertices(),
+        np.append(original_triangles, original_triangles[:, -1:], axis=1),
+    )
+
+
+def test_separate_faces_keeps_faces_and_colors():
+    mesh = MeshMobject(
+        [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [2, 1, 0]],
+        [[0, 1, 2, 3], [1, 4, 5, 2]],
+    )
+    mesh.set_fill_by_face([[1, 0, 0], [0, 0, 1]])
+    vertices = mesh.get_face_vertices()
+    rgbas = mesh.get_fill_rgbas().copy()
+    mesh.separate_faces(5, 4)
+    np.testing.assert_array_equal(mesh.faces, np.arange(20).reshape((5, 4)))
+    indices = [0, 0, 0, 1, 1]
+    np.testing.assert_array_equal(mesh.get_face_vertices(), vertices[indices])
+    np.testing.assert_array_equal(mesh.get_fill_rgbas(), rgbas[indices])
+
+
+def test_faces_which_are_not_finite_are_not_displayed():
+    mesh = MeshMobject(
+        [[-1, -1, 0], [1, -1, 0], [1, 1, 0], [-1, 1, 0], [np.nan, 0, 0]],
+        [[0, 1, 2, 3], [1, 4, 2, 2]],
+        color=WHITE,
+        stroke_width=0,
+    )
+    for camera in Camera(), ThreeDCamera():
+        camera.capture_mobjects([mesh])
+        height, width = camera.pixel_array.shape[:2]
+        assert camera.pixel_array[height // 2, width // 2, :3].sum() > 0
+
+
+def test_bounding_box_of_mesh_ignores_faces_which_are_not_finite():
+    vertices = [[-1, -1, 0], [1, -1, 0], [1, 1, 0], [-1, 1, 0], [np.nan, 0, 0]]
+    mesh = MeshMobject(vertices, [[0, 1, 2, 3], [1, 4, 2, 2]])
+    finite_mesh = MeshMobject(vertices[:4], [[0, 1, 2, 3]])
+    for camera in Camera(), ThreeDCamera():
+        box = camera.get_pixel_bounding_box([mesh])
+        np.testing.assert_array_equal(box, camera.get_pixel_bounding_box([finite_mesh]))
+        x_min, y_min, x_max, y_max = box
+        assert x_min < x_max and y_min < y_max
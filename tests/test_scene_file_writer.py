@@ -0,0 +1,81 @@
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from manim import Camera, file_writer_config
+from manim.scene.scene_file_writer import SceneFileWriter
+
+
+def get_scene(name):
+    # The only attributes of the scene used by the file writer
+    camera = Camera(pixel_width=64, pixel_height=48, frame_rate=15)
+    return SimpleNamespace(camera=camera, play_hashes_list=[name], num_plays=0)
+
+
+def get_frames(n_frames, height=48, width=64):
+    frames = []
+    for value in np.linspace(0, 255, n_frames).astype(np.uint8):
+        frame = np.full((height, width, 4), value, dtype=np.uint8)
+        frame[:, :, 3] = 255
+        frames.append(frame)
+    return frames
+
+
+def test_partial_movie_encoded_with_pyav(tmp_path, monkeypatch):
+    av = pytest.importorskip("av")
+    for key, value in {
+        "write_to_movie": True,
+        "use_pyav": True,
+        "video_dir": str(tmp_path),
+        "output_file": "PyAVTest",
+        "movie_file_extension": ".mp4",
+        "frame_queue_size": 2,
+        "segment_jobs": 1,
+    }.items():
+        monkeypatch.setitem(file_writer_config, key, value)
+    writer = SceneFileWriter(get_scene("pyav"))
+    frames = get_frames(6)
+    writer.begin_animation(allow_write=True)
+    assert writer.movie_container is not None
+    for frame in frames:
+        writer.write_frame(frame)
+    writer.end_animation(allow_write=True)
+    with av.open(writer.partial_movie_file_path) as container:
+        decoded = [f.to_ndarray(format="rgb24") for f in container.decode(video=0)]
+    assert len(decoded) == len(frames)
+    for frame, decoded_frame in zip(frames, decoded):
+        assert decoded_frame.shape == frame.shape[:2] + (3,)
+        # yuv420p is lossy
+        assert abs(decoded_frame.mean() - frame[:, :, 0].mean()) < 4
+
+
+def test_frame_buffers_stay_bounded_when_frames_are_resized(tmp_path, monkeypatch):
+    for key, value in {
+        "write_to_movie": True,
+        "video_dir": str(tmp_path),
+        "output_file": "FrameQueueTest",
+        "save_pngs": False,
+        "frame_queue_size": 3,
+        "segment_jobs": 1,
+    }.items():
+        monkeypatch.setitem(file_writer_config, key, value)
+    writer = SceneFileWriter(get_scene("frame_queue"))
+    encoded = []
+
+    def encode_frame(frame):
+        # Slower than the frames are written, so that the queue fills up
+        time.sleep(0.005)
+        encoded.append(frame.copy())
+
+    writer.encode_frame = encode_frame
+    frames = get_frames(8) + get_frames(8, 24, 32) + get_frames(8)
+    writer.start_frame_writer()
+    for frame in frames:
+        writer.write_frame(frame)
+        assert len(writer.frame_buffers) <= 3
+    writer.stop_frame_writer()
+    assert len(encoded) == len(frames)
+    for frame, encoded_frame in zip(frames, encoded):
+        np.testing.assert_array_equal(encoded_frame, frame)
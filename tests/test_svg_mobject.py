@@ -0,0 +1,26 @@
+import numpy as np
+
+from manim import VMobjectFromSVGPathstring
+from manim.utils.bezier import bezier
+
+
+def test_relative_path_commands_match_absolute_ones():
+    absolute = VMobjectFromSVGPathstring(
+        "M1 1L3 1 3 4H0V2C1 1 2 1 3 2S5 3 6 2Q7 0 8 2T10 2A2 1 30 0 1 12 2Z"
+    )
+    relative = VMobjectFromSVGPathstring(
+        "m1 1l2 0 0 3h-3v-2c1-1 2-1 3 0s2 1 3 0q1-2 2 0t2 0a2 1 30 012 0z"
+    )
+    np.testing.assert_allclose(relative.points, absolute.points, atol=1e-12)
+
+
+def test_arc_path_command():
+    # Half of the circle of radius 1 centered at (1, 0), above the x axis once
+    # the y axis of svg files is flipped
+    path = VMobjectFromSVGPathstring("M0 0A1 1 0 0 1 2 0")
+    for curve in path.get_cubic_bezier_tuples():
+        for t in np.linspace(0, 1, 5):
+            x, y, _ = bezier(curve)(t)
+            assert abs(np.hypot(x - 1, y) - 1) < 1e-3
+            assert y >= 0
+    np.testing.assert_allclose(path.get_end()[:2], [2, 0], atol=1e-12)
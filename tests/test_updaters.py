@@ -1,4 +1,5 @@
 from manim import *
+import pytest
 from testing_utils import utils_test_scenes, get_scenes_to_test
 
 
@@ -23,3 +24,55 @@ class ValueTrackerTest(Scene):
 
 def test_scenes():
     utils_test_scenes(get_scenes_to_test(__name__), "updaters")
+
+
+def get_mobjects_logging_updates(log, hooks):
+    a, b, c, d = [Mobject(name=name) for name in "abcd"]
+    group = Group(c, d)
+    mobjects = {"a": a, "b": b, "c": c, "d": d, "g": group}
+    for name, mobject in mobjects.items():
+
+        def updater(mobject, dt, name=name):
+            log.append(name)
+            if name in hooks:
+                hooks.pop(name)(mobjects, log)
+
+        mobject.add_updater(updater, call_updater=False)
+    return [a, group, b]
+
+
+@pytest.mark.parametrize(
+    "get_hooks",
+    [
+        lambda: {},
+        lambda: {"a": lambda mobs, log: mobs["b"].suspend_updating()},
+        lambda: {"a": lambda mobs, log: mobs["c"].suspend_updating()},
+        lambda: {"c": lambda mobs, log: mobs["d"].suspend_updating()},
+        lambda: {"c": lambda mobs, log: mobs["g"].remove(mobs["d"])},
+        lambda: {
+            "g": lambda mobs, log: mobs["d"].add_updater(
+                lambda mob: log.append("d2"), call_updater=False
+            )
+        },
+    ],
+)
+def test_update_mobjects_calls_updaters_like_mobject_update(monkeypatch, get_hooks):
+    for key, value in {
+        "skip_animations": True,
+        "write_to_movie": False,
+        "disable_caching": True,
+        "save_last_frame": False,
+        "save_pngs": False,
+    }.items():
+        monkeypatch.setitem(file_writer_config, key, value)
+    expected = []
+    mobjects = get_mobjects_logging_updates(expected, get_hooks())
+    for _ in range(2):
+        for mobject in mobjects:
+            mobject.update(0.1)
+    log = []
+    scene = Scene()
+    scene.add(*get_mobjects_logging_updates(log, get_hooks()))
+    for _ in range(2):
+        scene.update_mobjects(0.1)
+    assert log == expected